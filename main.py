@@ -1,5 +1,10 @@
+import time
+_STARTED = time.perf_counter()  # 시작 시간 측정 기준 (다른 모듈 import 전)
+
 import os
 import sys
+import importlib
+import multiprocessing
 import tkinter as tk
 from tkinter import messagebox
 
@@ -16,16 +21,21 @@ from src.config import Config
 from managers.data_manager import DataManager
 from managers.popup_manager import PopupManager
 from src.styles import COLORS, FONT_FAMILY, FONTS
+from utils.file_watcher import FileWatcher
+from utils.startup_timer import StartupTimer
 
-# [변경] UI Views Import 경로 수정 (ui.views 패키지)
-from ui.views.calendar_view import CalendarView
-from ui.views.client_view import ClientView
-from ui.views.dashboard import DashboardView
-from ui.views.gantt_view import GanttView
-from ui.views.kanban_view import KanbanView
-from ui.views.sales_view import SalesView
-from ui.views.table_view import TableView
-from ui.views.purchase_view import PurchaseView
+# 뷰는 처음 열 때 import/생성 (matplotlib 등 무거운 모듈을 시작 시 불러오지 않음)
+# 메뉴 키 -> (모듈, 클래스)
+VIEW_CLASSES = {
+    "dashboard": ("ui.views.dashboard", "DashboardView"),
+    "client": ("ui.views.client_view", "ClientView"),
+    "sales_management": ("ui.views.sales_view", "SalesView"),
+    "purchase_management": ("ui.views.purchase_view", "PurchaseView"),
+    "schedule_table": ("ui.views.table_view", "TableView"),
+    "schedule_calendar": ("ui.views.calendar_view", "CalendarView"),
+    "schedule_kanban": ("ui.views.kanban_view", "KanbanView"),
+    "schedule_gantt": ("ui.views.gantt_view", "GanttView"),
+}
 
 # DnD 라이브러리 가용성 체크 및 래퍼 클래스 설정
 if DND_AVAILABLE:
@@ -39,11 +49,14 @@ else:
 
 class SalesManagerApp(BaseApp):
     def __init__(self):
+        self.startup = StartupTimer(_STARTED)
+        self.startup.mark("import")
         super().__init__()
 
         # 1. 매니저 초기화 (데이터, 팝업)
         self.dm = DataManager()
         self.pm = PopupManager(self, self.dm, self.refresh_ui)
+        self.startup.mark("매니저")
 
         # 2. 윈도우 기본 설정
         self.title(f"Sales Manager - v{Config.APP_VERSION}")
@@ -60,38 +73,78 @@ class SalesManagerApp(BaseApp):
 
         self.current_view = None
         self.nav_buttons = {}
+        self.views = {}  # 생성된 뷰 (메뉴 키 -> 인스턴스)
 
         # 3. UI 구성
         self.create_sidebar()
         self.create_content_area()
+        self.startup.mark("창 구성")
         
         # 4. 초기 데이터 로드
         success, msg = self.dm.load_data()
         if not success:
             print(f"초기 로드 경고: {msg}") # 콘솔 로그로 대체 (UX 위해 팝업 생략 가능)
+        self.startup.mark("데이터 로드")
             
         # 초기 화면: 대시보드
         self.show_dashboard()
+        self.startup.mark("대시보드")
         
         # 5. 자동 새로고침 시작 (동시성 제어 보조)
-        self.start_auto_refresh_loop()
+        self.start_auto_refresh()
+        self._poll_background_tasks()
+        self.after_idle(self._report_startup)
+
+    def _report_startup(self):
+        """첫 화면이 그려진 뒤 시작 단계별 소요 시간을 콘솔에 출력합니다."""
+        self.startup.mark("첫 화면")
+        print(self.startup.report())
 
-    def start_auto_refresh_loop(self):
+    def start_auto_refresh(self):
         """
-        주기적으로 외부 파일 변경 사항을 체크하여 UI를 갱신합니다.
+        데이터 파일(판매/구매/생산 요청)의 외부 변경을 감시하여 UI를 갱신합니다.
         (2인 동시 사용 시 데이터 최신화 유지)
+        파일 읽기는 감시 스레드에서 수행하고, UI 스레드는 읽기가 끝난 결과만 반영합니다.
         """
-        try:
-            if self.dm.check_for_external_changes():
-                success, _ = self.dm.load_data()
-                if success:
-                    self.refresh_ui()
-                    # 필요하다면 하단 상태바 등에 "데이터 갱신됨" 표시 가능
-        except Exception as e:
-            print(f"Auto Refresh Error: {e}")
-        
-        # 5초마다 체크 (서버 부하 고려하여 조절 가능)
-        self.after(5000, self.start_auto_refresh_loop)
+        self.file_watcher = FileWatcher(self.dm.get_watch_paths, self._on_files_changed)
+        self.file_watcher.start()
+
+    def _on_files_changed(self, paths):
+        """감시 스레드에서 호출됨: 읽기는 데이터 작업 스레드, 반영은 UI 스레드에서 수행합니다."""
+        self.dm.reload_external_changes_async(callback=self._on_auto_reloaded)
+
+    def _on_auto_reloaded(self, result):
+        success, _ = result
+        if success:
+            self.refresh_ui()
+            # 필요하다면 하단 상태바 등에 "데이터 갱신됨" 표시 가능
+
+    def _poll_background_tasks(self):
+        """백그라운드 작업의 완료 콜백을 UI 스레드에서 실행합니다."""
+        self.dm.worker.process_callbacks()
+        self.after(100, self._poll_background_tasks)
+
+    def _on_busy_changed(self, busy):
+        self._busy = busy
+        self._update_status_label()
+
+    def _on_journal_status(self, message):
+        self._journal_status = message
+        self._update_status_label()
+
+    def _on_journal_rejected(self, rejected):
+        lines = [f"- {entry.get('time', '')} {entry['op']}: {entry['error']}" for entry in rejected[:10]]
+        if len(rejected) > 10: lines.append(f"... 외 {len(rejected) - 10}건")
+        messagebox.showwarning(
+            "저장 실패 작업",
+            f"다른 사용자의 변경과 충돌하여 반영되지 않은 작업이 {len(rejected)}건 있습니다.\n\n"
+            + "\n".join(lines)
+            + f"\n\n작업 내용은 다음 파일에 보관되었습니다.\n{self.dm.journal_handler.rejects_path}")
+
+    def _update_status_label(self):
+        # 저장 재시도 안내가 있으면 작업중 표시보다 우선
+        text = self._journal_status or ("⏳ 저장/로드 중..." if self._busy else "")
+        self.busy_label.configure(text=text)
 
     def create_sidebar(self):
         self.sidebar_frame = ctk.CTkFrame(self, width=240, corner_radius=0, fg_color=COLORS["bg_dark"])
@@ -109,6 +162,14 @@ class SalesManagerApp(BaseApp):
         self.logo_label.bind("<Enter>", lambda e: self.logo_label.configure(cursor="hand2"))
         self.logo_label.bind("<Leave>", lambda e: self.logo_label.configure(cursor=""))
 
+        # 백그라운드 작업 표시
+        self.busy_label = ctk.CTkLabel(self.sidebar_frame, text="", font=FONTS["sub"], text_color=COLORS["warning"])
+        self.busy_label.pack(padx=20, anchor="w")
+        self._busy, self._journal_status = False, ""
+        self.dm.worker.add_busy_listener(self._on_busy_changed)
+        self.dm.journal_handler.add_status_listener(self._on_journal_status)
+        self.dm.journal_handler.add_reject_listener(self._on_journal_rejected)
+
         # (Label Text, Command, Unique Key)
         menu_groups = [
             ("통합관리", [
@@ -159,19 +220,22 @@ class SalesManagerApp(BaseApp):
     def create_content_area(self):
         self.content_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.content_frame.grid(row=0, column=1, sticky="nsew")
-        
-        # 뷰 인스턴스 생성 (PopupManager 전달)
-        self.view_dashboard = DashboardView(self.content_frame, self.dm, self.pm)
-        self.view_client = ClientView(self.content_frame, self.dm, self.pm)
-        self.view_sales = SalesView(self.content_frame, self.dm, self.pm)
-        self.view_purchase = PurchaseView(self.content_frame, self.dm, self.pm)
-        self.view_calendar = CalendarView(self.content_frame, self.dm, self.pm)
-        self.view_kanban = KanbanView(self.content_frame, self.dm, self.pm)
-        self.view_gantt = GanttView(self.content_frame, self.dm, self.pm)
-        self.view_table = TableView(self.content_frame, self.dm, self.pm)
-        
 
-    def switch_view(self, view_name_key, view_instance):
+    def get_view(self, key):
+        """key의 뷰를 반환합니다. 처음 요청될 때 모듈을 import하여 생성합니다."""
+        view = self.views.get(key)
+        if view is None:
+            module_name, class_name = VIEW_CLASSES[key]
+            view_class = getattr(importlib.import_module(module_name), class_name)
+            # 생성자에서 refresh_data까지 수행됨 (PopupManager 전달)
+            view = self.views[key] = view_class(self.content_frame, self.dm, self.pm)
+        return view
+
+    def switch_view(self, view_name_key):
+        key = view_name_key or "dashboard"
+        created = key not in self.views
+        view_instance = self.get_view(key)
+
         # 버튼 활성화 상태 변경
         for key, btn in self.nav_buttons.items():
             if key == view_name_key:
@@ -187,34 +251,36 @@ class SalesManagerApp(BaseApp):
         view_instance.pack(fill="both", expand=True)
         self.current_view = view_instance
         
-        # 데이터 갱신 (뷰에 refresh_data 메서드가 있다면)
-        if hasattr(view_instance, "refresh_data"):
+        # 데이터 갱신 (뷰에 refresh_data 메서드가 있다면, 방금 생성된 뷰는 생성자에서 갱신됨)
+        if not created and hasattr(view_instance, "refresh_data"):
             view_instance.refresh_data()
 
-    def show_dashboard(self): self.switch_view(None, self.view_dashboard)
+    def show_dashboard(self): self.switch_view(None)
     
     # 통합관리
-    def show_client_view(self): self.switch_view("client", self.view_client)
+    def show_client_view(self): self.switch_view("client")
     
     # 판매관리
-    def show_sales_view(self): self.switch_view("sales_management", self.view_sales)
+    def show_sales_view(self): self.switch_view("sales_management")
 
     # 구매관리
-    def show_purchase_view(self): self.switch_view("purchase_management", self.view_purchase)
+    def show_purchase_view(self): self.switch_view("purchase_management")
 
     # 일정 관리
-    def show_table_view(self): self.switch_view("schedule_table", self.view_table)
-    def show_calendar_view(self): self.switch_view("schedule_calendar", self.view_calendar)
-    def show_kanban_view(self): self.switch_view("schedule_kanban", self.view_kanban)
-    def show_gantt_view(self): self.switch_view("schedule_gantt", self.view_gantt)
+    def show_table_view(self): self.switch_view("schedule_table")
+    def show_calendar_view(self): self.switch_view("schedule_calendar")
+    def show_kanban_view(self): self.switch_view("schedule_kanban")
+    def show_gantt_view(self): self.switch_view("schedule_gantt")
 
     def reload_all_data(self):
-        success, msg = self.dm.load_data()
-        if success:
-            messagebox.showinfo("완료", "데이터를 새로고침했습니다.")
-            self.refresh_ui()
-        else:
-            messagebox.showerror("오류", msg)
+        def on_loaded(result):
+            success, msg = result
+            if success:
+                messagebox.showinfo("완료", "데이터를 새로고침했습니다.")
+                self.refresh_ui()
+            else:
+                messagebox.showerror("오류", msg)
+        self.dm.load_data_async(callback=on_loaded)
 
     def refresh_ui(self):
         """현재 활성화된 뷰와 테마를 갱신합니다."""
@@ -229,9 +295,33 @@ class SalesManagerApp(BaseApp):
             self.current_view.refresh_data()
 
     def on_closing(self):
+        # 모아둔 작업을 저장하고 결과를 확인 (대기 중에도 메모리 반영/실패 작업 안내 콜백은 처리)
+        future = self.dm.run_async(self.dm.flush_journal)
+        while not future.done():
+            self.dm.worker.process_callbacks()
+            time.sleep(0.05)
+        self.dm.worker.process_callbacks()
+        try:
+            success, msg = future.result()
+        except Exception as e:
+            success, msg = False, str(e)
+        if not success:
+            count = self.dm.journal_handler.pending_count
+            if not messagebox.askyesno(
+                    "저장 실패",
+                    f"파일에 저장하지 못한 변경사항이 {count}건 있습니다.\n{msg}\n\n"
+                    "그래도 종료하시겠습니까? (다음 실행 시 다시 저장을 시도합니다)",
+                    icon="warning"):
+                return
+        if hasattr(self, "file_watcher"):
+            self.file_watcher.stop()
+        self.dm.worker.shutdown(wait=True)
+        self.dm.loader.shutdown()
         self.quit()
         self.destroy()
 
 if __name__ == "__main__":
+    # 패키징(exe) 환경에서 엑셀 파싱 작업 프로세스 실행 지원
+    multiprocessing.freeze_support()
     app = SalesManagerApp()
     app.mainloop()
\ No newline at end of file
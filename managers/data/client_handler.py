@@ -5,28 +5,22 @@ class ClientHandler:
         self.dm = data_manager
 
     def get_client_shipping_method(self, client_name):
-        if self.dm.df_clients.empty:
-            return ""
-            
-        row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
-        if not row.empty:
-            val = row.iloc[0].get("운송방법", "")
+        row = self.dm.index_handler.first_row("clients", client_name)
+        if row is not None:
+            val = row.get("운송방법", "")
             return str(val).strip() if str(val).lower() != "nan" else ""
         return ""
 
     def get_client_shipping_account(self, client_name):
-        if self.dm.df_clients.empty:
-            return ""
-            
-        row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
-        if not row.empty:
-            val = row.iloc[0].get("운송계정", "")
+        row = self.dm.index_handler.first_row("clients", client_name)
+        if row is not None:
+            val = row.get("운송계정", "")
             return str(val).strip() if str(val).lower() != "nan" else ""
         return ""
 
     def add_client(self, client_data: dict) -> tuple[bool, str]:
         def update(dfs):
-            if client_data.get("업체명") in dfs["clients"]["업체명"].values:
+            if self.dm.index_handler.contains("clients", client_data.get("업체명"), dfs["clients"]):
                 return False, "이미 존재하는 업체명입니다."
             
             new_df = pd.DataFrame([client_data])
@@ -38,12 +32,14 @@ class ClientHandler:
 
     def update_client(self, original_name, client_data: dict) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["clients"]["업체명"] == original_name
-            if not mask.any(): return False, "업체를 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("clients", original_name, dfs["clients"])
+            if labels.empty: return False, "업체를 찾을 수 없습니다."
             
-            idx = dfs["clients"][mask].index[0]
+            idx = labels[0]
             for k, v in client_data.items():
                 dfs["clients"].at[idx, k] = v
+            # 업체명 변경 시 같은 트랜잭션의 이후 조회가 옛 위치를 쓰지 않도록
+            self.dm.index_handler.columns_changed("clients", dfs["clients"], client_data)
                 
             self.dm.log_handler.add_log_to_dfs(dfs, "업체 수정", f"업체명: {original_name}")
             return True, ""
@@ -51,10 +47,10 @@ class ClientHandler:
 
     def delete_client(self, client_name) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["clients"]["업체명"] == client_name
-            if not mask.any(): return False, "업체를 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("clients", client_name, dfs["clients"])
+            if labels.empty: return False, "업체를 찾을 수 없습니다."
             
-            dfs["clients"] = dfs["clients"][~mask]
+            dfs["clients"] = dfs["clients"].drop(index=labels)
             self.dm.log_handler.add_log_to_dfs(dfs, "업체 삭제", f"업체명: {client_name}")
             return True, ""
         return self.dm.execute_transaction(update)
@@ -4,31 +4,17 @@ import pandas as pd
 import openpyxl
 from datetime import datetime
 
+from managers.data.production_reader import ProductionReader
+from managers.data import schema
+
+
 class DeliveryHandler:
     def __init__(self, data_manager):
         self.dm = data_manager
-
-    def _generate_sequential_id(self, df, id_col, prefix):
-        today = datetime.now().strftime("%y%m%d")
-        prefix_date = f"{prefix}-{today}-"
-        
-        max_seq = 0
-        if not df.empty and id_col in df.columns:
-            def extract_seq(val):
-                s = str(val)
-                if s.startswith(prefix_date):
-                    try: return int(s.split("-")[-1])
-                    except: return 0
-                return 0
-            
-            seqs = df[id_col].apply(extract_seq)
-            if not seqs.empty: max_seq = seqs.max()
-        
-        next_seq = max_seq + 1
-        return f"{prefix_date}{next_seq:03d}"
+        self.production_reader = ProductionReader(data_manager)
 
     def get_next_delivery_id(self):
-        return self._generate_sequential_id(self.dm.df_delivery, "출고번호", "CX")
+        return self.dm.id_allocator.next_id("CX")
 
     def add_delivery(self, delivery_data: dict) -> tuple[bool, str]:
         def update(dfs):
@@ -56,7 +42,7 @@ class DeliveryHandler:
                 if idx not in dfs["data"].index: continue
                 
                 row_data = dfs["data"].loc[idx]
-                db_qty = float(str(row_data["수량"]).replace(",", "") or 0)
+                db_qty = schema.to_float(row_data["수량"])
                 deliver_qty = min(req["deliver_qty"], db_qty)
                 
                 new_delivery_records.append({
@@ -73,15 +59,15 @@ class DeliveryHandler:
                 # 데이터 업데이트 (완전 출고 vs 부분 출고) 
                 is_full = abs(deliver_qty - db_qty) < 0.000001
                 
-                price = float(str(row_data.get("단가", 0)).replace(",", "") or 0)
-                tax_rate = float(str(row_data.get("세율(%)", 0)).replace(",", "") or 0) / 100
+                price = schema.to_float(row_data.get("단가", 0))
+                tax_rate = schema.to_float(row_data.get("세율(%)", 0)) / 100
 
                 if is_full:
                     dfs["data"].at[idx, "Delivery Status"] = "완료"
                     dfs["data"].at[idx, "출고일"] = delivery_date
                     dfs["data"].at[idx, "송장번호"] = invoice_no
                     dfs["data"].at[idx, "운송방법"] = shipping_method
-                    dfs["data"].at[idx, "미수금액"] = float(str(row_data.get("합계금액", 0)).replace(",", ""))
+                    dfs["data"].at[idx, "미수금액"] = schema.to_float(row_data.get("합계금액", 0))
                 else:
                     remain_qty = db_qty - deliver_qty
                     supply = remain_qty * price
@@ -129,7 +115,7 @@ class DeliveryHandler:
                     affected_mgmt_nos.add(mgmt_no)
             
             for mgmt_no in affected_mgmt_nos:
-                current_rows = dfs["data"][dfs["data"]["관리번호"] == mgmt_no]
+                current_rows = self.dm.index_handler.rows("data", mgmt_no, dfs["data"])
                 if not current_rows.empty:
                     all_paid = (current_rows["Payment Status"] == "완료").all()
                     all_delivered = (current_rows["Delivery Status"] == "완료").all()
@@ -158,14 +144,13 @@ class DeliveryHandler:
             added_count = 0
             updated_count = 0
 
+            # 시트를 한 번만 훑어 (관리번호, 모델명, Description) -> 행 번호 인덱스 생성
+            row_index = self._build_production_index(ws)
+            client_notes = self._get_client_notes({row_data.get("업체명", "") for row_data in rows_data})
+
             for row_data in rows_data:
                 client_name = row_data.get("업체명", "")
-                client_note = "-"
-                if not self.dm.df_clients.empty:
-                    c_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
-                    if not c_row.empty:
-                        val = c_row.iloc[0].get("특이사항", "-")
-                        if str(val) != "nan" and val: client_note = str(val)
+                client_note = client_notes.get(client_name, "-")
 
                 mgmt_no = str(row_data.get("관리번호", ""))
                 model_name = str(row_data.get("모델명", ""))
@@ -192,26 +177,21 @@ class DeliveryHandler:
                     "-"                         # P
                 ]
 
-                target_row_idx = None
-                for i, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-                    curr_mgmt = str(row[0]) if row[0] else ""
-                    curr_model = str(row[2]) if row[2] else ""
-                    curr_desc = str(row[3]) if row[3] else ""
-                    
-                    if curr_mgmt == mgmt_no and curr_model == model_name and curr_desc == desc:
-                        target_row_idx = i
-                        break
-                
+                key = (mgmt_no, model_name, desc)
+                target_row_idx = row_index.get(key)
                 if target_row_idx:
                     for col_idx, val in enumerate(mapping_values, start=1):
                         ws.cell(row=target_row_idx, column=col_idx, value=val)
                     updated_count += 1
                 else:
                     ws.append(mapping_values)
+                    # 같은 항목이 다시 나오면 방금 추가한 행을 업데이트
+                    row_index[key] = ws.max_row
                     added_count += 1
 
             wb.save(prod_path)
             wb.close()
+            self.dm.source_timestamps["production"] = self.dm.file_handler.get_mtime(prod_path)
             return True, f"신규: {added_count}건, 업데이트: {updated_count}건"
 
         except PermissionError:
@@ -219,97 +199,68 @@ class DeliveryHandler:
         except Exception as e:
             return False, f"생산 요청 내보내기 실패: {e}"
 
-    def sync_production_dates(self):
-        if not os.path.exists(self.dm.production_request_path):
-            return
+    @staticmethod
+    def _build_production_index(ws):
+        """생산 요청 Data 시트의 (관리번호, 모델명, Description) -> 첫 번째 행 번호"""
+        row_index = {}
+        for i, row in enumerate(ws.iter_rows(min_row=2, max_col=4, values_only=True), start=2):
+            row = tuple(row) + (None,) * (4 - len(row))
+            key = tuple(str(row[col]) if row[col] else "" for col in (0, 2, 3))
+            row_index.setdefault(key, i)
+        return row_index
+
+    def _get_client_notes(self, client_names):
+        """업체명 -> 특이사항 (없으면 "-")"""
+        notes = {}
+        for client_name in client_names:
+            note = "-"
+            c_row = self.dm.index_handler.first_row("clients", client_name)
+            if c_row is not None:
+                val = c_row.get("특이사항", "-")
+                if str(val) != "nan" and val: note = str(val)
+            notes[client_name] = note
+        return notes
 
+    def _read_production(self, name, default):
         try:
-            wb = openpyxl.load_workbook(self.dm.production_request_path, data_only=True)
-            if "Data" not in wb.sheetnames: return
-            ws = wb["Data"]
-            
-            date_map = {}
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                mgmt_no = str(row[0]) if row[0] else None
-                delivery_date = row[8]
-                
-                if mgmt_no and delivery_date:
-                    if isinstance(delivery_date, datetime):
-                        date_str = delivery_date.strftime("%Y-%m-%d")
-                    else:
-                        date_str = str(delivery_date).strip()
-                        if date_str.lower() == "nan" or date_str == "-" or not date_str:
-                            continue
-                            
-                    date_map[mgmt_no] = date_str
-            
-            wb.close()
-            
-            if not self.dm.df_data.empty:
-                if '출고예정일' not in self.dm.df_data.columns:
-                    self.dm.df_data['출고예정일'] = "-"
-                
-                for mgmt_no, new_date in date_map.items():
-                    mask = self.dm.df_data['관리번호'] == mgmt_no
-                    if mask.any():
-                        self.dm.df_data.loc[mask, '출고예정일'] = new_date
-                        
+            parsed = self.production_reader.read()
         except Exception as e:
-            print(f"생산 요청일 동기화 실패: {e}")
+            print(f"생산 요청 파일 읽기 실패: {e}")
+            return default
+        return dict(parsed[name]) if parsed is not None else default
 
-    def get_production_status_map(self):
-        if not os.path.exists(self.dm.production_request_path):
-            return {}
+    def read_production_dates(self):
+        """생산 요청 파일의 관리번호별 출고예정일을 읽습니다. (메모리 미반영, 백그라운드 호출 가능)"""
+        return self._read_production("dates", None)
 
+    def apply_production_dates(self, date_map) -> pd.Index:
+        """출고예정일을 df_data에 반영하고, 실제로 값이 바뀐 행의 라벨을 반환합니다."""
+        if not date_map: return pd.Index([])
         try:
-            wb = openpyxl.load_workbook(self.dm.production_request_path, data_only=True, read_only=True)
-            if "Data" not in wb.sheetnames:
-                return {}
-            
-            ws = wb["Data"]
-            status_map = {}
-            
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if not row or len(row) < 14: continue
-                
-                mgmt_no = str(row[0]).strip() if row[0] else None
-                prod_status = str(row[13]).strip() if row[13] else "-"
-                
-                if mgmt_no:
-                    status_map[mgmt_no] = prod_status
-            
-            wb.close()
-            return status_map
+            df = self.dm.df_data
+            if df.empty: return pd.Index([])
+            if '출고예정일' not in df.columns:
+                df['출고예정일'] = "-"
+
+            new_dates = df['관리번호'].map(date_map)
+            changed = new_dates.notna() & (new_dates != df['출고예정일'])
+            if changed.any():
+                df.loc[changed, '출고예정일'] = new_dates[changed]
+                self.dm.order_summary.invalidate()
+                self.dm.kpi_service.invalidate()
+            return df.index[changed.to_numpy()]
         except Exception as e:
-            print(f"생산 상태 로드 실패: {e}")
-            return {}
+            print(f"생산 요청일 동기화 실패: {e}")
+            return pd.Index([])
 
-    def get_serial_number_map(self):
-        if not os.path.exists(self.dm.production_request_path):
-            return {}
+    def sync_production_dates(self) -> pd.Index:
+        mtime = self.dm.file_handler.get_mtime(self.dm.production_request_path)
+        changed = self.apply_production_dates(self.read_production_dates())
+        self.dm.source_timestamps["production"] = mtime
+        return changed
 
-        try:
-            wb = openpyxl.load_workbook(self.dm.production_request_path, data_only=True, read_only=True)
-            if "Data" not in wb.sheetnames:
-                return {}
-            
-            ws = wb["Data"]
-            serial_map = {}
-            
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if not row or len(row) < 11: continue
-                
-                mgmt_no = str(row[0]).strip() if row[0] else ""
-                model = str(row[2]).strip() if row[2] else ""
-                desc = str(row[3]).strip() if row[3] else ""
-                serial = str(row[10]).strip() if row[10] else "-"
-                
-                key = (mgmt_no, model, desc)
-                if mgmt_no: 
-                    serial_map[key] = serial
-            
-            wb.close()
-            return serial_map
-        except Exception as e:
-            print(f"시리얼 번호 로드 실패: {e}")
-            return {}
+    def get_production_status_map(self):
+        return self._read_production("status", {})
+
+    def get_serial_number_map(self):
+        return self._read_production("serials", {})
@@ -4,10 +4,53 @@ import shutil
 import pandas as pd
 from datetime import datetime
 from src.config import Config
+from managers.data.sqlite_storage import SqliteStorage
+from managers.data.snapshot_cache import SnapshotCache
+from managers.data.lazy_sheets import LazySheets
+from managers.data.staged_sheets import StagedSheets
+from managers.data import schema
 
 class FileHandler:
+    SHEET_KEYS = ["clients", "data", "payment", "delivery", "log", "memo", "memo_log", "tax_invoice"]
+
+    # 내부 키 -> 엑셀 시트명
+    SHEET_MAP = {
+        "clients": Config.SHEET_CLIENTS,
+        "data": Config.SHEET_DATA,
+        "payment": Config.SHEET_PAYMENT,
+        "delivery": Config.SHEET_DELIVERY,
+        "log": Config.SHEET_LOG,
+        "memo": Config.SHEET_MEMO,
+        "memo_log": Config.SHEET_MEMO_LOG,
+        "tax_invoice": Config.SHEET_TAX_INVOICE
+    }
+
+    # 내부 키 -> DataManager 속성명
+    SHEET_ATTRS = {
+        "clients": "df_clients",
+        "data": "df_data",
+        "payment": "df_payment",
+        "delivery": "df_delivery",
+        "log": "df_log",
+        "memo": "df_memo",
+        "memo_log": "df_memo_log",
+        "tax_invoice": "df_tax_invoice",
+        "purchase": "df_purchase"
+    }
+
     def __init__(self, data_manager):
         self.dm = data_manager
+        self.sqlite = SqliteStorage(data_manager)
+        self.snapshot = SnapshotCache()
+        self.staged = StagedSheets()
+
+    def is_sqlite(self):
+        return self.dm.storage_engine == "sqlite"
+
+    @property
+    def data_path(self):
+        """현재 저장소 엔진의 판매 데이터 파일 경로 (xlsx 또는 SQLite DB)"""
+        return self.dm.sqlite_path if self.is_sqlite() else self.dm.current_excel_path
 
     def load_config(self):
         if os.path.exists(Config.CONFIG_FILENAME):
@@ -19,21 +62,31 @@ class FileHandler:
                     self.dm.attachment_root = data.get("attachment_root", Config.DEFAULT_ATTACHMENT_ROOT)
                     self.dm.production_request_path = data.get("production_request_path", Config.DEFAULT_PRODUCTION_REQUEST_PATH)
                     self.dm.purchase_data_path = data.get("purchase_data_path", Config.DEFAULT_PURCHASE_DATA_PATH)
+                    self.dm.storage_engine = data.get("storage_engine", Config.DEFAULT_STORAGE_ENGINE)
+                    self.dm.sqlite_path = data.get("sqlite_path", Config.DEFAULT_SQLITE_PATH)
+                    self.dm.group_commit = data.get("group_commit", Config.DEFAULT_GROUP_COMMIT)
             except: pass
 
-    def save_config(self, new_path=None, new_theme=None, new_attachment_dir=None, new_prod_path=None, new_purchase_path=None):
+    def save_config(self, new_path=None, new_theme=None, new_attachment_dir=None, new_prod_path=None, new_purchase_path=None,
+                    new_storage_engine=None, new_sqlite_path=None, new_group_commit=None):
         if new_path: self.dm.current_excel_path = new_path
         if new_theme: self.dm.current_theme = new_theme
         if new_attachment_dir: self.dm.attachment_root = new_attachment_dir
         if new_prod_path: self.dm.production_request_path = new_prod_path
         if new_purchase_path: self.dm.purchase_data_path = new_purchase_path
+        if new_storage_engine: self.dm.storage_engine = new_storage_engine
+        if new_sqlite_path: self.dm.sqlite_path = new_sqlite_path
+        if new_group_commit is not None: self.dm.group_commit = new_group_commit
         
         data = {
             "excel_path": self.dm.current_excel_path,
             "theme": self.dm.current_theme,
             "attachment_root": self.dm.attachment_root,
             "production_request_path": self.dm.production_request_path,
-            "purchase_data_path": self.dm.purchase_data_path
+            "purchase_data_path": self.dm.purchase_data_path,
+            "storage_engine": self.dm.storage_engine,
+            "sqlite_path": self.dm.sqlite_path,
+            "group_commit": self.dm.group_commit
         }
         try:
             with open(Config.CONFIG_FILENAME, "w", encoding="utf-8") as f:
@@ -52,70 +105,60 @@ class FileHandler:
         elif key == "tax_invoice": return Config.TAX_INVOICE_COLUMNS
         return []
 
-    def read_all_sheets(self) -> dict[str, pd.DataFrame]:
+    def read_all_sheets(self, rowids=None, keys=None) -> dict[str, pd.DataFrame]:
+        """keys를 지정하면 해당 시트만 읽습니다."""
+        if self.is_sqlite():
+            return self.sqlite.read_all_sheets(rowids, keys)
+        return self.read_excel_sheets(self.dm.current_excel_path, keys)
+
+    def read_excel_sheets(self, path, keys=None) -> dict[str, pd.DataFrame]:
+        if keys is None: keys = self.SHEET_KEYS
         dfs = {}
-        if not os.path.exists(self.dm.current_excel_path):
-            keys = ["clients", "data", "payment", "delivery", "log", "memo", "memo_log", "tax_invoice"]
+        if not os.path.exists(path):
             for key in keys:
                 dfs[key] = pd.DataFrame(columns=self._get_columns_for_key(key))
             return dfs
 
         try:
-            with open(self.dm.current_excel_path, "rb") as f:
-                with pd.ExcelFile(f, engine="openpyxl") as xls:
-                    sheet_names = xls.sheet_names
-                    
-                    sheet_map = {
-                        Config.SHEET_CLIENTS: "clients",
-                        Config.SHEET_DATA: "data",
-                        Config.SHEET_PAYMENT: "payment",
-                        Config.SHEET_DELIVERY: "delivery",
-                        Config.SHEET_LOG: "log",
-                        Config.SHEET_MEMO: "memo",
-                        Config.SHEET_MEMO_LOG: "memo_log",
-                        Config.SHEET_TAX_INVOICE: "tax_invoice"
-                    }
-                    
-                    for sheet_name, key in sheet_map.items():
-                        if sheet_name in sheet_names:
-                            df = pd.read_excel(xls, sheet_name)
-                            if key in ["clients", "data"]:
-                                df.columns = df.columns.astype(str).str.strip()
-                            dfs[key] = df
-                        else:
-                            dfs[key] = pd.DataFrame(columns=self._get_columns_for_key(key))
-                            
+            sheets = self.dm.loader.read_excel_sheets(path, [self.SHEET_MAP[key] for key in keys])
+            for key in keys:
+                df = sheets.get(self.SHEET_MAP[key])
+                if df is None:
+                    df = pd.DataFrame(columns=self._get_columns_for_key(key))
+                elif key in ["clients", "data"]:
+                    df.columns = df.columns.astype(str).str.strip()
+                dfs[key] = df
             return dfs
         except Exception as e:
             print(f"Error reading sheets: {e}")
             return {}
 
-    def normalize_all(self, dfs: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
-        keys = ["clients", "data", "payment", "delivery", "log", "memo", "memo_log", "tax_invoice"]
-        for key in keys:
-            if key not in dfs:
-                dfs[key] = pd.DataFrame(columns=self._get_columns_for_key(key))
+    def normalize_all(self, dfs: dict[str, pd.DataFrame], keys=None) -> dict[str, pd.DataFrame]:
+        """keys를 지정하면 해당 시트만 정규화합니다. (트랜잭션에서 변경된 시트만 처리)"""
+        if keys is None:
+            keys = self.SHEET_KEYS
+            for key in keys:
+                if key not in dfs:
+                    dfs[key] = pd.DataFrame(columns=self._get_columns_for_key(key))
 
-        if "data" in dfs:
+        if "data" in keys and "data" in dfs:
+            dfs["data"] = schema.editable(dfs["data"])
             for col in Config.DATA_COLUMNS:
                 if col not in dfs["data"].columns: dfs["data"][col] = "-"
             dfs["data"] = dfs["data"].fillna("-")
-            
-            num_cols = ["수량", "단가", "환율", "세율(%)", "공급가액", "세액", "합계금액", "기수금액", "미수금액"]
-            for col in num_cols:
-                if col in dfs["data"].columns:
-                    dfs["data"][col] = pd.to_numeric(dfs["data"][col], errors='coerce').fillna(0)
 
-            date_cols = ["견적일", "수주일", "출고예정일", "출고일", "선적일", "입금완료일", "세금계산서발행일"]
-            for col in date_cols:
+            for col in Config.DATA_DATE_COLS:
                 if col in dfs["data"].columns:
                     dfs["data"][col] = pd.to_datetime(dfs["data"][col], errors='coerce', format='mixed').dt.strftime("%Y-%m-%d")
                     dfs["data"][col] = dfs["data"][col].fillna("-")
 
-        if "clients" in dfs:
+            # 숫자(float64)/category 타입 적용
+            dfs["data"] = schema.apply_data_schema(dfs["data"])
+
+        if "clients" in keys and "clients" in dfs:
             dfs["clients"] = dfs["clients"].fillna("-")
 
-        if "payment" in dfs:
+        if "payment" in keys and "payment" in dfs:
             # Ensure new columns are string type
             str_cols = ["세금계산서번호", "세금계산서발행일"]
             for col in str_cols:
@@ -123,7 +166,7 @@ class FileHandler:
                     dfs["payment"][col] = ""
                 dfs["payment"][col] = dfs["payment"][col].astype(str).replace("nan", "")
 
-        if "delivery" in dfs:
+        if "delivery" in keys and "delivery" in dfs:
             if "출고번호" not in dfs["delivery"].columns:
                 dfs["delivery"]["출고번호"] = "-"
             for col in Config.DELIVERY_COLUMNS:
@@ -136,7 +179,7 @@ class FileHandler:
                 if col in dfs["delivery"].columns:
                     dfs["delivery"][col] = dfs["delivery"][col].astype(str).replace("nan", "")
 
-        if "tax_invoice" in dfs:
+        if "tax_invoice" in keys and "tax_invoice" in dfs:
             for col in Config.TAX_INVOICE_COLUMNS:
                 if col not in dfs["tax_invoice"].columns: dfs["tax_invoice"][col] = "-"
             dfs["tax_invoice"] = dfs["tax_invoice"].fillna("-")
@@ -148,70 +191,196 @@ class FileHandler:
         return dfs
 
     def write_all_sheets(self, dfs: dict[str, pd.DataFrame]) -> None:
-        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
-            sheet_map = {
-                "clients": Config.SHEET_CLIENTS,
-                "data": Config.SHEET_DATA,
-                "payment": Config.SHEET_PAYMENT,
-                "delivery": Config.SHEET_DELIVERY,
-                "log": Config.SHEET_LOG,
-                "memo": Config.SHEET_MEMO,
-                "memo_log": Config.SHEET_MEMO_LOG,
-                "tax_invoice": Config.SHEET_TAX_INVOICE
-            }
-            for key, sheet_name in sheet_map.items():
+        if self.is_sqlite():
+            self.sqlite.write_all_sheets(dfs)
+            return
+        self.write_excel_sheets(self.dm.current_excel_path, dfs)
+
+    def write_excel_sheets(self, path, dfs: dict[str, pd.DataFrame]) -> None:
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            for key, sheet_name in self.SHEET_MAP.items():
                 if key in dfs:
                     dfs[key].to_excel(writer, sheet_name=sheet_name, index=False)
 
+    def write_sheets(self, dfs: dict[str, pd.DataFrame], keys, before=None) -> None:
+        """
+        변경된 시트(keys)만 기존 통합문서에 덮어씁니다.
+        나머지 시트는 다시 직렬화하지 않고 통합문서에 있던 그대로 유지됩니다.
+        SQLite 엔진은 before(변경 전 상태)와 비교하여 변경된 행만 저장합니다.
+        """
+        keys = [key for key in keys if key in self.SHEET_MAP and key in dfs]
+        if not keys: return
+
+        if self.is_sqlite():
+            self.sqlite.write_sheets(dfs, keys, before)
+            return
+
+        if not os.path.exists(self.dm.current_excel_path):
+            self.write_all_sheets(dfs)
+            return
+
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl", mode="a", if_sheet_exists="overlay") as writer:
+            for key in keys:
+                sheet_name = self.SHEET_MAP[key]
+                if sheet_name in writer.book.sheetnames:
+                    ws = writer.book[sheet_name]
+                    # 행 수가 줄어든 경우 이전 내용이 남지 않도록 비운 뒤 덮어쓰기
+                    if ws.max_row > 0:
+                        ws.delete_rows(1, ws.max_row)
+                dfs[key].to_excel(writer, sheet_name=sheet_name, index=False)
+
+    def apply_to_memory(self, dfs: dict[str, pd.DataFrame], keys=None) -> None:
+        """
+        dfs의 시트를 DataManager의 메모리 DataFrame으로 반영합니다.
+        작업 스레드에서 호출되면 StagedSheets에 맡기고 UI 스레드에서 반영합니다.
+        """
+        keys = list(dfs.keys() if keys is None else keys)
+        sheets = {key: dfs[key] for key in keys if key in dfs and key in self.SHEET_ATTRS}
+        if self.dm.worker.in_worker_thread():
+            self.staged.stage(sheets)
+            return self.dm.worker.post(self._apply_staged, sheets, keys)
+        self.staged.discard(sheets)
+        self._set_memory(sheets, keys)
+
+    def _apply_staged(self, sheets, keys):
+        current = self.staged.take(sheets)
+        self._set_memory(current, [key for key in keys if key in current or key not in sheets])
+
+    def _set_memory(self, sheets, keys):
+        for key, df in sheets.items():
+            setattr(self.dm, self.SHEET_ATTRS[key], df)
+        self.dm.index_handler.refresh(keys)
+        if "data" in keys: self.dm.search_index.update()
+
+    def latest(self, key):
+        """UI 스레드에 아직 반영하지 않은 저장 결과까지 포함한 최신 시트"""
+        staged = self.staged.get(key)
+        return getattr(self.dm, self.SHEET_ATTRS[key]) if staged is None else staged
+
+    def current_sheets(self) -> LazySheets:
+        """
+        메모리의 판매 시트를 dict 형태로 반환합니다. (복사하지 않음, 반영 대기 중인 저장 결과 포함)
+        아직 읽지 않은 시트는 접근 시 파일에서 읽으며, 메모리에도 보관합니다.
+        """
+        memory = self.dm.sheets
+        def load(key):
+            df = self.load_sheet(key)
+            memory.setdefault(key, df)
+            return df
+        return LazySheets(load, {**dict(memory), **self.staged.items(self.SHEET_KEYS)}, self.SHEET_KEYS)
+
+    def update_timestamp(self):
+        if os.path.exists(self.data_path):
+            self.dm.last_file_timestamp = os.path.getmtime(self.data_path)
+
+    def store_snapshot(self, written, previous=None):
+        """
+        파일에 쓴(또는 읽은) 시트 written으로 스냅샷을 갱신합니다. 저장하지 않은 변경(출고예정일 동기화 등)이
+        있을 수 있는 메모리 시트는 쓰지 않고, 다시 쓰지 않은 시트는 previous(저장 전 signature)의 스냅샷을 옮깁니다.
+        """
+        if self.is_sqlite(): return
+        path, signature = self.dm.current_excel_path, self.snapshot.signature(self.dm.current_excel_path)
+        for key in self.SHEET_KEYS:
+            df = written[key] if key in written else previous and self.snapshot.load(path, f"sales_{key}", previous)
+            if df is not None: self.snapshot.store(path, f"sales_{key}", df, signature)
+
+    @staticmethod
+    def get_mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def read_sheets(self, keys, rowids=None, signature=None) -> dict[str, pd.DataFrame]:
+        """keys 시트를 읽고 정규화합니다. 엑셀 파일이 변경되지 않았다면 시트별 스냅샷을 사용합니다."""
+        dfs = {}
+        if not self.is_sqlite():
+            for key in keys:
+                df = self.snapshot.load(self.dm.current_excel_path, f"sales_{key}", signature)
+                if df is not None: dfs[key] = df
+
+        missing = [key for key in keys if key not in dfs]
+        if not missing: return dfs
+
+        raw = self.read_all_sheets(rowids, missing)
+        if not raw: raise IOError("데이터 파일을 읽을 수 없습니다.")
+        self.normalize_all(raw, missing)
+        for key in missing:
+            dfs[key] = raw[key]
+            if not self.is_sqlite():
+                self.snapshot.store(self.dm.current_excel_path, f"sales_{key}", raw[key], signature)
+        return dfs
+
+    def load_sheet(self, key) -> pd.DataFrame:
+        """지연 로드 시트 하나를 현재 파일에서 읽습니다. (DataManager.sheets의 loader)"""
+        with self.dm.lock:
+            signature = None if self.is_sqlite() else self.snapshot.signature(self.dm.current_excel_path)
+            return self.read_sheets([key], signature=signature)[key]
+
+    def read_data(self):
+        """
+        판매 시트를 읽고 정규화한 결과를 반환합니다. 메모리에는 반영하지 않으므로
+        백그라운드 스레드에서 호출할 수 있습니다. (반영은 apply_data)
+        Config.LAZY_SHEET_KEYS 시트는 여기서 읽지 않고 처음 접근할 때 읽습니다.
+        """
+        # 읽는 도중 파일이 바뀌면 다음 변경 체크에서 다시 읽도록 읽기 전 시각을 기록
+        loaded = {"mtime": self.get_mtime(self.data_path), "rowids": {}}
+        # 엑셀 파일이 변경되지 않았다면 정규화까지 끝난 스냅샷을 사용
+        signature = None if self.is_sqlite() else self.snapshot.signature(self.dm.current_excel_path)
+        eager_keys = [key for key in self.SHEET_KEYS if key not in Config.LAZY_SHEET_KEYS]
+        dfs = self.read_sheets(eager_keys, loaded["rowids"], signature)
+        loaded["sheets"] = LazySheets(self.load_sheet, dfs, self.SHEET_KEYS)
+        return loaded
+
+    def apply_data(self, loaded):
+        self.dm.sheets = loaded["sheets"]
+        self.dm.index_handler.refresh(self.SHEET_KEYS)
+        self.dm.search_index.update()
+        self.sqlite.adopt_rowids(loaded["rowids"])
+        if loaded["mtime"] is not None:
+            self.dm.last_file_timestamp = loaded["mtime"]
+
     def load_data(self):
         try:
-            dfs = self.read_all_sheets()
-            dfs = self.normalize_all(dfs)
-            
-            self.dm.df_clients = dfs["clients"]
-            self.dm.df_data = dfs["data"]
-            self.dm.df_payment = dfs["payment"]
-            self.dm.df_delivery = dfs["delivery"]
-            self.dm.df_log = dfs["log"]
-            self.dm.df_memo = dfs["memo"]
-            self.dm.df_memo = dfs["memo"]
-            self.dm.df_memo_log = dfs["memo_log"]
-            self.dm.df_tax_invoice = dfs["tax_invoice"]
-            
-            if os.path.exists(self.dm.current_excel_path):
-                self.dm.last_file_timestamp = os.path.getmtime(self.dm.current_excel_path)
-                
+            self.apply_data(self.read_data())
             return True, "데이터 로드 완료"
         except Exception as e:
             return False, f"오류 발생: {e}"
 
     def check_for_external_changes(self):
-        if not os.path.exists(self.dm.current_excel_path): return False
+        if not os.path.exists(self.data_path): return False
         try:
-            current_mtime = os.path.getmtime(self.dm.current_excel_path)
+            current_mtime = os.path.getmtime(self.data_path)
             if current_mtime > self.dm.last_file_timestamp: return True
         except OSError: pass
         return False
 
     def save_to_excel(self):
+        if self.is_sqlite():
+            try:
+                self.sqlite.write_all_sheets(self.current_sheets())
+                self.update_timestamp()
+                return True, "저장 완료"
+            except Exception as e:
+                return False, f"저장 실패: {e}"
+
         try:
-            with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
-                self.dm.df_clients.to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
-                self.dm.df_data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
-                self.dm.df_payment.to_excel(writer, sheet_name=Config.SHEET_PAYMENT, index=False)
-                self.dm.df_delivery.to_excel(writer, sheet_name=Config.SHEET_DELIVERY, index=False)
-                self.dm.df_log.to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
-                self.dm.df_memo.to_excel(writer, sheet_name=Config.SHEET_MEMO, index=False)
-                self.dm.df_memo_log.to_excel(writer, sheet_name=Config.SHEET_MEMO_LOG, index=False)
-                self.dm.df_tax_invoice.to_excel(writer, sheet_name=Config.SHEET_TAX_INVOICE, index=False)
+            # 아직 읽지 않은 시트도 모두 읽은 뒤 전체를 다시 씀
+            sheets = self.current_sheets()
+            written = {key: sheets[key] for key in self.SHEET_KEYS}
+            self.write_excel_sheets(self.dm.current_excel_path, written)
+            self.store_snapshot(written)
             return True, "저장 완료"
         except PermissionError:
             return False, "엑셀 파일이 열려있습니다."
         except Exception as e:
             return False, f"저장 실패: {e}"
 
-    def load_purchase_data(self):
+    def load_purchase_data(self, rowids=None):
         """구매 엑셀 파일을 로드하여 DataFrame 반환"""
+        if self.is_sqlite():
+            return self.sqlite.load_purchase_data(rowids)
+
         if not os.path.exists(self.dm.purchase_data_path):
             try:
                 dirname = os.path.dirname(self.dm.purchase_data_path)
@@ -224,35 +393,87 @@ class FileHandler:
                 return None, f"구매 파일 생성 실패: {e}"
         
         try:
-            df = pd.read_excel(self.dm.purchase_data_path, sheet_name="Data", engine="openpyxl")
-            for col in Config.PURCHASE_COLUMNS:
-                if col not in df.columns:
-                    df[col] = ""
-            df = df.fillna("")
+            signature = self.snapshot.signature(self.dm.purchase_data_path)
+            df = self.snapshot.load(self.dm.purchase_data_path, "purchase", signature)
+            if df is None:
+                df = self.read_purchase_excel(self.dm.purchase_data_path)
+                self.snapshot.store(self.dm.purchase_data_path, "purchase", df, signature)
             return df, "구매 데이터 로드 성공"
         except Exception as e:
             return None, f"구매 데이터 읽기 실패: {e}"
 
-    def save_purchase_data(self):
+    def read_purchase_excel(self, path):
+        df = self.dm.loader.read_excel_sheets(path, ["Data"])["Data"]
+        if df is None: raise ValueError("Worksheet named 'Data' not found")
+        for col in Config.PURCHASE_COLUMNS:
+            if col not in df.columns:
+                df[col] = ""
+        return df.fillna("")
+
+    def save_purchase_data(self, before=None, df=None):
+        """구매 데이터를 저장합니다. df를 주지 않으면 메모리의 df_purchase"""
+        if df is None: df = self.dm.df_purchase
+        if self.is_sqlite():
+            result = self.sqlite.save_purchase_data(before, df)
+            self.update_timestamp()
+            return result
+
         try:
             with pd.ExcelWriter(self.dm.purchase_data_path, engine="openpyxl") as writer:
-                self.dm.df_purchase.to_excel(writer, sheet_name="Data", index=False)
+                df.to_excel(writer, sheet_name="Data", index=False)
+            self.dm.source_timestamps["purchase"] = self.get_mtime(self.dm.purchase_data_path)
+            self.snapshot.store(self.dm.purchase_data_path, "purchase", df)
             return True, "구매 데이터 저장 완료"
         except PermissionError:
             return False, "구매 데이터 파일이 열려있습니다."
         except Exception as e:
             return False, f"구매 데이터 저장 실패: {e}"
 
+    def export_workbooks(self, sales_path, purchase_path=None):
+        """현재 데이터를 엑셀 통합문서로 내보냅니다. (재무팀 전달용, 저장소 엔진과 무관)"""
+        try:
+            self.write_excel_sheets(sales_path, self.current_sheets())
+            if purchase_path:
+                with pd.ExcelWriter(purchase_path, engine="openpyxl") as writer:
+                    self.dm.df_purchase.to_excel(writer, sheet_name="Data", index=False)
+            return True, "엑셀 내보내기 완료"
+        except PermissionError:
+            return False, "대상 엑셀 파일이 열려있습니다."
+        except Exception as e:
+            return False, f"엑셀 내보내기 실패: {e}"
+
+    def import_workbooks(self, sales_path, purchase_path=None):
+        """엑셀 통합문서(SalesList/OrderList)의 내용으로 현재 저장소를 교체합니다."""
+        if not os.path.exists(sales_path): return False, f"파일 없음: {sales_path}"
+        try:
+            dfs = self.read_excel_sheets(sales_path)
+            if not dfs: return False, "판매 데이터 파일을 읽을 수 없습니다."
+            dfs = self.normalize_all(dfs)
+            if purchase_path and os.path.exists(purchase_path):
+                dfs["purchase"] = self.read_purchase_excel(purchase_path)
+
+            if self.is_sqlite():
+                self.sqlite.write_all_sheets(dfs)
+            else:
+                self.write_excel_sheets(self.dm.current_excel_path, dfs)
+                if "purchase" in dfs:
+                    with pd.ExcelWriter(self.dm.purchase_data_path, engine="openpyxl") as writer:
+                        dfs["purchase"].to_excel(writer, sheet_name="Data", index=False)
+            return True, f"{len(dfs.get('data', []))}건의 판매 데이터를 가져왔습니다."
+        except PermissionError:
+            return False, "데이터 파일이 열려있습니다."
+        except Exception as e:
+            return False, f"엑셀 가져오기 실패: {e}"
 
     def create_backup(self):
-        if not os.path.exists(self.dm.current_excel_path): return False, "파일 없음"
+        if not os.path.exists(self.data_path): return False, "파일 없음"
         try:
-            folder = os.path.dirname(self.dm.current_excel_path)
+            folder = os.path.dirname(self.data_path)
             backup_folder = os.path.join(folder, "backup")
             if not os.path.exists(backup_folder): os.makedirs(backup_folder)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            fname = os.path.basename(self.dm.current_excel_path)
-            shutil.copy2(self.dm.current_excel_path, os.path.join(backup_folder, f"{fname}_{timestamp}.bak"))
+            fname = os.path.basename(self.data_path)
+            shutil.copy2(self.data_path, os.path.join(backup_folder, f"{fname}_{timestamp}.bak"))
             return True, "백업 완료"
         except Exception as e: return False, str(e)
 
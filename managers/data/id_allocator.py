@@ -0,0 +1,186 @@
+import os
+import re
+import json
+import time
+import threading
+from datetime import datetime
+
+from src.config import Config
+from managers.data.file_handler import FileHandler
+
+
+class IdAllocator:
+    """
+    견적(QT)/주문(OD)/출고(CX)/발주(PU) 번호 발급기.
+    "{접두어}-{yymmdd}-{순번}" 형식이며, 접두어/날짜별 최대 순번(high-water mark)을 보관합니다.
+    최대 순번은 시트 DataFrame이 바뀔 때(로드, 저장) 한 번만 다시 계산합니다.
+
+    두 사용자가 동시에 같은 번호를 받지 않도록 데이터 파일 옆의 카운터 파일(.ids.json)에
+    발급한 번호를 기록하며, 잠금 파일(.ids.lock)로 보호합니다. 공유 폴더에 쓸 수 없으면
+    이 PC의 데이터만 기준으로 발급합니다.
+
+    신규 등록 팝업은 peek_id()로 예약하지 않은 임시 번호를 보여주고, 저장할 때 reserve_id()로 확정합니다.
+    (팝업을 취소해도 번호가 비지 않음, 그 사이 다른 사용자가 같은 번호를 쓰면 다음 번호로 바뀜)
+    """
+
+    # 접두어 -> (시트 키, 번호 컬럼)
+    SOURCES = {
+        "QT": ("data", "관리번호"),
+        "OD": ("data", "관리번호"),
+        "CX": ("delivery", "출고번호"),
+        "PU": ("purchase", "관리번호"),
+    }
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self._lock = threading.Lock()
+        # 시트 키 -> (DataFrame, 행 수, {(접두어, yymmdd): 최대 순번})
+        self._marks = {}
+        # 이 PC에서 발급한 번호 {(접두어, yymmdd): 순번}
+        self._issued = {}
+
+    @staticmethod
+    def _scan(df, col):
+        """번호 컬럼 전체에서 (접두어, 날짜)별 최대 순번을 구합니다."""
+        if df is None or df.empty or col not in df.columns:
+            return {}
+        parts = df[col].astype(str).str.extract(r"^([A-Z]+)-(\d{6})-(?:.*-)?(\d+)$").dropna()
+        if parts.empty: return {}
+        parts[2] = parts[2].astype(int)
+        return {(prefix, day): int(seq) for (prefix, day), seq in parts.groupby([0, 1])[2].max().items()}
+
+    def _sheet_marks(self, key, col):
+        df = getattr(self.dm, FileHandler.SHEET_ATTRS[key])
+        entry = self._marks.get(key)
+        if entry is None or entry[0] is not df or entry[1] != len(df):
+            entry = (df, len(df), self._scan(df, col))
+            self._marks[key] = entry
+        return entry[2]
+
+    def _local_max(self, prefix, day):
+        key, col = self.SOURCES[prefix]
+        mark = (prefix, day)
+        return max(self._sheet_marks(key, col).get(mark, 0), self._issued.get(mark, 0))
+
+    # ---------------------------------------------------------
+    # 공유 카운터 파일
+    # ---------------------------------------------------------
+    @property
+    def counter_path(self):
+        return self.dm.file_handler.data_path + ".ids.json"
+
+    def _acquire_file_lock(self, lock_path):
+        deadline = time.monotonic() + Config.ID_LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return True
+            except FileExistsError:
+                if self._remove_stale_lock(lock_path): continue
+                if time.monotonic() >= deadline: return False
+                time.sleep(0.05)
+            except OSError:
+                return False # 폴더가 없거나 쓰기 권한 없음
+
+    @staticmethod
+    def _remove_stale_lock(lock_path):
+        """
+        비정상 종료로 남은 잠금 파일을 정리합니다. 정리했으면 True
+        두 PC가 동시에 오래된 잠금을 발견해도 한쪽만 지우도록, 먼저 고유한 이름으로 옮긴 뒤
+        옮긴 파일이 오래된 것으로 판단한 바로 그 파일(inode, 수정 시각)인지 확인하고 지웁니다.
+        다른 PC가 그 사이 새로 만든 잠금을 옮긴 경우에는 되돌려 놓습니다.
+        """
+        try:
+            stat = os.stat(lock_path)
+            if time.time() - stat.st_mtime <= Config.ID_LOCK_STALE: return False
+            moved = f"{lock_path}.{os.getpid()}.{threading.get_ident()}.stale"
+            os.rename(lock_path, moved)
+        except OSError:
+            return False # 이미 다른 PC가 정리함
+        try:
+            moved_stat = os.stat(moved)
+            if (moved_stat.st_ino, moved_stat.st_mtime_ns) != (stat.st_ino, stat.st_mtime_ns):
+                try: os.link(moved, lock_path) # 새 잠금을 되돌림 (이미 있으면 실패)
+                except OSError: pass
+            os.remove(moved)
+        except OSError: pass
+        return True
+
+    def _reserve_shared(self, mark, local_max):
+        """카운터 파일에서 번호를 예약합니다. 실패하면 None"""
+        path = self.counter_path
+        lock_path = path + ".lock"
+        if not self._acquire_file_lock(lock_path): return None
+        try:
+            counters = {}
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        counters = json.load(f)
+                except ValueError:
+                    counters = {}
+            name = f"{mark[0]}-{mark[1]}"
+            seq = max(counters.get(name, 0), local_max) + 1
+            # 오늘 날짜 카운터만 유지
+            counters = {k: v for k, v in counters.items() if k.endswith(f"-{mark[1]}")}
+            counters[name] = seq
+
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(counters, f)
+            os.replace(tmp_path, path)
+            return seq
+        except OSError as e:
+            print(f"번호 카운터 갱신 실패: {e}")
+            return None
+        finally:
+            try: os.remove(lock_path)
+            except OSError: pass
+
+    # ---------------------------------------------------------
+    # 발급
+    # ---------------------------------------------------------
+    def next_id(self, prefix):
+        """오늘 날짜의 다음 번호를 예약하여 반환합니다. (예: OD-231210-004)"""
+        return self._reserve(prefix, datetime.now().strftime("%y%m%d"), 0)
+
+    def _reserve(self, prefix, day, floor):
+        """floor보다 큰 번호 중 아직 발급되지 않은 가장 작은 번호를 예약합니다."""
+        mark = (prefix, day)
+        with self._lock:
+            local_max = max(self._local_max(prefix, day), floor)
+            seq = self._reserve_shared(mark, local_max)
+            if seq is None:
+                seq = local_max + 1
+            self._issued[mark] = seq
+        return f"{prefix}-{day}-{seq:03d}"
+
+    def _shared_count(self, mark):
+        """카운터 파일의 현재 값 (읽기 전용, 잠그지 않음)"""
+        try:
+            with open(self.counter_path, "r", encoding="utf-8") as f:
+                return int(json.load(f).get(f"{mark[0]}-{mark[1]}", 0))
+        except (OSError, ValueError, AttributeError):
+            return 0
+
+    def peek_id(self, prefix):
+        """다음 번호를 예약하지 않고 반환합니다. (신규 등록 팝업에 보여줄 임시 번호)"""
+        day = datetime.now().strftime("%y%m%d")
+        with self._lock:
+            seq = max(self._local_max(prefix, day), self._shared_count((prefix, day))) + 1
+        return f"{prefix}-{day}-{seq:03d}"
+
+    def reserve_id(self, provisional):
+        """
+        peek_id()로 보여준 임시 번호를 저장 시점에 확정합니다.
+        그 사이 다른 사용자(또는 다른 팝업)가 같은 번호를 가져갔으면 다음 빈 번호를 예약하여 반환합니다.
+        사용자가 형식에 맞지 않는 번호를 직접 입력한 경우에는 그대로 반환합니다.
+        """
+        match = re.match(r"^([A-Z]+)-(\d{6})-(\d+)$", str(provisional))
+        if not match or match.group(1) not in self.SOURCES: return provisional
+        prefix, day, seq = match.group(1), match.group(2), int(match.group(3))
+        today = datetime.now().strftime("%y%m%d")
+        if day != today: # 팝업을 연 채 날짜가 바뀐 경우
+            return self.next_id(prefix)
+        return self._reserve(prefix, day, seq - 1)
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+from managers.data.file_handler import FileHandler
+from managers.data.lazy_sheets import LazySheets
+
+
+class IndexHandler:
+    """
+    관리번호/업체명 -> 행 위치(position) 해시 인덱스.
+    DataFrame 객체 단위로 인덱스를 보관하며, 객체가 교체되거나(concat, 필터링 등)
+    행 수가 달라지면 해당 시트만 다시 만듭니다.
+    키 컬럼(관리번호, 업체명)을 제자리에서 수정하는 작업은 columns_changed()로 알려야 하며,
+    조회 시에도 찾은 행의 키 값이 그대로인지 확인하여 다르면 다시 만들고,
+    트랜잭션 작업 사본(메모리 시트가 아닌 DataFrame)에서 찾지 못한 값은 키 컬럼을 직접 확인합니다.
+    변경된 시트는 메모리 반영 시점(refresh)에도 다시 만듭니다.
+    """
+
+    INDEX_COLUMNS = {
+        "data": "관리번호",
+        "payment": "관리번호",
+        "delivery": "관리번호",
+        "tax_invoice": "관리번호",
+        "memo": "관리번호",
+        "purchase": "관리번호",
+        "clients": "업체명",
+    }
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        # key -> {id(df): (df, 행 수, {값: 위치 배열})}
+        self._indexes = {}
+
+    def _memory_frame(self, key, load=True):
+        """load=False이면 아직 읽지 않은 지연 로드 시트는 읽지 않고 None을 반환합니다."""
+        sheets = getattr(self.dm, "sheets", None)
+        if not load and isinstance(sheets, LazySheets) and key in sheets and not sheets.is_loaded(key):
+            return None
+        # 작업 스레드에서는 UI 스레드에 아직 반영하지 않은 저장 결과를 기준으로 조회
+        worker = getattr(self.dm, "worker", None)
+        if worker is not None and worker.in_worker_thread(): return self.dm.file_handler.latest(key)
+        return getattr(self.dm, FileHandler.SHEET_ATTRS[key], None)
+
+    @staticmethod
+    def _build(df, col):
+        if df is None or df.empty or col not in df.columns:
+            return {}
+        return df.groupby(df[col].astype(str), sort=False).indices
+
+    def _get_index(self, key, df):
+        entries = self._indexes.setdefault(key, {})
+        entry = entries.get(id(df))
+        if entry is not None and entry[0] is df and entry[1] == len(df):
+            return entry[2]
+
+        # 메모리 DataFrame + 작업 중인 DataFrame 하나만 유지
+        memory_df = self._memory_frame(key, load=False)
+        for df_id in [i for i, e in entries.items() if e[0] is not memory_df]:
+            del entries[df_id]
+
+        index = self._build(df, self.INDEX_COLUMNS[key])
+        entries[id(df)] = (df, len(df), index)
+        return index
+
+    def columns_changed(self, key, df, columns):
+        """df의 columns를 제자리에서 수정한 경우 호출: 키 컬럼이 포함되어 있으면 df의 인덱스를 버립니다."""
+        if self.INDEX_COLUMNS.get(key) in columns:
+            self._indexes.get(key, {}).pop(id(df), None)
+
+    def refresh(self, keys=None):
+        """
+        로드/저장으로 교체된 메모리 시트의 인덱스만 다시 만듭니다.
+        트랜잭션 중 키 컬럼이 제자리에서 바뀌었을 수 있으므로(업체명 변경 등) 항상 새로 만듭니다.
+        """
+        if keys is None: keys = self.INDEX_COLUMNS.keys()
+        for key in keys:
+            if key not in self.INDEX_COLUMNS: continue
+            self._indexes.pop(key, None)
+            df = self._memory_frame(key, load=False)
+            if df is not None:
+                self._get_index(key, df)
+
+    def adopt(self, key, new_df, source_df):
+        """source_df를 그대로 복사한 new_df가 같은 인덱스를 공유하도록 등록합니다."""
+        if key not in self.INDEX_COLUMNS: return
+        entry = self._indexes.get(key, {}).get(id(source_df))
+        if entry is None or entry[0] is not source_df or len(new_df) != entry[1]:
+            return
+        self._indexes[key][id(new_df)] = (new_df, len(new_df), entry[2])
+
+    def positions(self, key, value, df=None):
+        """value와 일치하는 행의 위치 배열을 반환합니다. df 생략 시 메모리 시트를 사용합니다."""
+        if df is None: df = self._memory_frame(key)
+        if df is None or df.empty:
+            return np.array([], dtype=np.intp)
+        value = str(value)
+        pos = self._get_index(key, df).get(value, np.array([], dtype=np.intp))
+        col = self.INDEX_COLUMNS[key]
+        if len(pos):
+            stale = not self._still_matches(df, col, pos, value)
+        else:
+            # 작업 사본은 알리지 않고 키를 새 값으로 바꿨을 수 있음 (메모리 시트는 교체 시 refresh로 다시 만듦)
+            stale = df is not self._memory_frame(key, load=False) and (df[col].astype(str).to_numpy() == value).any()
+        if stale:
+            # 알리지 않고 키 컬럼을 제자리에서 바꾼 경우: 다시 만들어 조회
+            self._indexes[key].pop(id(df), None)
+            pos = self._get_index(key, df).get(value, np.array([], dtype=np.intp))
+        return pos
+
+    @staticmethod
+    def _still_matches(df, col, pos, value):
+        """찾은 행들의 키 값이 아직 value인지 확인 (일치 행 수만큼만 검사)"""
+        return all(str(v) == value for v in df[col].to_numpy()[pos])
+
+    def labels(self, key, value, df=None) -> pd.Index:
+        """df.loc에 바로 쓸 수 있는 행 라벨을 반환합니다."""
+        if df is None: df = self._memory_frame(key)
+        return df.index[self.positions(key, value, df)]
+
+    def rows(self, key, value, df=None) -> pd.DataFrame:
+        if df is None: df = self._memory_frame(key)
+        return df.iloc[self.positions(key, value, df)]
+
+    def first_row(self, key, value, df=None):
+        """첫 번째 일치 행(Series)을 반환하고, 없으면 None을 반환합니다."""
+        if df is None: df = self._memory_frame(key)
+        pos = self.positions(key, value, df)
+        return df.iloc[pos[0]] if len(pos) else None
+
+    def contains(self, key, value, df=None) -> bool:
+        return len(self.positions(key, value, df)) > 0
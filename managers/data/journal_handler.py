@@ -0,0 +1,288 @@
+import os
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from src.config import Config
+
+
+class JournalHandler:
+    """
+    빠르게 연속되는 수정 작업을 모아서 한 번에 저장하는 로컬 작업 저널(write-ahead journal).
+
+    작업은 (이름, 인자) 형태로 저널 파일에 먼저 기록하고 메모리에 즉시 반영합니다.
+    마지막 작업 후 JOURNAL_COMMIT_DELAY 초 동안 추가 작업이 없거나(최대 JOURNAL_MAX_DELAY 초),
+    다른 트랜잭션/로드/종료 시점에 쌓인 작업을 한 번의 트랜잭션으로 재실행하여 파일에 저장합니다.
+    저장 전에 프로그램이 종료되었다면 다음 로드 시 저널을 재실행하여 복구합니다.
+
+    작업은 묶음 ID와 함께 기록되고, 저장 트랜잭션은 같은 파일에 "저널 반영" 로그(묶음 ID 포함)를 함께 남깁니다.
+    파일 저장 후 저널을 지우기 전에 종료된 경우, 복구 시 로그에 이미 있는 묶음은 다시 실행하지 않습니다.
+    """
+
+    # 작업 이름 -> (핸들러 속성명, 트랜잭션 함수 생성 메서드명)
+    OPERATIONS = {
+        "add_order": ("order_handler", "build_add_order"),
+        "update_status": ("order_handler", "build_update_status"),
+        "update_order_fields": ("order_handler", "build_update_order_fields"),
+        "confirm_order": ("order_handler", "build_confirm_order"),
+        "add_payment": ("payment_handler", "build_add_payment"),
+    }
+    LOG_ACTION = "저널 반영"
+    QUEUED_MSG = "변경사항을 반영했습니다. 잠시 후 파일에 저장됩니다."
+    _BATCH_PATTERN = re.compile(r"\[journal:([\w,]+)\]")
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self.commit_delay = Config.JOURNAL_COMMIT_DELAY
+        self.max_delay = Config.JOURNAL_MAX_DELAY
+
+        self._pending = []       # [(entry, update_func)]
+        self._committed = None   # 첫 대기 작업 이전(파일 기준) 시트
+        self._first_pending_at = 0.0
+        self._batch = None       # 현재 대기 묶음 ID
+        self._timer = None
+        self._retries = 0        # 연속 저장 실패 횟수 (0이면 정상)
+        self._status_listeners = []
+        self._reject_listeners = []
+
+    def add_status_listener(self, listener):
+        """listener(message: str)는 UI 스레드에서 호출됩니다. (저장 재시도 중 안내, 빈 문자열이면 해제)"""
+        self._status_listeners.append(listener)
+
+    def add_reject_listener(self, listener):
+        """listener(rejected: list[dict])는 UI 스레드에서 호출됩니다. (재실행에 실패해 반영되지 않은 작업)"""
+        self._reject_listeners.append(listener)
+
+    def _notify_status(self, message):
+        for listener in self._status_listeners:
+            self.dm.worker.post(listener, message)
+
+    @property
+    def enabled(self):
+        return self.dm.group_commit
+
+    @property
+    def path(self):
+        # 스냅샷과 같은 로컬 캐시 폴더에 보관
+        return os.path.join(self.dm.file_handler.snapshot.cache_dir, Config.JOURNAL_FILENAME)
+
+    @property
+    def rejects_path(self):
+        return os.path.join(self.dm.file_handler.snapshot.cache_dir, Config.JOURNAL_REJECTS_FILENAME)
+
+    @property
+    def has_pending(self):
+        return bool(self._pending)
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    def _build(self, op, params):
+        handler_attr, builder = self.OPERATIONS[op]
+        return getattr(getattr(self.dm, handler_attr), builder)(**params)
+
+    # ---------------------------------------------------------
+    # 작업 제출
+    # ---------------------------------------------------------
+    def submit(self, op, params):
+        """
+        작업을 저널에 기록하고 메모리에 반영합니다. 파일 저장은 묶어서 나중에 수행되므로
+        성공 메시지는 저장 대기(QUEUED_MSG)이며, 저장될 때까지 상태 표시줄에 대기 건수를 알립니다.
+        """
+        update = self._build(op, params)
+        if not self.enabled:
+            return self.dm.execute_transaction(update)
+
+        with self.dm.lock:
+            if not os.path.exists(self.dm.file_handler.data_path):
+                return False, "데이터 파일이 존재하지 않습니다."
+            if not self._pending and self.dm.file_handler.check_for_external_changes():
+                # 다른 사용자가 저장한 내용이 있으면 다시 읽은 뒤 바로 저장
+                return self.dm.execute_transaction(update)
+
+            base = self.dm.file_handler.current_sheets()
+            base["purchase"] = self.dm.file_handler.latest("purchase")
+            dfs = self.dm._working_copy(base)
+            try:
+                success, msg = update(dfs)
+            except Exception as e:
+                return False, f"트랜잭션 오류: {e}"
+            if not success: return False, msg
+
+            changed = self.dm._get_changed_sheets(base, dfs)
+            if not changed: return True, "저장되었습니다."
+
+            batch = self._batch if self._pending else uuid.uuid4().hex[:12]
+            entry = {"op": op, "params": params, "batch": batch,
+                     "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+            try:
+                self._append(entry)
+            except OSError:
+                # 저널을 쓸 수 없으면 바로 저장
+                return self.dm.execute_transaction(update)
+
+            if not self._pending:
+                self._committed = base
+                self._batch = batch
+                self._first_pending_at = time.monotonic()
+            self._pending.append((entry, update))
+
+            sales_changed = [key for key in changed if key != "purchase"]
+            for key in sales_changed:
+                dfs[key] = dfs[key].reset_index(drop=True)
+            self.dm.file_handler.normalize_all(dfs, sales_changed)
+            self.dm.file_handler.apply_to_memory(dfs, changed)
+
+            self._schedule_flush()
+            if not self._retries: self._notify_status(f"💾 저장 대기 중 ({len(self._pending)}건)")
+            return True, self.QUEUED_MSG
+
+    def _append(self, entry, path=None):
+        path = path or self.path
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _reject(self, rejected):
+        """반영되지 못한 작업을 별도 파일에 보관하고 사용자에게 알립니다."""
+        for entry in rejected:
+            try:
+                self._append(entry, self.rejects_path)
+            except OSError as e:
+                print(f"실패 작업 보관 실패: {e}")
+            print(f"저널 작업 재실행 실패: {entry['op']} - {entry['error']}")
+        for listener in self._reject_listeners:
+            self.dm.worker.post(listener, rejected)
+
+    def _clear_file(self):
+        try:
+            if os.path.exists(self.path): os.remove(self.path)
+        except OSError as e:
+            print(f"저널 정리 실패: {e}")
+
+    # ---------------------------------------------------------
+    # 그룹 커밋
+    # ---------------------------------------------------------
+    def _schedule_flush(self):
+        # 저장 실패 후에는 재시도 타이머가 간격을 관리 (그룹 커밋 마감으로 당기지 않음)
+        if self._retries: return
+        waited = time.monotonic() - self._first_pending_at
+        self._start_timer(max(0.0, min(self.commit_delay, self.max_delay - waited)))
+
+    def _schedule_retry(self, msg):
+        """저장 실패 시 지수 백오프로 재시도를 예약하고 사용자에게 알립니다."""
+        self._retries += 1
+        delay = min(Config.JOURNAL_RETRY_MAX_DELAY, Config.JOURNAL_RETRY_DELAY * 2 ** (self._retries - 1))
+        self._start_timer(delay)
+        self._notify_status(f"⚠️ 저장 재시도 중 ({self._retries}회, {delay:.0f}초 후)")
+        print(f"저널 저장 실패, {delay:.0f}초 후 재시도: {msg}")
+
+    def _start_timer(self, delay):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        # 다른 저장 작업과 순서를 맞추기 위해 백그라운드 작업 큐에서 실행
+        self.dm.run_async(self.flush)
+
+    def flush(self):
+        """대기 중인 작업을 하나의 트랜잭션으로 파일에 저장합니다."""
+        with self.dm.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending: return True, ""
+
+            pending = list(self._pending)
+            batches = sorted({entry["batch"] for entry, _ in pending if entry.get("batch")})
+            rejected = []
+
+            def replay(dfs):
+                rejected.clear() # 저장 실패 후 재시도 시 다시 수집
+                for entry, update in pending:
+                    try:
+                        success, msg = update(dfs)
+                    except Exception as e:
+                        success, msg = False, str(e)
+                    if not success:
+                        # 다른 사용자가 먼저 삭제한 경우 등: 해당 작업만 건너뛰고 따로 보관
+                        rejected.append({**entry, "error": msg})
+                # 같은 트랜잭션에 묶음별 반영 완료 표시를 남겨, 저널 정리 전 종료되어도 중복 실행하지 않음
+                logged = self._applied_batches(dfs["log"]) if batches else set()
+                for batch in batches:
+                    if batch in logged: continue # 재실행/재시도로 이미 기록된 묶음
+                    count = sum(entry.get("batch") == batch for entry, _ in pending)
+                    failed = sum(entry.get("batch") == batch for entry in rejected)
+                    failed = f" (실패 {failed}건)" if failed else ""
+                    self.dm._add_log_to_dfs(dfs, self.LOG_ACTION, f"묶음 저장 {count}건{failed} [journal:{batch}]")
+                return True, ""
+
+            success, msg = self.dm.execute_transaction(replay, base_sheets=self._committed)
+            if not success:
+                # 파일이 열려있는 경우 등: 작업을 유지하고 간격을 늘려가며 다시 시도
+                self._schedule_retry(msg)
+                return False, msg
+
+            if rejected:
+                self._reject(rejected)
+            self._pending = []
+            self._committed = None
+            self._batch = None
+            self._clear_file()
+            self._retries = 0
+            self._notify_status("")
+            return True, msg
+
+    def recover(self):
+        """이전 실행에서 저장되지 못한 저널 작업을 재실행합니다. (로드 직후 호출)"""
+        if self._pending or not os.path.exists(self.path): return
+
+        entries = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line: continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        break # 기록 도중 종료된 마지막 줄
+        except OSError as e:
+            print(f"저널 읽기 실패: {e}")
+            return
+
+        applied = self._applied_batches(self.dm.df_log)
+        pending = []
+        for entry in entries:
+            if entry.get("op") not in self.OPERATIONS: continue
+            if entry.get("batch") in applied: continue # 이미 파일에 저장된 묶음
+            pending.append((entry, self._build(entry["op"], entry.get("params", {}))))
+        if not pending:
+            self._clear_file()
+            return
+
+        print(f"저장되지 않은 작업 {len(pending)}건을 복구합니다.")
+        self._committed = self.dm.file_handler.current_sheets()
+        self._committed["purchase"] = self.dm.file_handler.latest("purchase")
+        self._first_pending_at = time.monotonic()
+        self._batch = pending[-1][0].get("batch")
+        self._pending = pending
+        self.flush()
+
+    def _applied_batches(self, df_log):
+        """로그 시트의 "저널 반영" 기록에서 이미 저장된 묶음 ID를 읽습니다."""
+        if df_log.empty or "구분" not in df_log.columns: return set()
+        details = df_log.loc[df_log["구분"] == self.LOG_ACTION, "상세내용"].astype(str)
+        return {batch for text in details for match in self._BATCH_PATTERN.findall(text)
+                for batch in match.split(",")}
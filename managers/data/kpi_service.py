@@ -0,0 +1,93 @@
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from managers.data import schema
+
+PIPELINE_ORDER = ['견적', '주문', '생산중', '납품대기', '입금대기', '완료']
+# 진행 중인 주문에서 제외하는 상태
+INACTIVE_STATUSES = ['견적', '완료', '보류', '취소']
+DELIVERY_LIST_SIZE = 10
+
+
+def _contains(series, text):
+    """문자열 포함 여부. category 컬럼은 고유값에 대해서만 검사합니다."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        hits = series.cat.categories.astype(str).str.contains(text, regex=False)
+        return pd.Series(np.append(hits, False)[series.cat.codes], index=series.index)
+    return series.astype(str).str.contains(text, regex=False)
+
+
+def _column(df, col, default="-"):
+    return df[col] if col in df.columns else pd.Series(default, index=df.index)
+
+
+def compute_kpis(df, today):
+    """
+    대시보드 지표를 한 번에 계산합니다. (today: datetime)
+    - revenue: 이번 달 입금완료일 & 완료 상태 건의 합계금액 합
+    - unpaid: 미수금액 합
+    - active: 견적/완료/보류/취소가 아닌 행 수
+    - today_shipments: 출고예정일이 오늘인 행 수
+    - pipeline: 단계 -> 상태에 단계명이 포함된 행 수
+    - deliveries: 완료/취소가 아닌 출고 예정 행 (출고예정일 순, 최대 DELIVERY_LIST_SIZE건)
+    날짜 컬럼은 normalize_all에서 "YYYY-MM-DD" 문자열로 맞춰져 있으므로 문자열로 비교합니다.
+    """
+    status = _column(df, "Status", "")
+    paid_dates = _column(df, "입금완료일").astype(str)
+    ship_dates = _column(df, "출고예정일").astype(str)
+    complete = _contains(status, "완료")
+
+    this_month = (paid_dates.str[:7] == today.strftime("%Y-%m")) & complete
+    amounts = schema.to_number(_column(df, "합계금액", 0)).fillna(0)
+    unpaid = schema.to_number(_column(df, "미수금액", 0)).fillna(0)
+
+    status_counts = status.astype(str).value_counts()
+    pipeline = {stage: int(status_counts[status_counts.index.str.contains(stage, regex=False)].sum())
+                for stage in PIPELINE_ORDER}
+
+    scheduled = (ship_dates != "-") & ~complete & ~_contains(status, "취소")
+    order = np.argsort(ship_dates[scheduled].to_numpy(), kind="stable")[:DELIVERY_LIST_SIZE]
+    deliveries = df[scheduled.to_numpy()].iloc[order]
+
+    return {
+        "revenue": float(amounts[this_month].sum()),
+        "unpaid": float(unpaid.sum()),
+        "active": int((~status.isin(INACTIVE_STATUSES)).sum()),
+        "today_shipments": int((ship_dates == today.strftime("%Y-%m-%d")).sum()),
+        "pipeline": pipeline,
+        "deliveries": deliveries,
+    }
+
+
+class KpiService:
+    """
+    대시보드 지표 계산 결과를 보관합니다.
+    df_data가 교체되거나(저장/로드) 날짜가 바뀐 경우에만 다시 계산하므로,
+    대시보드로 다시 전환할 때는 같은 결과 객체를 그대로 반환합니다.
+    """
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self._lock = threading.Lock()
+        self._key = None
+        self._result = None
+
+    def get(self, today=None) -> dict:
+        """compute_kpis 결과 (수정하지 말 것)"""
+        today = today or datetime.now()
+        df = self.dm.df_data
+        with self._lock:
+            key = (df, len(df), today.date())
+            if self._key is not None and self._key[0] is df and self._key[1:] == key[1:]:
+                return self._result
+            self._result = compute_kpis(df, today)
+            self._key = key
+            return self._result
+
+    def invalidate(self):
+        """df_data를 제자리에서 수정한 경우 호출"""
+        with self._lock:
+            self._key = None
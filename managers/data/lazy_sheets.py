@@ -0,0 +1,45 @@
+class LazySheets(dict):
+    """
+    처음 접근할 때 loader(key)로 시트를 읽어 채우는 dict.
+    읽은 시트는 그대로 보관되며, 파일이 바뀌면 DataManager가 새 LazySheets로 교체합니다.
+
+    - `key in sheets` / get()은 아직 읽지 않은 시트(keys에 포함된 키)도 있는 것으로 취급합니다.
+    - 반복(for, items, len)은 이미 읽은 시트만 대상으로 합니다.
+    """
+
+    def __init__(self, loader=None, data=None, keys=()):
+        super().__init__(data or {})
+        self.loader = loader
+        self._keys = set(keys)
+
+    def __missing__(self, key):
+        if self.loader is None or key not in self._keys:
+            raise KeyError(key)
+        # 다른 스레드가 먼저 읽었다면 그 결과를 사용
+        return self.setdefault(key, self.loader(key))
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._keys
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def is_loaded(self, key):
+        return dict.__contains__(self, key)
+
+    def available_keys(self):
+        return self._keys | set(self.keys())
+
+
+class SheetProperty:
+    """DataManager.df_xxx 속성을 DataManager.sheets[key]에 연결합니다. (지연 로드 시트는 첫 접근 시 읽음)"""
+
+    def __init__(self, key):
+        self.key = key
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        return obj.sheets[self.key]
+
+    def __set__(self, obj, value):
+        obj.sheets[self.key] = value
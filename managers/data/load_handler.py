@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LoadHandler:
+    """
+    데이터 파일 읽기와 메모리 반영을 나눠서 처리합니다.
+    read_*()는 메모리를 바꾸지 않으므로 백그라운드 스레드에서 호출하고,
+    apply_*()는 UI 스레드에서 호출하여 화면이 읽는 시트/인덱스를 같은 스레드에서 교체합니다.
+    """
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+
+    def read_data(self):
+        """
+        판매/구매/생산 요청 파일을 읽기만 하고 결과를 반환합니다.
+        메모리를 변경하지 않으므로 백그라운드 스레드에서 호출한 뒤
+        UI 스레드에서 apply_loaded_data()로 반영합니다.
+        """
+        loaded = {"sales": None, "sales_msg": "", "purchase": None, "purchase_msg": "", "purchase_rowids": {}}
+
+        # 1. 판매 데이터
+        def read_sales():
+            try:
+                loaded["sales"] = self.dm.file_handler.read_data()
+            except Exception as e:
+                loaded["sales_msg"] = f"오류 발생: {e}"
+
+        # 2. 구매 데이터
+        def read_purchase():
+            purchase_mtime = self.dm.file_handler.get_mtime(self.dm.purchase_data_path)
+            loaded["purchase"], loaded["purchase_msg"] = self.dm.file_handler.load_purchase_data(loaded["purchase_rowids"])
+            if purchase_mtime is None: # 파일이 없어서 새로 만든 경우
+                purchase_mtime = self.dm.file_handler.get_mtime(self.dm.purchase_data_path)
+            loaded["purchase_mtime"] = purchase_mtime
+
+        # 3. 생산 요청 파일의 출고예정일
+        def read_production():
+            loaded["production_mtime"] = self.dm.file_handler.get_mtime(self.dm.production_request_path)
+            loaded["production_dates"] = self.dm.delivery_handler.read_production_dates()
+
+        # 세 파일을 동시에 읽음 (파싱은 loader의 작업 프로세스에서 실행되므로 가장 큰 파일 기준으로 끝남)
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="DataLoader") as executor:
+            for future in [executor.submit(func) for func in (read_sales, read_purchase, read_production)]:
+                future.result()
+        return loaded
+
+    def apply_loaded_data(self, loaded):
+        """read_data() 결과를 메모리에 반영합니다. (UI 스레드에서 호출)"""
+        sales = loaded["sales"]
+        if sales is not None:
+            self.dm.file_handler.apply_data(sales)
+
+        if loaded["purchase"] is not None:
+            self.dm.df_purchase = loaded["purchase"]
+            self.dm.file_handler.sqlite.adopt_rowids(loaded["purchase_rowids"])
+            self.dm.source_timestamps["purchase"] = loaded["purchase_mtime"] or 0.0
+            self.dm.index_handler.refresh(["purchase"])
+
+        if sales is None: return False, f"Sales Load Error: {loaded['sales_msg']}"
+        if loaded["purchase"] is None:
+            # 구매 파일 로드 실패 시 로그만 남기고 일단 진행 (판매 기능은 유지)하거나 실패 처리
+            # 여기서는 명확한 오류 확인을 위해 실패로 처리합니다.
+            return False, f"Purchase Load Error: {loaded['purchase_msg']}"
+
+        self.dm.delivery_handler.apply_production_dates(loaded["production_dates"])
+        self.dm.source_timestamps["production"] = loaded["production_mtime"] or 0.0
+        return True, "데이터 로드 완료"
+
+    def apply_and_recover(self, loaded):
+        """read_data() 결과를 반영하고 저장되지 못한 저널 작업을 복구합니다. (UI 스레드)"""
+        if not isinstance(loaded, dict): return loaded # 백그라운드 작업 오류 (False, 메시지)
+        with self.dm.lock:
+            result = self.apply_loaded_data(loaded)
+            if result[0]:
+                self.dm.journal_handler.recover()
+            return result
+
+    def is_stale(self, loaded):
+        """백그라운드에서 읽는 사이 이 프로그램이 더 최신 내용을 저장했다면 True"""
+        sales = loaded.get("sales")
+        if sales is None or sales["mtime"] is None: return False
+        return sales["mtime"] < self.dm.last_file_timestamp
+
+    def get_external_changes(self):
+        """마지막 로드/저장 이후 외부에서 변경된 데이터 파일 종류 목록 ("sales", "purchase", "production")"""
+        changed = []
+        if self.dm.file_handler.check_for_external_changes():
+            changed.append("sales")
+        sources = {"production": self.dm.production_request_path}
+        if not self.dm.file_handler.is_sqlite():
+            sources["purchase"] = self.dm.purchase_data_path
+        for source, path in sources.items():
+            mtime = self.dm.file_handler.get_mtime(path)
+            if mtime is not None and mtime > self.dm.source_timestamps.get(source, 0.0):
+                changed.append(source)
+        return changed
+
+    def read_external_changes(self):
+        """
+        외부에서 변경된 파일만 읽어서 반환합니다. (메모리 미반영, 백그라운드 호출용)
+        변경이 없으면 None, 생산 요청 파일만 바뀐 경우 출고예정일만 읽습니다.
+        """
+        changes = self.get_external_changes()
+        if not changes: return None
+        if changes == ["production"]:
+            return {"production_mtime": self.dm.file_handler.get_mtime(self.dm.production_request_path),
+                    "production_dates": self.dm.delivery_handler.read_production_dates()}
+        return self.read_data()
+
+    def apply_external_changes(self, loaded):
+        """read_external_changes() 결과를 반영합니다. (UI 스레드) 화면 갱신이 필요하면 (True, ...)"""
+        if not isinstance(loaded, dict): return False, ""
+        with self.dm.lock:
+            if self.dm.journal_handler.has_pending:
+                # 대기 중인 작업은 그룹 커밋 시 외부 변경 위에 다시 적용됨
+                return False, ""
+            if "sales" not in loaded:
+                # 출고예정일만 다시 반영 (값이 바뀐 행이 없으면 화면 갱신 생략)
+                changed = self.dm.delivery_handler.apply_production_dates(loaded["production_dates"])
+                self.dm.source_timestamps["production"] = loaded["production_mtime"] or 0.0
+                return not changed.empty, ""
+            if self.is_stale(loaded): return False, ""
+            return self.apply_loaded_data(loaded)
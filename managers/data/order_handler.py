@@ -1,54 +1,30 @@
 import pandas as pd
-from datetime import datetime
-from src.config import Config
 
 class OrderHandler:
     def __init__(self, data_manager):
         self.dm = data_manager
 
-    def _generate_sequential_id(self, df, id_col, prefix):
-        today = datetime.now().strftime("%y%m%d")
-        prefix_date = f"{prefix}-{today}-"
-        
-        max_seq = 0
-        if not df.empty and id_col in df.columns:
-            def extract_seq(val):
-                s = str(val)
-                if s.startswith(prefix_date):
-                    try: return int(s.split("-")[-1])
-                    except: return 0
-                return 0
-            
-            seqs = df[id_col].apply(extract_seq)
-            if not seqs.empty: max_seq = seqs.max()
-        
-        next_seq = max_seq + 1
-        return f"{prefix_date}{next_seq:03d}"
-
     def get_next_quote_id(self):
-        return self._generate_sequential_id(self.dm.df_data, "관리번호", "QT")
+        return self.dm.id_allocator.next_id("QT")
 
     def get_next_order_id(self):
-        return self._generate_sequential_id(self.dm.df_data, "관리번호", "OD")
+        return self.dm.id_allocator.next_id("OD")
 
     def get_status_by_req_no(self, req_no):
-        if self.dm.df_data.empty: return None
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == req_no]
-        return rows.iloc[0]["Status"] if not rows.empty else None
+        row = self.dm.index_handler.first_row("data", req_no)
+        return row["Status"] if row is not None else None
 
     def get_filtered_data(self, status_list=None, keyword=""):
         df = self.dm.df_data
         if df.empty: return df
-        if status_list: df = df[df["Status"].isin(status_list)]
-        if keyword:
-            mask = pd.Series(False, index=df.index)
-            for col in Config.SEARCH_TARGET_COLS:
-                if col in df.columns:
-                    mask |= df[col].astype(str).str.contains(keyword, case=False)
-            df = df[mask]
-        return df
+        mask = self.dm.search_index.mask(keyword, df)
+        if status_list: mask &= df["Status"].isin(status_list).to_numpy()
+        return df[mask]
 
     def add_order(self, order_rows: list[dict], mgmt_no: str, client_name: str) -> tuple[bool, str]:
+        return self.dm.journal_handler.submit("add_order", {"order_rows": order_rows, "mgmt_no": mgmt_no, "client_name": client_name})
+
+    def build_add_order(self, order_rows, mgmt_no, client_name):
         def update(dfs):
             # Initialize new status columns
             for row in order_rows:
@@ -60,12 +36,12 @@ class OrderHandler:
                 dfs["data"] = pd.concat([dfs["data"], new_df], ignore_index=True)
             self.dm.log_handler.add_log_to_dfs(dfs, "주문 등록", f"번호 [{mgmt_no}] / 업체 [{client_name}]")
             return True, ""
-        return self.dm.execute_transaction(update)
+        return update
 
     def update_order(self, mgmt_no: str, order_rows: list[dict], client_name: str, is_copy=False) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            existing_rows = dfs["data"][mask]
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            existing_rows = dfs["data"].loc[labels]
             
             if not existing_rows.empty:
                 first_exist = existing_rows.iloc[0]
@@ -75,7 +51,7 @@ class OrderHandler:
                         if col not in row:
                             row[col] = first_exist.get(col, "-")
             
-            dfs["data"] = dfs["data"][~mask]
+            dfs["data"] = dfs["data"].drop(index=labels)
             
             new_df = pd.DataFrame(order_rows)
             if not new_df.dropna(how='all').empty:
@@ -88,10 +64,10 @@ class OrderHandler:
 
     def delete_order(self, mgmt_no: str) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "데이터를 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            if labels.empty: return False, "데이터를 찾을 수 없습니다."
             
-            dfs["data"] = dfs["data"][~mask]
+            dfs["data"] = dfs["data"].drop(index=labels)
             self.dm.log_handler.add_log_to_dfs(dfs, "삭제", f"주문 삭제: 번호 [{mgmt_no}]")
             return True, ""
         return self.dm.execute_transaction(update)
@@ -107,8 +83,8 @@ class OrderHandler:
 
     def update_quote(self, mgmt_no: str, quote_rows: list[dict], client_name: str, is_copy=False) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            existing_rows = dfs["data"][mask]
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            existing_rows = dfs["data"].loc[labels]
             
             if not existing_rows.empty:
                 first_exist = existing_rows.iloc[0]
@@ -119,7 +95,7 @@ class OrderHandler:
                         if col not in row:
                             row[col] = first_exist.get(col, "-")
             
-            dfs["data"] = dfs["data"][~mask]
+            dfs["data"] = dfs["data"].drop(index=labels)
             
             new_df = pd.DataFrame(quote_rows)
             if not new_df.dropna(how='all').empty:
@@ -132,10 +108,10 @@ class OrderHandler:
 
     def delete_quote(self, mgmt_no: str) -> tuple[bool, str]:
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "데이터를 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            if labels.empty: return False, "데이터를 찾을 수 없습니다."
             
-            dfs["data"] = dfs["data"][~mask]
+            dfs["data"] = dfs["data"].drop(index=labels)
             self.dm.log_handler.add_log_to_dfs(dfs, "삭제", f"견적 삭제: 번호 [{mgmt_no}]")
             return True, ""
         return self.dm.execute_transaction(update)
@@ -166,51 +142,63 @@ class OrderHandler:
         return self.dm.execute_transaction(update)
 
     def update_status(self, mgmt_no: str, new_status: str, updates: dict = None) -> tuple[bool, str]:
+        return self.dm.journal_handler.submit("update_status", {"mgmt_no": mgmt_no, "new_status": new_status, "updates": updates})
+
+    def build_update_status(self, mgmt_no, new_status, updates=None):
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "항목을 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            if labels.empty: return False, "항목을 찾을 수 없습니다."
             
-            old_status = dfs["data"].loc[mask, "Status"].iloc[0]
-            dfs["data"].loc[mask, "Status"] = new_status
+            old_status = dfs["data"].loc[labels, "Status"].iloc[0]
+            dfs["data"].loc[labels, "Status"] = new_status
             
             if updates:
                 for key, value in updates.items():
                     if key in dfs["data"].columns:
-                         dfs["data"].loc[mask, key] = value
+                         dfs["data"].loc[labels, key] = value
+                self.dm.index_handler.columns_changed("data", dfs["data"], updates)
             
             self.dm.log_handler.add_log_to_dfs(dfs, "상태 변경", f"번호 [{mgmt_no}] : {old_status} -> {new_status}")
             return True, ""
-        return self.dm.execute_transaction(update)
+        return update
 
     def update_order_fields(self, mgmt_no: str, updates: dict) -> tuple[bool, str]:
+        return self.dm.journal_handler.submit("update_order_fields", {"mgmt_no": mgmt_no, "updates": updates})
+
+    def build_update_order_fields(self, mgmt_no, updates):
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "항목을 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            if labels.empty: return False, "항목을 찾을 수 없습니다."
             
             for key, value in updates.items():
                 if key in dfs["data"].columns:
-                    dfs["data"].loc[mask, key] = value
+                    dfs["data"].loc[labels, key] = value
+            self.dm.index_handler.columns_changed("data", dfs["data"], updates)
             
             # 로그는 선택사항이지만 남기는 것이 좋음
             self.dm.log_handler.add_log_to_dfs(dfs, "정보 업데이트", f"번호 [{mgmt_no}] 필드 업데이트")
             return True, ""
-        return self.dm.execute_transaction(update)
+        return update
 
     def confirm_order(self, mgmt_no: str, confirm_data: dict) -> tuple[bool, str]:
+        return self.dm.journal_handler.submit("confirm_order", {"mgmt_no": mgmt_no, "confirm_data": confirm_data})
+
+    def build_confirm_order(self, mgmt_no, confirm_data):
         def update(dfs):
-            mask = dfs["data"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "항목을 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("data", mgmt_no, dfs["data"])
+            if labels.empty: return False, "항목을 찾을 수 없습니다."
             
             # Update Statuses
-            dfs["data"].loc[mask, "Status"] = "주문"
-            dfs["data"].loc[mask, "Delivery Status"] = "대기"
-            dfs["data"].loc[mask, "Payment Status"] = "대기"
+            dfs["data"].loc[labels, "Status"] = "주문"
+            dfs["data"].loc[labels, "Delivery Status"] = "대기"
+            dfs["data"].loc[labels, "Payment Status"] = "대기"
             
             # Update additional data
             for key, value in confirm_data.items():
                 if key in dfs["data"].columns:
-                    dfs["data"].loc[mask, key] = value
+                    dfs["data"].loc[labels, key] = value
+            self.dm.index_handler.columns_changed("data", dfs["data"], confirm_data)
             
             self.dm.log_handler.add_log_to_dfs(dfs, "주문 확정", f"번호 [{mgmt_no}] 주문 확정 처리")
             return True, ""
-        return self.dm.execute_transaction(update)
+        return update
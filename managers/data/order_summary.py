@@ -0,0 +1,111 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from managers.data import schema
+
+# 합계를 구하는 숫자 컬럼 -> 요약 컬럼명
+SUM_COLS = {"수량": "수량합계", "공급가액": "공급가액합계", "합계금액": "합계금액합계"}
+
+
+def summarize_orders(frame, key="관리번호"):
+    """
+    관리번호별 요약 행을 만듭니다. (관리번호 첫 등장 순서, index = 관리번호)
+    - 원래 컬럼: 각 건의 첫 행 값 (모델명 = 첫 모델, Status = 첫 행 상태)
+    - 품목수
+    - 수량합계 / 공급가액합계 / 합계금액합계 (쉼표 제거 후 숫자, 변환 실패 시 0)
+    - 대표상태: 가장 많은 품목의 상태 (같으면 먼저 나온 상태)
+    - 최초출고예정일: "-"/빈 값을 제외한 가장 이른 출고예정일 (없으면 NaN)
+    """
+    if key not in frame.columns:
+        return frame.iloc[0:0]
+    keys = frame[key]
+    summary = frame[~keys.duplicated()].set_index(keys[~keys.duplicated()].rename(None))
+    grouped = lambda s: s.groupby(keys, sort=False, dropna=False)
+
+    summary["품목수"] = keys.value_counts(dropna=False)
+    for col, name in SUM_COLS.items():
+        if col in frame.columns:
+            summary[name] = grouped(schema.to_number(frame[col]).fillna(0)).sum()
+
+    if "Status" in frame.columns:
+        counts = pd.DataFrame({"key": keys.to_numpy(), "status": frame["Status"].to_numpy(),
+                               "pos": np.arange(len(frame))})
+        counts = counts.groupby(["key", "status"], sort=False, dropna=False)["pos"].agg(["size", "min"])
+        counts = counts.reset_index().sort_values(["size", "min"], ascending=[False, True], kind="stable")
+        majority = counts.drop_duplicates("key").set_index("key")["status"]
+        summary["대표상태"] = majority
+
+    if "출고예정일" in frame.columns:
+        dates = frame["출고예정일"].astype(str).str.strip()
+        valid = ~dates.isin(["", "-", "nan", "NaT", "None"])
+        # 문자열 groupby min은 느리므로 정렬 후 건별 첫 값 사용
+        earliest = pd.DataFrame({"key": keys[valid].to_numpy(), "date": dates[valid].to_numpy()})
+        earliest = earliest.sort_values("date", kind="stable").drop_duplicates("key").set_index("key")["date"]
+        summary["최초출고예정일"] = earliest
+    return summary
+
+
+class OrderSummary:
+    """
+    Data 시트의 관리번호별 요약 테이블 (주문별 목록, 칸반, 달력에서 공용).
+    df_data가 교체되면 건별 지문(행 해시 합)을 비교하여 바뀐 건만 다시 요약합니다.
+    """
+
+    # 바뀐 건이 이 비율을 넘으면 전체를 다시 요약
+    FULL_REBUILD_RATIO = 0.5
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self._lock = threading.Lock()
+        self._df = None
+        self._len = -1
+        self._summary = None
+        self._fingerprints = pd.Series(dtype="uint64")
+
+    @staticmethod
+    def _fingerprints_of(df, key="관리번호"):
+        """건별 지문: 행 값과 건 내 순번의 해시 합"""
+        keys = df[key]
+        rows = df.assign(__line__=keys.groupby(keys, sort=False, dropna=False).cumcount())
+        hashes = pd.util.hash_pandas_object(rows, index=False)
+        return hashes.groupby(keys.to_numpy(), sort=False, dropna=False).sum()
+
+    def get(self) -> pd.DataFrame:
+        """관리번호별 요약 DataFrame (수정하지 말 것)"""
+        df = self.dm.df_data
+        with self._lock:
+            if df is self._df and len(df) == self._len:
+                return self._summary
+            self._summary = self._update(df)
+            self._df, self._len = df, len(df)
+            return self._summary
+
+    def invalidate(self):
+        """df_data를 제자리에서 수정한 경우 호출 (다음 조회 때 지문 비교로 바뀐 건만 다시 요약)"""
+        with self._lock:
+            self._df = None
+
+    def _update(self, df):
+        if "관리번호" not in df.columns:
+            self._fingerprints = pd.Series(dtype="uint64")
+            return summarize_orders(df)
+
+        fingerprints = self._fingerprints_of(df)
+        previous, self._fingerprints = self._fingerprints, fingerprints
+        if self._summary is None or previous.empty:
+            return summarize_orders(df)
+
+        # 새로 생긴 건은 지문 0과 비교되어 바뀐 건으로 분류됨
+        old = previous.reindex(fingerprints.index, fill_value=0)
+        changed = fingerprints.index[old.to_numpy() != fingerprints.to_numpy()]
+        if len(changed) > len(fingerprints) * self.FULL_REBUILD_RATIO:
+            return summarize_orders(df)
+
+        # 바뀐 건만 다시 요약하고 나머지는 기존 요약 재사용 (삭제된 건은 reindex로 빠짐)
+        kept = self._summary[~self._summary.index.isin(changed)]
+        if len(changed):
+            fresh = summarize_orders(df[df["관리번호"].isin(changed)])
+            kept = pd.concat([kept, fresh])
+        return kept.reindex(fingerprints.index)
@@ -0,0 +1,100 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from src.config import Config
+
+
+def parse_excel_sheets(path, sheet_names):
+    """(작업 프로세스) 통합문서를 한 번 열어 시트들을 읽습니다. 없는 시트는 None으로 반환합니다."""
+    dfs = {}
+    with open(path, "rb") as f:
+        with pd.ExcelFile(f, engine="openpyxl") as xls:
+            for name in sheet_names:
+                dfs[name] = pd.read_excel(xls, name) if name in xls.sheet_names else None
+    return dfs
+
+
+class ParallelLoader:
+    """
+    엑셀 파싱(openpyxl)은 GIL을 잡는 CPU 작업이라 스레드로는 동시에 실행되지 않으므로
+    작업 프로세스 풀에서 실행합니다. 풀은 처음 필요할 때 만들어 재사용합니다.
+    프로세스 시작 비용보다 파싱이 짧은 작은 파일(min_size 미만)이나 풀을 쓸 수 없는 환경에서는
+    호출한 스레드에서 바로 실행합니다.
+    """
+
+    def __init__(self, max_workers=Config.LOAD_WORKERS, min_size=Config.PARALLEL_LOAD_MIN_SIZE):
+        self.enabled = Config.PARALLEL_LOAD
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self.min_size = min_size
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _should_use_pool(self, path):
+        if not self.enabled: return False
+        try:
+            return os.path.getsize(path) >= self.min_size
+        except OSError:
+            return False
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None and self.enabled:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _disable(self, error):
+        print(f"병렬 로드 사용 불가 (순차 로드 사용): {error}")
+        self.enabled = False
+        self.shutdown()
+
+    def submit(self, func, path, *args) -> Future:
+        """func(path, *args)를 작업 프로세스에서 실행합니다. func는 모듈 최상위 함수여야 합니다."""
+        if self._should_use_pool(path):
+            try:
+                pool = self._get_pool()
+                if pool is not None:
+                    return pool.submit(func, path, *args)
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                self._disable(e)
+
+        future = Future()
+        try:
+            future.set_result(func(path, *args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def run_all(self, calls):
+        """[(func, path, *args), ...]를 동시에 실행하고 결과를 같은 순서의 리스트로 반환합니다."""
+        futures = [self.submit(*call) for call in calls]
+        results = []
+        for call, future in zip(calls, futures):
+            try:
+                results.append(future.result())
+            except BrokenProcessPool as e:
+                # 작업 프로세스가 비정상 종료된 경우 현재 스레드에서 다시 실행
+                self._disable(e)
+                results.append(call[0](*call[1:]))
+        return results
+
+    def read_excel_sheets(self, path, sheet_names) -> dict:
+        """시트별로 동시에 읽어 {시트명: DataFrame 또는 None}을 반환합니다."""
+        if self._should_use_pool(path):
+            calls = [(parse_excel_sheets, path, [name]) for name in sheet_names]
+        else:
+            # 작은 파일은 한 번만 열어서 순서대로 읽음
+            calls = [(parse_excel_sheets, path, list(sheet_names))]
+        dfs = {}
+        for result in self.run_all(calls):
+            dfs.update(result)
+        return dfs
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -1,74 +1,92 @@
 import getpass
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from managers.data import schema
+
 class PaymentHandler:
     def __init__(self, data_manager):
         self.dm = data_manager
 
-    def recalc_payment_status(self, dfs, mgmt_no):
-        pay_df = dfs["payment"]
-        if pay_df.empty:
-            total_paid = 0
-            last_pay_date = "-"
+    @staticmethod
+    def _allocate_sequential(paid, totals):
+        """음수(할인/조정) 품목이 섞인 주문용: 기존 방식대로 품목 순서대로 입금액을 배분합니다."""
+        remaining = paid
+        allocated = []
+        for row_total in totals:
+            alloc = row_total if remaining >= row_total else max(remaining, 0)
+            allocated.append(alloc)
+            remaining -= alloc
+        return allocated
+
+    def recalc_all_payment_status(self, dfs, mgmt_nos=None):
+        """
+        mgmt_nos(None이면 전체)의 기수금액/미수금액/Payment Status/입금완료일을 한 번에 재계산합니다.
+        입금 합계는 관리번호별로 집계한 뒤 품목 순서대로(FIFO) 배분하며,
+        모든 품목이 입금/납품 완료된 주문은 Status를 "회계처리"로 변경합니다.
+        """
+        data_df = dfs["data"]
+        if data_df.empty or "관리번호" not in data_df.columns: return
+
+        keys = data_df["관리번호"].astype(str)
+        if mgmt_nos is None:
+            target = pd.Series(True, index=data_df.index)
         else:
-            target_pays = pay_df[pay_df["관리번호"].astype(str) == str(mgmt_no)]
-            paid_series = target_pays["입금액"].astype(str).str.replace(",", "").replace("nan", "0")
-            total_paid = pd.to_numeric(paid_series, errors='coerce').sum()
-            
-            if not target_pays.empty:
-                target_pays = target_pays.sort_values(by="일시", ascending=False)
-                last_pay_date = target_pays.iloc[0]["일시"].split(" ")[0]
-            else:
-                last_pay_date = "-"
+            target = keys.isin({str(m) for m in mgmt_nos})
+        if not target.any(): return
+
+        row_index = data_df.index[target.values]
+        row_keys = keys[target]
+
+        # 1. 관리번호별 입금 합계 및 최근 입금일
+        paid = pd.Series(dtype=float)
+        last_pay_date = pd.Series(dtype=object)
+        pay_df = dfs.get("payment")
+        if pay_df is not None and not pay_df.empty and "관리번호" in pay_df.columns:
+            pay_keys = pay_df["관리번호"].astype(str)
+            in_target = pay_keys.isin(set(row_keys))
+            pays = pay_df[in_target]
+            if not pays.empty:
+                pay_keys = pay_keys[in_target]
+                paid = schema.to_number(pays["입금액"]).groupby(pay_keys).sum()
+                last_pay_date = pays["일시"].astype(str).groupby(pay_keys).max().str.split(" ").str[0]
+
+        # 2. 품목별 FIFO 배분: 앞 품목 합계를 뺀 나머지를 0 ~ 품목 합계 범위로 제한
+        totals = schema.to_number(data_df.loc[row_index, "합계금액"]).fillna(0)
+        order_paid = row_keys.map(paid).fillna(0)
+        before = totals.groupby(row_keys, sort=False).cumsum() - totals
+        allocated = np.minimum((order_paid - before).clip(lower=0), totals)
+
+        negative_orders = set(row_keys[totals < 0])
+        for mgmt_no in negative_orders:
+            sel = (row_keys == mgmt_no).values
+            allocated.loc[sel] = self._allocate_sequential(order_paid[sel].iloc[0], totals[sel].tolist())
+
+        unpaid = totals - allocated
+        is_paid = unpaid < 1
+        paid_index = row_index[is_paid.values]
+
+        data_df.loc[row_index, "기수금액"] = allocated.values
+        data_df.loc[row_index, "미수금액"] = unpaid.values
+        data_df.loc[row_index, "Payment Status"] = np.where(is_paid.values, "완료", "대기")
+        if len(paid_index):
+            data_df.loc[paid_index, "입금완료일"] = row_keys[is_paid].map(last_pay_date).fillna("-").values
+
+        # 3. 입금/납품이 모두 완료된 주문은 "회계처리"로 변경
+        if "Delivery Status" in data_df.columns:
+            done = ((data_df.loc[row_index, "Payment Status"] == "완료") &
+                    (data_df.loc[row_index, "Delivery Status"] == "완료"))
+            order_done = done.groupby(row_keys).transform("all")
+            data_df.loc[row_index[order_done.values], "Status"] = "회계처리"
 
-        data_df = dfs["data"]
-        mask = data_df["관리번호"] == mgmt_no
-        indices = data_df[mask].index
-        
-        if len(indices) == 0: return
-
-        amt_series = data_df.loc[mask, "합계금액"].astype(str).str.replace(",", "").replace("nan", "0")
-        total_contract_amt = pd.to_numeric(amt_series, errors='coerce').sum()
-        
-        remaining_to_allocate = total_paid
-        
-        for idx in indices:
-            val_str = str(data_df.at[idx, "합계금액"]).replace(",", "")
-            try: row_total = float(val_str)
-            except: row_total = 0
-            
-            if remaining_to_allocate >= row_total:
-                allocated = row_total
-            else:
-                allocated = remaining_to_allocate
-                if allocated < 0: allocated = 0
-            
-            data_df.at[idx, "기수금액"] = allocated
-            data_df.at[idx, "미수금액"] = row_total - allocated
-            
-            remaining_to_allocate -= allocated
-            
-            try: row_unpaid = float(data_df.at[idx, "미수금액"])
-            except: row_unpaid = 0
-            
-            if row_unpaid < 1:
-                data_df.at[idx, "Payment Status"] = "완료"
-                data_df.at[idx, "입금완료일"] = last_pay_date
-            else:
-                data_df.at[idx, "Payment Status"] = "대기"
-
-        # Check for "회계처리" status update
-        # Re-fetch rows for this mgmt_no to check overall status
-        current_rows = data_df[data_df["관리번호"] == mgmt_no]
-        if not current_rows.empty:
-            all_paid = (current_rows["Payment Status"] == "완료").all()
-            all_delivered = (current_rows["Delivery Status"] == "완료").all()
-            
-            if all_paid and all_delivered:
-                data_df.loc[current_rows.index, "Status"] = "회계처리"
+    def recalc_payment_status(self, dfs, mgmt_no):
+        self.recalc_all_payment_status(dfs, [mgmt_no])
 
     def add_payment(self, payment_data: dict) -> tuple[bool, str]:
+        return self.dm.journal_handler.submit("add_payment", {"payment_data": payment_data})
+
+    def build_add_payment(self, payment_data):
         def update(dfs):
             new_df = pd.DataFrame([payment_data])
             if not new_df.dropna(how='all').empty:
@@ -80,7 +98,42 @@ class PaymentHandler:
                 
             self.dm.log_handler.add_log_to_dfs(dfs, "입금 등록", f"관리번호: {mgmt_no}, 금액: {payment_data.get('입금액')}")
             return True, ""
-        return self.dm.execute_transaction(update)
+        return update
+
+    @staticmethod
+    def _fee_candidate(dfs, indices, payment_amount):
+        """입금 후 남는 미수금이 수수료 처리 기준 이내이면 (품목명, 차액, 통화), 아니면 None"""
+        total_unpaid = 0
+        for idx in indices:
+            try: unpaid = float(dfs["data"].at[idx, "미수금액"])
+            except: unpaid = 0
+            total_unpaid += unpaid
+
+        # 통화 확인 (첫 번째 항목 기준)
+        first_idx = indices[0]
+        currency = str(dfs["data"].at[first_idx, "통화"]).upper()
+        threshold = 200 if currency != "KRW" else 5000
+
+        diff = total_unpaid - payment_amount
+        # 차액이 양수이고(미수금 남음) 임계값 이내인 경우
+        if not 0 < diff <= threshold: return None
+
+        item_name = str(dfs["data"].at[first_idx, "품목명"])
+        if len(indices) > 1:
+            item_name += f" 외 {len(indices)-1}건"
+        return item_name, diff, currency
+
+    def check_payment_fee(self, mgmt_nos, payment_amount):
+        """
+        process_payment 전에 수수료 처리 확인이 필요한지 메모리 데이터로 미리 계산합니다. (UI 스레드)
+        확인이 필요하면 (품목명, 차액, 통화), 아니면 None
+        """
+        data = self.dm.df_data
+        mask = data["관리번호"].isin(mgmt_nos)
+        if not mask.any(): return None
+        dfs = {"data": data.copy(), "payment": self.dm.df_payment}
+        self.recalc_all_payment_status(dfs, mgmt_nos)
+        return self._fee_candidate(dfs, dfs["data"][mask].index, payment_amount)
 
     def process_payment(self, mgmt_nos, payment_amount, payment_date, file_paths, confirm_fee_callback=None):
         def update(dfs):
@@ -90,8 +143,7 @@ class PaymentHandler:
             indices = dfs["data"][mask].index
             
             # 1. 강제 재계산
-            for mgmt_no in mgmt_nos:
-                self.recalc_payment_status(dfs, mgmt_no)
+            self.recalc_all_payment_status(dfs, mgmt_nos)
 
             # 2. 배치 처리용 집계
             batch_summary = {}
@@ -99,38 +151,14 @@ class PaymentHandler:
             try: current_user = getpass.getuser()
             except: current_user = "Unknown"
 
-            # 전체 미수금액 계산
-            total_unpaid = 0
-            for idx in indices:
-                try: unpaid = float(dfs["data"].at[idx, "미수금액"])
-                except: unpaid = 0
-                total_unpaid += unpaid
-
             # 전체 차액 확인 및 수수료 결정
             remaining_deposit = payment_amount
             remaining_fee = 0
-            
-            # 통화 확인 (첫 번째 항목 기준)
-            first_idx = indices[0]
-            currency = str(dfs["data"].at[first_idx, "통화"]).upper()
-            threshold = 200 if currency != "KRW" else 5000
+            currency = str(dfs["data"].at[indices[0], "통화"]).upper()
 
-            diff = total_unpaid - payment_amount
-            
-            # 차액이 양수이고(미수금 남음) 임계값 이내인 경우
-            if 0 < diff <= threshold:
-                is_fee = False
-                if confirm_fee_callback:
-                    # 전체 항목에 대한 수수료 확인
-                    item_count = len(indices)
-                    item_name = str(dfs["data"].at[first_idx, "품목명"])
-                    if item_count > 1:
-                        item_name += f" 외 {item_count-1}건"
-                    
-                    is_fee = confirm_fee_callback(item_name, diff, currency)
-                
-                if is_fee:
-                    remaining_fee = diff
+            fee = self._fee_candidate(dfs, indices, payment_amount)
+            if fee and confirm_fee_callback and confirm_fee_callback(*fee):
+                remaining_fee = fee[1]
 
             # 3. 입금 및 수수료 배분
             for idx in indices:
@@ -210,8 +238,7 @@ class PaymentHandler:
                     dfs["payment"] = pd.concat([dfs["payment"], payment_df_new], ignore_index=True)
 
             # 5. 최종 재계산
-            for mgmt_no in mgmt_nos:
-                self.recalc_payment_status(dfs, mgmt_no)
+            self.recalc_all_payment_status(dfs, mgmt_nos)
 
             mgmt_str = mgmt_nos[0]
             if len(mgmt_nos) > 1: mgmt_str += f" 외 {len(mgmt_nos)-1}건"
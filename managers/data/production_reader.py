@@ -0,0 +1,75 @@
+import threading
+from datetime import datetime
+
+import openpyxl
+
+
+def parse_production_request(path):
+    """
+    (작업 프로세스) 생산 요청 파일의 Data 시트를 한 번만 훑어 필요한 정보를 모두 읽습니다.
+    Data 시트가 없으면 None을 반환합니다.
+    - dates: 관리번호 -> 출고예정일 (I열)
+    - status: 관리번호 -> 생산 상태 (N열)
+    - serials: (관리번호, 모델명, Description) -> 시리얼번호 (K열)
+    """
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        if "Data" not in wb.sheetnames: return None
+        dates, status, serials = {}, {}, {}
+
+        for row in wb["Data"].iter_rows(min_row=2, values_only=True):
+            if not row or not row[0]: continue
+
+            if len(row) > 8 and row[8]:
+                delivery_date = row[8]
+                if isinstance(delivery_date, datetime):
+                    date_str = delivery_date.strftime("%Y-%m-%d")
+                else:
+                    date_str = str(delivery_date).strip()
+                if date_str and date_str.lower() != "nan" and date_str != "-":
+                    dates[str(row[0])] = date_str
+
+            mgmt_no = str(row[0]).strip()
+            if not mgmt_no: continue
+            if len(row) >= 14:
+                status[mgmt_no] = str(row[13]).strip() if row[13] else "-"
+            if len(row) >= 11:
+                model = str(row[2]).strip() if row[2] else ""
+                desc = str(row[3]).strip() if row[3] else ""
+                serials[(mgmt_no, model, desc)] = str(row[10]).strip() if row[10] else "-"
+
+        return {"dates": dates, "status": status, "serials": serials}
+    finally:
+        wb.close()
+
+
+class ProductionReader:
+    """
+    생산 요청 파일을 읽은 결과를 파일의 (수정시각, 크기) 기준으로 보관합니다.
+    파일이 바뀌지 않았다면 로드/팝업을 여러 번 열어도 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self._lock = threading.Lock()
+        self._signature = None
+        self._parsed = None
+
+    def read(self):
+        """파싱 결과 dict를 반환합니다. 파일이 없거나 읽지 못하면 None (반환값은 수정하지 말 것)"""
+        path = self.dm.production_request_path
+        signature = self.dm.file_handler.snapshot.signature(path)
+        if signature is None: return None
+
+        with self._lock:
+            if signature == self._signature:
+                return self._parsed
+            # 판매/구매 파일과 동시에 파싱되도록 작업 프로세스에서 읽음
+            parsed = self.dm.loader.run_all([(parse_production_request, path)])[0]
+            self._signature, self._parsed = signature, parsed
+            return parsed
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+            self._parsed = None
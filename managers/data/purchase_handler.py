@@ -1,32 +1,12 @@
 import pandas as pd
-from datetime import datetime
 from src.config import Config
 
 class PurchaseHandler:
     def __init__(self, data_manager):
         self.dm = data_manager
 
-    def _generate_sequential_id(self, df, id_col, prefix):
-        today = datetime.now().strftime("%y%m%d")
-        prefix_date = f"{prefix}-{today}-"
-        
-        max_seq = 0
-        if not df.empty and id_col in df.columns:
-            def extract_seq(val):
-                s = str(val)
-                if s.startswith(prefix_date):
-                    try: return int(s.split("-")[-1])
-                    except: return 0
-                return 0
-            
-            seqs = df[id_col].apply(extract_seq)
-            if not seqs.empty: max_seq = seqs.max()
-        
-        next_seq = max_seq + 1
-        return f"{prefix_date}{next_seq:03d}"
-
     def get_next_purchase_id(self):
-        return self._generate_sequential_id(self.dm.df_purchase, "관리번호", "PU")
+        return self.dm.id_allocator.next_id("PU")
 
     def add_purchase(self, rows: list[dict]) -> tuple[bool, str]:
         def update(dfs):
@@ -51,9 +31,9 @@ class PurchaseHandler:
             if "purchase" not in dfs:
                 return False, "구매 데이터가 로드되지 않았습니다."
 
-            mask = dfs["purchase"]["관리번호"] == mgmt_no
+            labels = self.dm.index_handler.labels("purchase", mgmt_no, dfs["purchase"])
             # 기존 데이터 삭제 (덮어쓰기 위해)
-            dfs["purchase"] = dfs["purchase"][~mask]
+            dfs["purchase"] = dfs["purchase"].drop(index=labels)
             
             # 새 데이터 추가
             new_df = pd.DataFrame(rows)
@@ -72,10 +52,10 @@ class PurchaseHandler:
             if "purchase" not in dfs:
                 return False, "구매 데이터가 로드되지 않았습니다."
             
-            mask = dfs["purchase"]["관리번호"] == mgmt_no
-            if not mask.any(): return False, "삭제할 항목을 찾을 수 없습니다."
+            labels = self.dm.index_handler.labels("purchase", mgmt_no, dfs["purchase"])
+            if labels.empty: return False, "삭제할 항목을 찾을 수 없습니다."
             
-            dfs["purchase"] = dfs["purchase"][~mask]
+            dfs["purchase"] = dfs["purchase"].drop(index=labels)
             self.dm.log_handler.add_log_to_dfs(dfs, "발주 삭제", f"번호 [{mgmt_no}]")
             return True, ""
         return self.dm.execute_transaction(update)
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from src.config import Config
+
+
+def to_number(series: pd.Series) -> pd.Series:
+    """
+    숫자 Series로 변환합니다. 이미 숫자 타입이면 그대로 반환하고,
+    문자열이면 쉼표를 제거하여 변환합니다. (변환 실패 시 NaN)
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    return pd.to_numeric(series.astype(str).str.replace(",", ""), errors="coerce")
+
+
+def to_float(value, default=0.0) -> float:
+    """단일 값을 숫자로 변환합니다. (쉼표 허용, 빈 값/NaN/변환 실패 시 default)"""
+    if isinstance(value, (int, float)):
+        return default if pd.isna(value) else float(value)
+    try:
+        return float(str(value).replace(",", "") or default)
+    except ValueError:
+        return default
+
+
+def apply_data_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정규화된 Data 시트에 컬럼 타입을 적용합니다.
+    - Config.DATA_NUMBER_COLS: float64 (이후 문자열 -> 숫자 재변환 불필요)
+    - Config.DATA_CATEGORY_COLS: category (반복 값이 많아 메모리 절감)
+    날짜 컬럼은 기존 화면/엑셀 코드와 맞추어 "YYYY-MM-DD" 문자열로 유지합니다.
+    """
+    for col in Config.DATA_NUMBER_COLS:
+        if col in df.columns:
+            df[col] = to_number(df[col]).fillna(0).astype("float64")
+    for col in Config.DATA_CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _plain(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(series.cat.categories.dtype)
+    return series
+
+
+def editable(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    트랜잭션용 사본. category 컬럼에는 새 값을 넣을 수 없으므로 원래 타입으로 되돌립니다.
+    (저장 시 normalize_all에서 다시 category로 변환)
+    """
+    df = df.copy()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = _plain(df[col])
+    return df
+
+
+def sheets_equal(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """두 시트의 값이 같은지 비교합니다. (category 여부는 무시)"""
+    if a.equals(b): return True
+    if a.shape != b.shape or not a.columns.equals(b.columns) or not a.index.equals(b.index):
+        return False
+    return all(_plain(a[col]).equals(_plain(b[col])) for col in a.columns)
@@ -0,0 +1,169 @@
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.config import Config
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _ColumnIndex:
+    """
+    컬럼 하나의 검색 인덱스.
+    같은 값(업체명, 모델명 등)이 여러 행에 반복되므로 고유값 사전(vocab)에 대해서만
+    3-gram 역색인을 만들고, 행마다 고유값 번호(codes)를 보관합니다.
+    """
+
+    def __init__(self):
+        self.values = []      # 고유값 번호 -> 소문자 문자열
+        self.value_ids = {}   # 소문자 문자열 -> 고유값 번호
+        self.postings = {}    # 3-gram -> {고유값 번호}
+        self.codes = np.empty(0, dtype=np.int64)
+        self._joined_text = None
+        self._starts = None
+
+    def update(self, texts: pd.Series):
+        """행 문자열을 반영합니다. 처음 보는 값만 역색인에 추가합니다."""
+        new_values = pd.unique(texts[~texts.isin(self.value_ids)])
+        for value in new_values:
+            value_id = len(self.values)
+            self.values.append(value)
+            self.value_ids[value] = value_id
+            for gram in _trigrams(value):
+                self.postings.setdefault(gram, set()).add(value_id)
+        self.codes = texts.map(self.value_ids).to_numpy(dtype=np.int64)
+
+    def _joined(self):
+        """1~2글자 검색용: 고유값을 한 문자열로 이어 붙이고 각 값의 시작 위치를 보관"""
+        if self._joined_text is None or len(self._starts) != len(self.values):
+            self._starts = np.cumsum([0] + [len(v) + 1 for v in self.values[:-1]]) if self.values else np.empty(0, dtype=np.int64)
+            self._joined_text = "\n".join(self.values)
+        return self._joined_text, self._starts
+
+    def match(self, keyword, grams, rows=None) -> np.ndarray:
+        """keyword(3-gram 집합 grams)를 포함하는 행이면 True인 배열 (rows: 검사할 행 위치, 생략 시 전체)"""
+        if grams:
+            # 작은 목록부터 교집합
+            postings = sorted((self.postings.get(gram, ()) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                if not candidates: break
+                candidates &= ids
+            value_ids = [i for i in candidates if keyword in self.values[i]]
+        else:
+            # 1~2글자는 이어 붙인 고유값 문자열에서 찾아 값 번호로 변환
+            text, starts = self._joined()
+            offsets = [m.start() for m in re.finditer(re.escape(keyword), text)]
+            value_ids = np.searchsorted(starts, offsets, side="right") - 1
+        hit = np.zeros(len(self.values), dtype=bool)
+        hit[value_ids] = True
+        return hit[self.codes if rows is None else self.codes[rows]]
+
+    @property
+    def live_ratio(self):
+        if not self.values: return 1.0
+        return len(np.unique(self.codes)) / len(self.values)
+
+
+class SearchIndex:
+    """
+    Data 시트의 검색 대상 컬럼(Config.SEARCH_TARGET_COLS) 3-gram 인덱스.
+    한글도 글자 단위로 3-gram을 만들므로 부분 문자열 검색이 가능합니다. (대소문자 무시)
+    로드 시 만들고, 저장으로 df_data가 교체되면 새로 나온 값만 추가하여 갱신합니다.
+    """
+
+    # 더 이상 쓰이지 않는 고유값이 이 비율을 넘으면 새로 만듦
+    MIN_LIVE_RATIO = 0.5
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        self._lock = threading.Lock()
+        self._columns = {}
+        self._df = None
+        self._len = -1
+
+    @staticmethod
+    def _texts(df, col):
+        if col not in df.columns:
+            return pd.Series([""] * len(df))
+        return df[col].astype(str).str.lower().reset_index(drop=True)
+
+    def update(self, df=None):
+        """df(기본: 메모리의 df_data) 기준으로 인덱스를 갱신합니다."""
+        if df is None: df = self.dm.df_data
+        with self._lock:
+            self._update_locked(df)
+
+    def _update_locked(self, df):
+        if df is self._df and len(df) == self._len: return
+        for col in Config.SEARCH_TARGET_COLS:
+            index = self._columns.get(col)
+            if index is None or index.live_ratio < self.MIN_LIVE_RATIO:
+                index = self._columns[col] = _ColumnIndex()
+            index.update(self._texts(df, col))
+        self._df, self._len = df, len(df)
+
+    def mask(self, keyword, df=None, rows=None) -> np.ndarray:
+        """
+        df 행 순서대로 keyword가 검색 대상 컬럼 중 하나에 포함되면 True인 배열.
+        rows(행 위치 배열)를 주면 해당 행만 검사하여 rows 순서대로의 배열을 반환합니다.
+        """
+        if df is None: df = self.dm.df_data
+        size = len(df) if rows is None else len(rows)
+        keyword = str(keyword).lower().strip()
+        if not keyword: return np.ones(size, dtype=bool)
+
+        grams = _trigrams(keyword)
+        # 갱신과 검사를 한 번의 잠금 안에서 수행 (사이에 다른 스레드가 다른 df로 갱신하지 못하도록)
+        with self._lock:
+            self._update_locked(df)
+            result = np.zeros(size, dtype=bool)
+            for index in self._columns.values():
+                result |= index.match(keyword, grams, rows)
+            return result
+
+    def search(self, keyword, df=None) -> np.ndarray:
+        """keyword와 일치하는 행 위치 배열"""
+        return np.flatnonzero(self.mask(keyword, df))
+
+
+class IncrementalSearch:
+    """
+    입력 중 검색(search-as-you-type)용 상태.
+    검색어가 직전에 끝까지 찾은 검색어로 시작하면 직전 결과 행 안에서만 다시 찾습니다.
+    df나 scope(상태 필터 등 검색 범위 조건)가 바뀌면 처음부터 찾습니다.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._last = None  # (df, 행 수, scope, 검색어, 결과 행 위치)
+
+    @staticmethod
+    def normalize(keyword):
+        return str(keyword).lower().strip()
+
+    def candidates(self, keyword, df, base_rows, scope=None) -> np.ndarray:
+        """keyword로 검사할 행 위치 배열 (직전 결과로 좁힐 수 있으면 직전 결과, 아니면 base_rows)"""
+        keyword = self.normalize(keyword)
+        if self._last is not None:
+            last_df, last_len, last_scope, last_keyword, last_rows = self._last
+            if last_df is df and last_len == len(df) and last_scope == scope and keyword.startswith(last_keyword):
+                return last_rows
+        return base_rows
+
+    def match(self, keyword, df, rows) -> np.ndarray:
+        """rows 중 keyword와 일치하는 행 위치"""
+        keyword = self.normalize(keyword)
+        if not keyword: return rows
+        return rows[self.index.mask(keyword, df, rows)]
+
+    def commit(self, keyword, df, rows, scope=None):
+        """끝까지 찾은 결과를 다음 검색의 기준으로 기억합니다."""
+        self._last = (df, len(df), scope, self.normalize(keyword), rows)
+
+    def reset(self):
+        self._last = None
@@ -0,0 +1,68 @@
+import os
+import pickle
+import hashlib
+
+from src.config import Config
+
+
+class SnapshotCache:
+    """
+    정규화가 끝난 DataFrame을 로컬 디스크에 pickle로 보관하는 캐시.
+    원본 파일의 (경로, 수정시각, 크기)가 같을 때만 스냅샷을 사용하고,
+    하나라도 다르면 무효로 보고 원본을 다시 읽도록 None을 반환합니다.
+    """
+
+    # 정규화 로직이 바뀌면 올려서 기존 스냅샷을 모두 무효화
+    VERSION = 1
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or Config.SNAPSHOT_DIR
+
+    def signature(self, source_path):
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        return (os.path.abspath(source_path), stat.st_mtime, stat.st_size)
+
+    def _cache_file(self, source_path, name):
+        digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}_{name}.pkl")
+
+    def load(self, source_path, name, signature=None):
+        signature = signature or self.signature(source_path)
+        if signature is None: return None
+
+        cache_file = self._cache_file(source_path, name)
+        if not os.path.exists(cache_file): return None
+        try:
+            with open(cache_file, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("version") != self.VERSION or snapshot.get("signature") != signature:
+                return None
+            return snapshot["payload"]
+        except Exception as e:
+            print(f"스냅샷 로드 실패 ({name}): {e}")
+            return None
+
+    def store(self, source_path, name, payload, signature=None):
+        """signature를 생략하면 현재 원본 파일 상태로 저장합니다."""
+        signature = signature or self.signature(source_path)
+        if signature is None: return
+
+        cache_file = self._cache_file(source_path, name)
+        tmp_file = cache_file + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump({"version": self.VERSION, "signature": signature, "payload": payload}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"스냅샷 저장 실패 ({name}): {e}")
+
+    def invalidate(self, source_path, name):
+        cache_file = self._cache_file(source_path, name)
+        try:
+            if os.path.exists(cache_file): os.remove(cache_file)
+        except OSError: pass
@@ -0,0 +1,244 @@
+import os
+import sqlite3
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from src.config import Config
+
+
+class SqliteStorage:
+    """
+    SalesList/OrderList 시트를 SQLite 테이블로 저장하는 저장소 엔진.
+    테이블명은 FileHandler의 시트 키(clients, data, payment ...)와 동일합니다.
+    저장 시에는 직전 상태와 행 식별자(ROW_KEYS 컬럼 값 + 같은 값 안에서의 순번)로 행을 맞춰
+    변경된 행만 UPDATE, 새 행은 INSERT, 없어진 행은 DELETE 합니다. (중간 행을 지워도 뒤의 행은 그대로)
+    DB 파일이 없으면 빈 DB를 만들지 않고 읽기 오류로 처리합니다. (엑셀 가져오기로 먼저 옮겨야 함)
+    """
+
+    TABLE_KEYS = ["clients", "data", "payment", "delivery", "log", "memo", "memo_log", "tax_invoice", "purchase"]
+
+    # 조회가 많은 컬럼 인덱스 (테이블, 컬럼)
+    INDEXES = [
+        ("clients", "업체명"),
+        ("data", "관리번호"), ("data", "업체명"), ("data", "Status"),
+        ("payment", "관리번호"),
+        ("delivery", "관리번호"),
+        ("memo", "관리번호"),
+        ("tax_invoice", "관리번호"),
+        ("purchase", "관리번호"), ("purchase", "업체명"),
+    ]
+
+    # 행 식별자 컬럼. 없는 테이블(log, memo_log)은 행 전체 값으로 맞춤
+    ROW_KEYS = {
+        "clients": "업체명", "data": "관리번호", "payment": "관리번호", "delivery": "관리번호",
+        "memo": "관리번호", "tax_invoice": "관리번호", "purchase": "관리번호",
+    }
+
+    def __init__(self, data_manager):
+        self.dm = data_manager
+        # 테이블별 행 순서 -> rowid (DataFrame의 행 위치와 1:1 대응)
+        self._rowids = {}
+
+    @property
+    def path(self):
+        return self.dm.sqlite_path
+
+    def _get_columns_for_key(self, key):
+        if key == "purchase": return Config.PURCHASE_COLUMNS
+        return self.dm.file_handler._get_columns_for_key(key)
+
+    def _require_file(self):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"SQLite DB 파일이 없습니다: {self.path} (설정에서 엑셀 데이터를 먼저 가져와 주세요)")
+
+    def _connect(self):
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # 네트워크 드라이브 공유를 고려하여 WAL 대신 기본(DELETE) 저널 모드 사용
+        conn = sqlite3.connect(self.path, timeout=15)
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn):
+        with conn:
+            for key in self.TABLE_KEYS:
+                cols = ", ".join(f'"{c}"' for c in self._get_columns_for_key(key))
+                conn.execute(f'CREATE TABLE IF NOT EXISTS "{key}" ({cols})')
+            for table, col in self.INDEXES:
+                conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_{col}" ON "{table}" ("{col}")')
+
+    def _table_columns(self, conn, table):
+        return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+    def _ensure_columns(self, conn, table, columns):
+        existing = set(self._table_columns(conn, table))
+        for col in columns:
+            if str(col) not in existing:
+                conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}"')
+
+    @staticmethod
+    def _to_sql_value(val):
+        if val is None: return None
+        if isinstance(val, (pd.Timestamp, datetime)):
+            return None if pd.isna(val) else val.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(val, date):
+            return val.strftime("%Y-%m-%d")
+        if isinstance(val, np.generic):
+            val = val.item()
+        if isinstance(val, float) and np.isnan(val): return None
+        if val is pd.NA: return None
+        return val
+
+    def _to_records(self, df):
+        return [tuple(self._to_sql_value(v) for v in row) for row in df.itertuples(index=False, name=None)]
+
+    # ---------------------------------------------------------
+    # 읽기
+    # ---------------------------------------------------------
+    def _read_table(self, conn, key, rowids=None):
+        """rowids(dict)를 넘기면 행 위치 정보를 그곳에 기록합니다. (백그라운드 읽기용)"""
+        df = pd.read_sql_query(f'SELECT rowid AS "__rowid__", * FROM "{key}" ORDER BY rowid', conn)
+        target = self._rowids if rowids is None else rowids
+        target[key] = df.pop("__rowid__").tolist()
+        return df
+
+    def adopt_rowids(self, rowids):
+        """백그라운드에서 읽은 결과를 메모리에 반영할 때 행 위치 정보도 함께 반영합니다."""
+        self._rowids.update(rowids)
+
+    def read_all_sheets(self, rowids=None, keys=None) -> dict[str, pd.DataFrame]:
+        if keys is None: keys = [key for key in self.TABLE_KEYS if key != "purchase"]
+        self._require_file()
+        try:
+            conn = self._connect()
+            try:
+                return {key: self._read_table(conn, key, rowids) for key in keys}
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error reading database: {e}")
+            return {}
+
+    def load_purchase_data(self, rowids=None):
+        try:
+            self._require_file()
+            conn = self._connect()
+            try:
+                df = self._read_table(conn, "purchase", rowids)
+            finally:
+                conn.close()
+            for col in Config.PURCHASE_COLUMNS:
+                if col not in df.columns:
+                    df[col] = ""
+            df = df.fillna("")
+            return df, "구매 데이터 로드 성공"
+        except Exception as e:
+            return None, f"구매 데이터 읽기 실패: {e}"
+
+    # ---------------------------------------------------------
+    # 쓰기
+    # ---------------------------------------------------------
+    def _insert_rows(self, conn, table, cols, records):
+        col_sql = ", ".join(f'"{c}"' for c in cols)
+        placeholders = ", ".join("?" for _ in cols)
+        sql = f'INSERT INTO "{table}" ({col_sql}) VALUES ({placeholders})'
+        rowids = []
+        for rec in records:
+            rowids.append(conn.execute(sql, rec).lastrowid)
+        return rowids
+
+    def _replace_table(self, conn, key, df):
+        conn.execute(f'DELETE FROM "{key}"')
+        self._rowids[key] = self._insert_rows(conn, key, list(df.columns), self._to_records(df))
+
+    def _row_keys(self, key, df, records):
+        """행 식별자 목록: (ROW_KEYS 컬럼 값 또는 행 전체 값, 같은 값 안에서의 순번)"""
+        col = self.ROW_KEYS.get(key)
+        values = df[col].astype(str).tolist() if col in df.columns else records
+        seen = {}
+        keys = []
+        for value in values:
+            seen[value] = seen.get(value, -1) + 1
+            keys.append((value, seen[value]))
+        return keys
+
+    def _sync_table(self, conn, key, new_df, old_df=None):
+        """
+        new_df를 테이블에 반영합니다. old_df(직전 상태, 행 위치가 rowid와 대응)의 행과 행 식별자로 맞춰
+        달라진 행만 UPDATE 하고, 새 행은 INSERT, 없어진 행은 DELETE 합니다.
+        """
+        self._ensure_columns(conn, key, new_df.columns)
+
+        rowids = self._rowids.get(key)
+        if (old_df is None or rowids is None or len(rowids) != len(old_df)
+                or list(old_df.columns) != list(new_df.columns)):
+            self._replace_table(conn, key, new_df)
+            return
+
+        cols = list(new_df.columns)
+        new_records = self._to_records(new_df)
+        old_records = self._to_records(old_df)
+        old_positions = {row_key: i for i, row_key in enumerate(self._row_keys(key, old_df, old_records))}
+
+        new_rowids, updates, inserts = [], [], []
+        for i, row_key in enumerate(self._row_keys(key, new_df, new_records)):
+            j = old_positions.pop(row_key, None)
+            if j is None:
+                inserts.append(i)
+                new_rowids.append(None)
+                continue
+            new_rowids.append(rowids[j])
+            if new_records[i] != old_records[j]:
+                updates.append(new_records[i] + (rowids[j],))
+
+        set_sql = ", ".join(f'"{c}" = ?' for c in cols)
+        if updates:
+            conn.executemany(f'UPDATE "{key}" SET {set_sql} WHERE rowid = ?', updates)
+        if old_positions:
+            conn.executemany(f'DELETE FROM "{key}" WHERE rowid = ?', [(rowids[j],) for j in old_positions.values()])
+        inserted = self._insert_rows(conn, key, cols, [new_records[i] for i in inserts])
+        for i, rowid in zip(inserts, inserted):
+            new_rowids[i] = rowid
+
+        self._rowids[key] = new_rowids
+
+    def write_sheets(self, dfs: dict[str, pd.DataFrame], keys, before=None) -> None:
+        """keys에 해당하는 테이블만 하나의 트랜잭션으로 저장합니다."""
+        if before is None: before = {}
+        conn = self._connect()
+        try:
+            with conn:
+                for key in keys:
+                    if key in dfs and key in self.TABLE_KEYS:
+                        self._sync_table(conn, key, dfs[key], before.get(key))
+        except Exception:
+            # 롤백된 경우 행 위치 정보를 신뢰할 수 없으므로 다음 저장은 전체 교체
+            self._rowids.clear()
+            raise
+        finally:
+            conn.close()
+
+    def write_all_sheets(self, dfs: dict[str, pd.DataFrame]) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                for key in self.TABLE_KEYS:
+                    if key in dfs:
+                        self._ensure_columns(conn, key, dfs[key].columns)
+                        self._replace_table(conn, key, dfs[key])
+        except Exception:
+            self._rowids.clear()
+            raise
+        finally:
+            conn.close()
+
+    def save_purchase_data(self, before=None, df=None):
+        try:
+            df = self.dm.df_purchase if df is None else df
+            self.write_sheets({"purchase": df}, ["purchase"], {"purchase": before})
+            return True, "구매 데이터 저장 완료"
+        except Exception as e:
+            return False, f"구매 데이터 저장 실패: {e}"
@@ -0,0 +1,35 @@
+import threading
+
+
+class StagedSheets:
+    """
+    작업 스레드에서 저장했지만 아직 UI 스레드에서 메모리에 반영하지 않은 시트. (키 -> DataFrame)
+    화면이 읽는 도중 DataManager의 시트가 바뀌지 않도록 반영은 UI 스레드에서 하고,
+    그 전까지 이후 작업은 get()/items()로 반영 대기 중인 시트를 기준으로 사용합니다.
+    """
+
+    def __init__(self):
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def stage(self, sheets):
+        with self._lock:
+            self._sheets.update(sheets)
+
+    def discard(self, keys):
+        """UI 스레드에서 더 새로운 결과를 반영한 시트는 대기 목록에서 뺍니다."""
+        with self._lock:
+            for key in keys: self._sheets.pop(key, None)
+
+    def take(self, sheets):
+        """sheets 중 그 사이 더 새로운 결과로 바뀌지 않은 시트만 대기 목록에서 꺼내 반환합니다."""
+        with self._lock:
+            return {key: self._sheets.pop(key) for key, df in sheets.items() if self._sheets.get(key) is df}
+
+    def get(self, key):
+        with self._lock:
+            return self._sheets.get(key)
+
+    def items(self, keys):
+        with self._lock:
+            return {key: df for key, df in self._sheets.items() if key in keys}
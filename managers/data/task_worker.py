@@ -0,0 +1,106 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class TaskWorker:
+    """
+    데이터 로드/저장 작업을 제출 순서대로 하나씩 처리하는 단일 백그라운드 스레드.
+    작업 결과 콜백과 작업중 상태 변경 알림은 UI 스레드가 process_callbacks()를
+    호출할 때 실행됩니다. (Tk 위젯은 다른 스레드에서 건드리면 안 됨)
+    """
+
+    def __init__(self, name="DataWorker"):
+        self.name = name
+        self._tasks = queue.Queue()
+        self._callbacks = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._thread = None
+        self._busy_listeners = []
+
+    @property
+    def is_busy(self):
+        return self._pending > 0
+
+    def add_busy_listener(self, listener):
+        """listener(busy: bool)는 UI 스레드에서 호출됩니다."""
+        self._busy_listeners.append(listener)
+
+    def in_worker_thread(self):
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def post(self, func, *args):
+        """func(*args)를 UI 스레드에서 실행하도록 예약합니다. (다른 스레드에서 UI에 알릴 때 사용)"""
+        self._callbacks.put((func, *args))
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def submit(self, func, *args, callback=None, **kwargs) -> Future:
+        """
+        func(*args, **kwargs)를 백그라운드에서 실행하고 Future를 반환합니다.
+        callback(result)은 UI 스레드에서 호출되며, 예외 발생 시 result는 (False, 오류 메시지)입니다.
+        """
+        future = Future()
+        with self._lock:
+            self._pending += 1
+            became_busy = self._pending == 1
+            self._ensure_thread()
+        if became_busy:
+            self._callbacks.put((self._notify_busy, True))
+        self._tasks.put((future, func, args, kwargs, callback))
+        return future
+
+    def _run(self):
+        while True:
+            item = self._tasks.get()
+            if item is None: break
+            future, func, args, kwargs, callback = item
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+                if callback:
+                    self._callbacks.put((self._invoke_callback, callback, future))
+
+            with self._lock:
+                self._pending -= 1
+                became_idle = self._pending == 0
+            if became_idle:
+                self._callbacks.put((self._notify_busy, False))
+
+    @staticmethod
+    def _invoke_callback(callback, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = (False, f"작업 오류: {e}")
+        callback(result)
+
+    def _notify_busy(self, busy):
+        for listener in self._busy_listeners:
+            listener(busy)
+
+    def process_callbacks(self):
+        """UI 스레드에서 주기적으로 호출: 완료된 작업의 콜백을 실행합니다."""
+        while True:
+            try:
+                func, *args = self._callbacks.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"작업 콜백 실패: {e}")
+
+    def shutdown(self, wait=True):
+        if self._thread is None: return
+        self._tasks.put(None)
+        if wait:
+            self._thread.join()
+        self._thread = None
@@ -1,4 +1,5 @@
 import os
+import threading
 import pandas as pd
 from src.config import Config
 
@@ -9,10 +10,32 @@ from managers.data.order_handler import OrderHandler
 from managers.data.payment_handler import PaymentHandler
 from managers.data.delivery_handler import DeliveryHandler
 from managers.data.purchase_handler import PurchaseHandler
+from managers.data.index_handler import IndexHandler
+from managers.data.search_index import SearchIndex
+from managers.data.order_summary import OrderSummary
+from managers.data.kpi_service import KpiService
+from managers.data import schema
+from managers.data.task_worker import TaskWorker
+from managers.data.parallel_loader import ParallelLoader
+from managers.data.id_allocator import IdAllocator
+from managers.data.journal_handler import JournalHandler
+from managers.data.load_handler import LoadHandler
+from managers.data.lazy_sheets import LazySheets, SheetProperty
 
 class DataManager:
+    # 판매 시트 DataFrame (self.sheets에 보관, 지연 로드 시트는 처음 접근할 때 읽음)
+    df_clients = SheetProperty("clients")
+    df_data = SheetProperty("data")
+    df_payment = SheetProperty("payment")
+    df_delivery = SheetProperty("delivery")
+    df_log = SheetProperty("log")
+    df_memo = SheetProperty("memo")
+    df_memo_log = SheetProperty("memo_log")
+    df_tax_invoice = SheetProperty("tax_invoice")
+
     def __init__(self):
         # 기존 판매 관련 DataFrame
+        self.sheets = LazySheets()
         self.df_clients = pd.DataFrame(columns=Config.CLIENT_COLUMNS)
         self.df_data = pd.DataFrame(columns=Config.DATA_COLUMNS) # Sales Data
         self.df_payment = pd.DataFrame(columns=Config.PAYMENT_COLUMNS)
@@ -30,19 +53,38 @@ class DataManager:
         self.purchase_data_path = Config.DEFAULT_PURCHASE_DATA_PATH # 구매 엑셀 경로
         self.attachment_root = Config.DEFAULT_ATTACHMENT_ROOT
         self.production_request_path = Config.DEFAULT_PRODUCTION_REQUEST_PATH
+        self.storage_engine = Config.DEFAULT_STORAGE_ENGINE # "excel" | "sqlite"
+        self.sqlite_path = Config.DEFAULT_SQLITE_PATH
+        self.group_commit = Config.DEFAULT_GROUP_COMMIT # 연속 수정 작업 묶어서 저장
         
         self.current_theme = "Dark"
         self.is_dev_mode = False
         self.last_file_timestamp = 0.0
+        # 판매 데이터 외 파일의 마지막 반영 시각 (외부 변경 감지용)
+        self.source_timestamps = {"purchase": 0.0, "production": 0.0}
         
         # Handlers
         self.file_handler = FileHandler(self)
+        self.load_handler = LoadHandler(self)
         self.log_handler = LogHandler(self)
         self.client_handler = ClientHandler(self)
         self.order_handler = OrderHandler(self)
         self.payment_handler = PaymentHandler(self)
         self.delivery_handler = DeliveryHandler(self)
         self.purchase_handler = PurchaseHandler(self)
+        self.index_handler = IndexHandler(self)
+        self.search_index = SearchIndex(self)
+        self.order_summary = OrderSummary(self)
+        self.kpi_service = KpiService(self)
+        self.journal_handler = JournalHandler(self)
+        self.id_allocator = IdAllocator(self)
+
+        # 백그라운드 작업 (저장/로드는 제출 순서대로 하나씩 처리)
+        self.worker = TaskWorker()
+        # 엑셀 파싱용 작업 프로세스 풀
+        self.loader = ParallelLoader()
+        # UI 스레드의 동기 호출과 백그라운드 작업이 동시에 데이터를 바꾸지 않도록 보호
+        self.lock = threading.RLock()
         
         self.load_config()
 
@@ -59,35 +101,79 @@ class DataManager:
         """
         판매 데이터(SalesList.xlsx)와 구매 데이터(OrderList.xlsx)를 모두 로드합니다.
         """
-        # 1. 판매 데이터 로드 (기존 로직)
-        success_sales, msg_sales = self.file_handler.load_data()
-        
-        # 2. 구매 데이터 로드 (신규 로직)
-        success_purchase, msg_purchase = self._load_purchase_data()
-        
-        if not success_sales: return False, f"Sales Load Error: {msg_sales}"
-        if not success_purchase: 
-            # 구매 파일 로드 실패 시 로그만 남기고 일단 진행 (판매 기능은 유지)하거나 실패 처리
-            # 여기서는 명확한 오류 확인을 위해 실패로 처리합니다.
-            return False, f"Purchase Load Error: {msg_purchase}"
-            
-        # 3. 생산 요청 파일의 날짜 동기화 (출고예정일 등)
-        self.sync_production_dates()
-            
-        return True, "데이터 로드 완료"
-
-    def _load_purchase_data(self):
-        """내부 메서드: 구매 엑셀 파일을 로드하여 self.df_purchase에 저장"""
-        df, msg = self.file_handler.load_purchase_data()
-        if df is not None:
-            self.df_purchase = df
-            return True, msg
-        else:
-            return False, msg
+        with self.lock:
+            # 저장 대기 중인 작업이 있으면 먼저 저장 (다시 읽으면 메모리의 변경이 사라지므로)
+            self.journal_handler.flush()
+            return self.load_handler.apply_and_recover(self.read_data())
+
+    def reload_external_changes(self):
+        """외부에서 변경된 파일이 있을 때만 다시 읽어 반영합니다. 변경이 없으면 (False, "")"""
+        return self.apply_external_changes(self.read_external_changes())
+
+    # Delegate to LoadHandler (read_*: 백그라운드 가능, apply_*: UI 스레드)
+    def read_data(self):
+        return self.load_handler.read_data()
+
+    def apply_loaded_data(self, loaded):
+        return self.load_handler.apply_loaded_data(loaded)
+
+    def is_stale(self, loaded):
+        return self.load_handler.is_stale(loaded)
+
+    def read_external_changes(self):
+        return self.load_handler.read_external_changes()
+
+    def apply_external_changes(self, loaded):
+        return self.load_handler.apply_external_changes(loaded)
+
+    def get_external_changes(self):
+        return self.load_handler.get_external_changes()
+
+    def flush_journal(self):
+        return self.journal_handler.flush()
+
+    # 백그라운드 실행 (callback(result)은 UI 스레드에서 호출됨)
+    # 백그라운드 저장은 파일에만 쓰고, 메모리 반영은 callback 전에 UI 스레드에서 수행됨 (FileHandler.apply_to_memory)
+    def run_async(self, func, *args, callback=None, **kwargs):
+        return self.worker.submit(func, *args, callback=callback, **kwargs)
+
+    def run_on_ui(self, func, *args):
+        """메모리 시트를 제자리에서 바꾸는 작업은 UI 스레드에서 실행합니다. (백그라운드 작업 중이면 예약)"""
+        if self.worker.in_worker_thread(): self.worker.post(func, *args)
+        else: func(*args)
+
+    def load_data_async(self, callback=None):
+        """파일 읽기는 백그라운드에서, 메모리 반영은 UI 스레드에서 callback 호출 직전에 수행합니다."""
+        def read():
+            with self.lock:
+                self.journal_handler.flush()
+            return self.read_data()
+
+        def apply(loaded):
+            if self.journal_handler.has_pending:
+                # 읽는 동안 새 작업이 들어오면 저장 후 다시 읽음 (반영하면 메모리의 변경이 사라짐)
+                return self.load_data_async(callback)
+            result = self.load_handler.apply_and_recover(loaded)
+            if callback: callback(result)
+        return self.run_async(read, callback=apply)
+
+    def reload_external_changes_async(self, callback=None):
+        """외부 변경 읽기는 백그라운드에서, 반영은 UI 스레드에서 수행하고 callback(결과)을 호출합니다."""
+        def apply(loaded):
+            result = self.apply_external_changes(loaded)
+            if callback: callback(result)
+        return self.run_async(self.read_external_changes, callback=apply)
+
+    def execute_transaction_async(self, update_logic_func, callback=None):
+        return self.run_async(self.execute_transaction, update_logic_func, callback=callback)
+
+    def export_to_production_request_async(self, rows_data, callback=None):
+        return self.run_async(self.export_to_production_request, rows_data, callback=callback)
 
     def save_to_excel(self):
         # 판매 데이터 저장
-        return self.file_handler.save_to_excel()
+        with self.lock:
+            return self.file_handler.save_to_excel()
         # TODO: 구매 데이터 저장 로직도 save_purchase_data() 등으로 분리하거나 통합 필요
 
     def save_data(self, sheet_type=None):
@@ -99,13 +185,36 @@ class DataManager:
     def create_backup(self):
         return self.file_handler.create_backup()
 
+    def export_to_excel(self, sales_path, purchase_path=None):
+        return self.file_handler.export_workbooks(sales_path, purchase_path)
+
+    def import_from_excel(self, sales_path, purchase_path=None):
+        success, msg = self.file_handler.import_workbooks(sales_path, purchase_path)
+        if success:
+            self.load_data()
+        return success, msg
+
     def check_for_external_changes(self):
-        # TODO: Purchase 파일 변경 체크 로직도 추가 필요
-        return self.file_handler.check_for_external_changes()
+        return bool(self.get_external_changes())
+
+    def get_watch_paths(self):
+        """파일 감시 대상 경로 목록"""
+        paths = [self.file_handler.data_path, self.production_request_path]
+        if not self.file_handler.is_sqlite():
+            paths.append(self.purchase_data_path)
+        return paths
 
     def save_attachment(self, *args, **kwargs):
         return self.file_handler.save_attachment(*args, **kwargs)
 
+    # Delegate to IndexHandler
+    def get_rows(self, key, value):
+        """관리번호(또는 clients의 업체명)로 메모리 시트의 행들을 조회합니다."""
+        return self.index_handler.rows(key, value)
+
+    def get_first_row(self, key, value):
+        return self.index_handler.first_row(key, value)
+
     # Delegate to LogHandler
     def add_log(self, action, details):
         self.log_handler.add_log(action, details)
@@ -135,6 +244,13 @@ class DataManager:
     def delete_client(self, client_name):
         return self.client_handler.delete_client(client_name)
 
+    # 신규 번호: 팝업에는 peek_next_id()로 임시 번호를 보여주고 저장 시 reserve_id()로 확정
+    def peek_next_id(self, prefix):
+        return self.id_allocator.peek_id(prefix)
+
+    def reserve_id(self, mgmt_no):
+        return self.id_allocator.reserve_id(mgmt_no)
+
     # Delegate to OrderHandler
     def get_next_quote_id(self):
         return self.order_handler.get_next_quote_id()
@@ -148,6 +264,18 @@ class DataManager:
     def get_filtered_data(self, status_list=None, keyword=""):
         return self.order_handler.get_filtered_data(status_list, keyword)
 
+    def get_order_summary(self):
+        """관리번호별 요약 (품목수, 첫 모델, 합계, 대표상태, 최초출고예정일)"""
+        return self.order_summary.get()
+
+    def get_dashboard_kpis(self):
+        """대시보드 지표 (매출, 미수금, 진행 주문, 금일 출고, 단계별 건수, 출고 예정 목록)"""
+        return self.kpi_service.get()
+
+    def search_mask(self, keyword, df=None):
+        """검색 인덱스로 keyword가 포함된 행이면 True인 배열을 반환합니다. (df 기본: df_data)"""
+        return self.search_index.mask(keyword, df)
+
     def add_order(self, order_rows, mgmt_no, client_name):
         return self.order_handler.add_order(order_rows, mgmt_no, client_name)
 
@@ -182,9 +310,15 @@ class DataManager:
     def recalc_payment_status(self, dfs, mgmt_no):
         self.payment_handler.recalc_payment_status(dfs, mgmt_no)
 
+    def recalc_all_payment_status(self, dfs, mgmt_nos=None):
+        self.payment_handler.recalc_all_payment_status(dfs, mgmt_nos)
+
     def add_payment(self, payment_data):
         return self.payment_handler.add_payment(payment_data)
 
+    def check_payment_fee(self, mgmt_nos, payment_amount):
+        return self.payment_handler.check_payment_fee(mgmt_nos, payment_amount)
+
     def process_payment(self, mgmt_nos, payment_amount, payment_date, file_paths, confirm_fee_callback=None):
         return self.payment_handler.process_payment(mgmt_nos, payment_amount, payment_date, file_paths, confirm_fee_callback)
 
@@ -199,10 +333,12 @@ class DataManager:
         return self.delivery_handler.process_delivery(delivery_no, delivery_date, invoice_no, shipping_method, waybill_path, update_requests, ci_path, pl_path)
 
     def export_to_production_request(self, rows_data):
-        return self.delivery_handler.export_to_production_request(rows_data)
+        with self.lock:
+            return self.delivery_handler.export_to_production_request(rows_data)
 
     def sync_production_dates(self):
-        self.delivery_handler.sync_production_dates()
+        """생산 요청 파일의 출고예정일을 반영하고 값이 바뀐 행의 라벨을 반환합니다."""
+        return self.delivery_handler.sync_production_dates()
 
     def get_production_status_map(self):
         return self.delivery_handler.get_production_status_map()
@@ -242,34 +378,95 @@ class DataManager:
     def set_dev_mode(self, enabled):
         self.is_dev_mode = enabled
 
-    def execute_transaction(self, update_logic_func):
-        if not os.path.exists(self.current_excel_path):
-            return False, "엑셀 파일이 존재하지 않습니다."
-
-        try:
-            dfs = self.file_handler.read_all_sheets()
-            dfs = self.file_handler.normalize_all(dfs)
-            
-            # 구매 데이터도 트랜잭션에 포함
-            if self.df_purchase is not None:
-                dfs["purchase"] = self.df_purchase
-            
-            success, msg = update_logic_func(dfs)
-            if not success: return False, msg
-
-            # dfs에 'purchase' 키가 있으면 구매 데이터 저장
-            if "purchase" in dfs:
-                self.df_purchase = dfs["purchase"]
-                self.file_handler.save_purchase_data()
-
-            self.file_handler.write_all_sheets(dfs)
-            self.load_data()
-            return True, "저장되었습니다."
-
-        except PermissionError:
-            return False, "엑셀 파일이 열려있습니다. 파일을 닫고 다시 시도해주세요."
-        except Exception as e:
-            return False, f"트랜잭션 오류: {e}"
+    def execute_transaction(self, update_logic_func, base_sheets=None):
+        """
+        update_logic_func(dfs)를 실행하고, 실제로 변경된 시트만 저장합니다.
+        파일이 외부에서 변경되지 않았다면 디스크를 다시 읽지 않고 메모리의 DataFrame을 재사용합니다.
+        base_sheets: 메모리 대신 기준으로 사용할 시트 (저널 그룹 커밋용)
+        """
+        with self.lock:
+            if not os.path.exists(self.file_handler.data_path):
+                return False, "데이터 파일이 존재하지 않습니다."
+
+            if base_sheets is None and self.journal_handler.has_pending:
+                # 저널에 쌓인 작업을 먼저 저장해야 순서가 유지됨
+                success, msg = self.journal_handler.flush()
+                if not success: return False, f"이전 변경사항 저장 실패: {msg}"
+
+            try:
+                is_external = self.file_handler.check_for_external_changes()
+                if is_external:
+                    # 다른 사용자가 저장한 내용 위에 적용해야 하므로 디스크에서 다시 읽음
+                    base = self.file_handler.read_all_sheets()
+                    if not base:
+                        return False, "엑셀 파일을 읽을 수 없습니다."
+                    base = LazySheets(data=self.file_handler.normalize_all(base))
+                elif base_sheets is not None:
+                    base = base_sheets
+                else:
+                    base = self.file_handler.current_sheets()
+
+                # 구매 데이터도 트랜잭션에 포함
+                if "purchase" not in base:
+                    base["purchase"] = self.file_handler.latest("purchase")
+
+                dfs = self._working_copy(base)
+                success, msg = update_logic_func(dfs)
+                if not success: return False, msg
+
+                changed = self._get_changed_sheets(base, dfs)
+                sales_changed = [key for key in changed if key != "purchase"]
+
+                # 구매 데이터는 변경된 경우에만 저장
+                if "purchase" in changed:
+                    self.file_handler.save_purchase_data(base.get("purchase"), dfs["purchase"])
+                    self.file_handler.apply_to_memory(dfs, ["purchase"])
+
+                if sales_changed:
+                    for key in sales_changed:
+                        # 파일에서 다시 읽은 것과 동일하게 인덱스를 0부터 재정렬
+                        dfs[key] = dfs[key].reset_index(drop=True)
+                    self.file_handler.normalize_all(dfs, sales_changed)
+                    previous = self.file_handler.snapshot.signature(self.current_excel_path)
+                    self.file_handler.write_sheets(dfs, sales_changed, base)
+                    self.file_handler.update_timestamp()
+
+                if is_external:
+                    # 디스크에서 새로 읽은 시트 전체를 메모리에 반영
+                    self.file_handler.apply_to_memory(dfs, self.file_handler.SHEET_KEYS)
+                    self.file_handler.update_timestamp()
+                    self.run_on_ui(self.sync_production_dates)
+                else:
+                    self.file_handler.apply_to_memory(dfs, sales_changed)
+
+                if sales_changed:
+                    # 스냅샷은 파일에 쓴 시트(외부 변경 시 파일에서 읽은 시트 포함) 기준
+                    written = {key: dfs[key] for key in sales_changed}
+                    if is_external: written = {**dict(base.items()), **written}
+                    self.file_handler.store_snapshot(written, previous)
+                return True, "저장되었습니다."
+
+            except PermissionError:
+                return False, "엑셀 파일이 열려있습니다. 파일을 닫고 다시 시도해주세요."
+            except Exception as e:
+                return False, f"트랜잭션 오류: {e}"
+
+    def _working_copy(self, base):
+        """트랜잭션용 사본. 작업에서 접근한 시트만 복사합니다."""
+        def copy_sheet(key):
+            df = schema.editable(base[key])
+            # 복사본은 행 구성이 같으므로 기존 인덱스를 그대로 사용
+            self.index_handler.adopt(key, df, base[key])
+            return df
+        return LazySheets(copy_sheet, keys=base.available_keys())
+
+    def _get_changed_sheets(self, before, after):
+        """트랜잭션 전후를 비교하여 변경된 시트 키 목록을 반환합니다. (after에서 접근한 시트만 비교)"""
+        changed = []
+        for key, df in after.items():
+            if key not in before or not schema.sheets_equal(df, before[key]):
+                changed.append(key)
+        return changed
 
     # For backward compatibility if needed, or internal use
     def _execute_transaction(self, update_logic_func):
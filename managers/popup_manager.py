@@ -1,60 +1,59 @@
-# [변경] ui.popups 패키지 경로로 수정
-from ui.popups.client_popup import ClientPopup
-from ui.popups.production_popup import ProductionPopup
-from ui.popups.payment_popup import PaymentPopup
-from ui.popups.quote_popup import QuotePopup
-from ui.popups.order_popup import OrderPopup
-from ui.popups.complete_popup import CompletePopup
-from ui.popups.settings_popup import SettingsPopup
-from ui.popups.packing_list_popup import PackingListPopup
-from ui.popups.after_sales_popup import AfterSalesPopup
-from ui.popups.purchase_popup import PurchasePopup
-from ui.popups.accounting_popup import AccountingPopup
-from ui.popups.mini_order_popup import MiniOrderPopup
-from ui.popups.reason_popup import ReasonPopup
-
-
 class PopupManager:
+    """팝업 열기 창구. 팝업 모듈은 처음 열 때 import합니다. (시작 시간 단축)"""
+
     def __init__(self, parent, data_manager, refresh_callback):
         self.parent = parent
         self.dm = data_manager
         self.refresh_callback = refresh_callback
 
     def open_settings(self):
+        from ui.popups.settings_popup import SettingsPopup
         win = SettingsPopup(self.parent, self.dm, self.refresh_callback)
 
     def open_client_popup(self, client_name=None):
+        from ui.popups.client_popup import ClientPopup
         win = ClientPopup(self.parent, self.dm, self.refresh_callback, client_name)
 
     def open_quote_popup(self, mgmt_no=None, copy_mode=False):
+        from ui.popups.quote_popup import QuotePopup
         win = QuotePopup(self.parent, self.dm, self.refresh_callback, mgmt_no, copy_mode=copy_mode)
 
     def open_order_popup(self, mgmt_no=None, copy_mode=False):
+        from ui.popups.order_popup import OrderPopup
         win = OrderPopup(self.parent, self.dm, self.refresh_callback, mgmt_no, copy_mode=copy_mode)
 
     def open_production_popup(self, mgmt_nos):
+        from ui.popups.production_popup import ProductionPopup
         win = ProductionPopup(self.parent, self.dm, self.refresh_callback, mgmt_nos)
 
     def open_payment_popup(self, mgmt_nos):
+        from ui.popups.payment_popup import PaymentPopup
         win = PaymentPopup(self.parent, self.dm, self.refresh_callback, mgmt_nos)
 
     def open_complete_popup(self, mgmt_no):
+        from ui.popups.complete_popup import CompletePopup
         win = CompletePopup(self.parent, self.dm, self.refresh_callback, mgmt_no)
 
     def open_packing_list_popup(self, mgmt_no):
+        from ui.popups.packing_list_popup import PackingListPopup
         win = PackingListPopup(self.parent, self.dm, self.refresh_callback, mgmt_no)
 
     def open_after_sales_popup(self, mgmt_nos):
+        from ui.popups.after_sales_popup import AfterSalesPopup
         win = AfterSalesPopup(self.parent, self.dm, self.refresh_callback, mgmt_nos)
 
     def open_purchase_popup(self, mgmt_no=None, copy_mode=False):
+        from ui.popups.purchase_popup import PurchasePopup
         win = PurchasePopup(self.parent, self.dm, self.refresh_callback, mgmt_no, copy_mode=copy_mode)
 
     def open_accounting_popup(self, mgmt_nos):
+        from ui.popups.accounting_popup import AccountingPopup
         win = AccountingPopup(self.parent, self.dm, self.refresh_callback, mgmt_nos)
 
     def open_mini_order_popup(self, mgmt_no, on_confirm_callback):
+        from ui.popups.mini_order_popup import MiniOrderPopup
         win = MiniOrderPopup(self.parent, self.dm, mgmt_no, on_confirm_callback)
 
     def open_reason_popup(self, title, callback):
+        from ui.popups.reason_popup import ReasonPopup
         win = ReasonPopup(self.parent, title, callback)
\ No newline at end of file
@@ -8,7 +8,36 @@ class Config:
     DEFAULT_PURCHASE_DATA_PATH = "//cox_biz/business/SalesManager/OrderList.xlsx"
     DEFAULT_ATTACHMENT_ROOT = "attachments"
     DEFAULT_PRODUCTION_REQUEST_PATH = "//cox_biz/business/SalesManager/생산 요청.xlsx"
+    
+    # 저장소 엔진 설정 ("excel": SalesList.xlsx 직접 사용, "sqlite": SQLite DB 사용)
+    DEFAULT_STORAGE_ENGINE = "excel"
+    DEFAULT_SQLITE_PATH = "//cox_biz/business/SalesManager/SalesManager.db"
     CONFIG_FILENAME = "config.json"
+    SNAPSHOT_DIR = "cache" # 정규화된 데이터 스냅샷 (로컬, 빠른 시작용)
+    # 로드 시 읽지 않고 처음 접근할 때 읽는 시트 (대부분의 화면은 Data/Clients만 사용)
+    LAZY_SHEET_KEYS = ["payment", "delivery", "log", "memo_log", "tax_invoice"]
+    # 엑셀 파싱을 작업 프로세스에서 동시에 실행 (작은 파일은 프로세스 시작 비용이 더 커서 제외)
+    PARALLEL_LOAD = True
+    LOAD_WORKERS = 4
+    PARALLEL_LOAD_MIN_SIZE = 512 * 1024 # bytes
+
+    # 데이터 파일 변경 감시 (초)
+    FILE_WATCH_DEBOUNCE = 1.0      # 연속 쓰기가 멈춘 뒤 반영까지 대기
+    FILE_WATCH_MIN_INTERVAL = 2.0  # 폴링 최소 간격
+    FILE_WATCH_MAX_INTERVAL = 30.0 # 변경이 없을 때 늘어나는 폴링 최대 간격
+
+    # 그룹 커밋 (연속 수정 작업을 모아서 한 번에 저장)
+    DEFAULT_GROUP_COMMIT = True
+    JOURNAL_FILENAME = "journal.jsonl" # SNAPSHOT_DIR 아래에 생성
+    JOURNAL_REJECTS_FILENAME = "journal_rejects.jsonl" # 재실행에 실패한 작업 보관 (SNAPSHOT_DIR)
+    JOURNAL_COMMIT_DELAY = 1.5     # 마지막 작업 후 저장까지 대기
+    JOURNAL_MAX_DELAY = 10.0       # 첫 작업 후 저장까지 최대 대기
+    JOURNAL_RETRY_DELAY = 5.0      # 저장 실패(파일 열림 등) 시 첫 재시도까지 대기, 실패할 때마다 2배
+    JOURNAL_RETRY_MAX_DELAY = 120.0 # 재시도 간격 최대값
+
+    # 번호(QT/OD/CX/PU) 발급 시 공유 카운터 파일 잠금 (초)
+    ID_LOCK_TIMEOUT = 5.0          # 잠금 대기 최대 시간 (초과 시 이 PC 데이터 기준으로 발급)
+    ID_LOCK_STALE = 30.0           # 이보다 오래된 잠금 파일은 비정상 종료로 보고 삭제
     
     # 폼(템플릿) 파일 경로 (항상 attachments/forms 참조)
     FORMS_DIR = os.path.join("attachments", "forms")
@@ -63,6 +92,12 @@ class Config:
     MEMO_COLUMNS = ["관리번호", "내용", "작성일"]
     MEMO_LOG_COLUMNS = ["일시", "작업자", "내용"]
     
+    # Data 시트 컬럼 타입 (managers/data/schema.py)
+    # 반복되는 값이 많은 컬럼은 category, 금액/수량은 float64, 날짜는 "YYYY-MM-DD" 문자열 ("-" = 없음)
+    DATA_CATEGORY_COLS = ["Status", "Delivery Status", "Payment Status", "업체명", "통화"]
+    DATA_NUMBER_COLS = ["수량", "단가", "환율", "세율(%)", "공급가액", "세액", "합계금액", "기수금액", "미수금액"]
+    DATA_DATE_COLS = ["견적일", "수주일", "출고예정일", "출고일", "선적일", "입금완료일", "세금계산서발행일"]
+
     # 검색 대상 컬럼
     SEARCH_TARGET_COLS = ["업체명", "모델명", "Description", "관리번호"]
     
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from ui.views import calendar_view
+from ui.views.calendar_view import CalendarView, calendar_index, unscheduled_items
+
+
+class TestCalendarIndex(unittest.TestCase):
+    def setUp(self):
+        self.dm = DataManager()
+        self.dm.df_data = pd.DataFrame([
+            {"관리번호": "OD-002", "업체명": "B", "모델명": "M1", "수량": 3, "Status": "주문", "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-001", "업체명": "A", "모델명": "M2", "수량": 1, "Status": "생산중", "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-001", "업체명": "A", "모델명": "M3", "수량": 2, "Status": "생산중", "출고예정일": "2023-12-05"},
+            {"관리번호": "OD-003", "업체명": "C", "모델명": "M4", "수량": 5, "Status": "납품대기", "출고예정일": "-"},
+            {"관리번호": "OD-004", "업체명": "D", "모델명": "M5", "수량": 1, "Status": "완료", "출고예정일": "2023-12-20"},
+        ])
+
+    def test_events_are_indexed_by_earliest_date(self):
+        index = calendar_index(self.dm.get_order_summary())
+        self.assertEqual(index, {
+            "2023-12-05": [("OD-001", "[A] M2 외 1건", "[OD-001] A (2)")],
+            "2023-12-20": [("OD-002", "[B] M1", "[OD-002] B")],
+        })
+
+    def test_unscheduled_orders(self):
+        self.assertEqual(unscheduled_items(self.dm.get_order_summary()),
+                         [("OD-003", "[C] M4", "5개 | 납품대기", "[OD-003] C")])
+
+    def test_index_is_built_once_per_data_version(self):
+        view = CalendarView.__new__(CalendarView)
+        view.dm = self.dm
+        view._summary, view._events, view._unscheduled = None, {}, []
+        with patch.object(calendar_view, "calendar_index", wraps=calendar_index) as spy:
+            view._load_index()
+            view._load_index()
+            self.assertEqual(spy.call_count, 1)
+
+            df = self.dm.df_data.copy()
+            df.loc[df["관리번호"] == "OD-003", "출고예정일"] = "2023-12-07"
+            self.dm.df_data = df
+            view._load_index()
+            self.assertEqual(spy.call_count, 2)
+        self.assertIn("2023-12-07", view._events)
+        self.assertEqual(view._unscheduled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
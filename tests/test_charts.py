@@ -0,0 +1,69 @@
+import unittest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from ui.widgets.charts import GanttChart, PipelineChart, gantt_rows
+
+
+class TestPipelineChart(unittest.TestCase):
+    def setUp(self):
+        self.figure = Figure()
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.chart = PipelineChart(self.ax, ["견적", "주문", "생산중"])
+
+    def test_updates_reuse_the_same_artists(self):
+        self.assertTrue(self.chart.update({"견적": 2, "생산중": 5}, {}, "#000000", "#ffffff"))
+        patches, texts = list(self.ax.patches), list(self.ax.texts)
+
+        self.assertTrue(self.chart.update({"주문": 1}, {"주문": "#42A5F5"}, "#000000", "#ffffff"))
+        self.assertEqual((list(self.ax.patches), list(self.ax.texts)), (patches, texts))
+        self.assertEqual([t.get_text() for t in self.ax.get_yticklabels()], ["주문"])
+        self.assertEqual([bar.get_visible() for bar in self.chart.bars], [True, False, False])
+        self.assertEqual(self.chart.bars[0].get_width(), 1)
+        self.assertFalse(self.chart.update({}, {}, "#000000", "#ffffff"))
+
+    def test_figures_are_not_kept_by_pyplot(self):
+        self.assertEqual(plt.get_fignums(), [])
+
+
+class TestGanttChart(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "업체명": [f"C{i}" for i in range(20)],
+            "모델명": "M",
+            "수주일": [f"2023-12-{i + 1:02d}" for i in range(20)][::-1],
+            "견적일": "-",
+            "출고예정일": "-",
+            "Status": ["주문"] * 19 + ["완료"],
+        })
+
+    def test_rows_are_sorted_and_do_not_touch_the_sheet(self):
+        columns = list(self.df.columns)
+        rows = gantt_rows(self.df)
+        self.assertEqual(list(self.df.columns), columns)
+        self.assertEqual(len(rows), 19)
+        self.assertEqual(rows["label"].iloc[0], "[C18] M")
+        self.assertTrue((rows["duration"] == 3).all())
+
+    def test_only_visible_rows_are_drawn(self):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        chart = GanttChart(figure.add_subplot())
+        chart.set_rows(gantt_rows(self.df))
+
+        self.assertEqual(chart.show(0, 5, "#0000ff", "#000000", "#ffffff"), 0)
+        self.assertEqual(len(chart.bars), 5)
+        self.assertEqual(chart.show(17, 5, "#0000ff", "#000000", "#ffffff"), 14)
+        self.assertEqual(len(chart.bars), 5)
+        self.assertEqual(chart.ax.get_yticklabels()[0].get_text(), "[C4] M")
+        figure.canvas.draw()
+
+
+if __name__ == "__main__":
+    unittest.main()
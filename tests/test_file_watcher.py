@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+from utils.file_watcher import FileWatcher
+
+
+class TestFileWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        with open(self.path, "w") as f:
+            f.write("v0")
+
+        self.calls = []
+        self.called = threading.Event()
+
+        def on_change(paths):
+            self.calls.append(paths)
+            self.called.set()
+
+        self.watcher = FileWatcher(lambda: [self.path], on_change,
+                                   debounce=0.3, min_interval=0.05, max_interval=0.2)
+        self.watcher.start()
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write(self, text, mtime):
+        with open(self.path, "w") as f:
+            f.write(text)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_burst_of_writes_is_reported_once(self):
+        for i in range(3):
+            self._write(f"v{i + 1}" * (i + 1), 1_000_000_000 + i)
+            time.sleep(0.1)
+
+        self.assertTrue(self.called.wait(3))
+        time.sleep(0.5)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.calls[0], [self.path])
+
+    def test_no_change_no_callback(self):
+        self.assertFalse(self.called.wait(0.8))
+
+
+class TestExternalChanges(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client A"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+        self.assertTrue(self.dm.load_data()[0])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_purchase_file_is_watched(self):
+        self.assertEqual(self.dm.get_external_changes(), [])
+        self.assertIn(self.dm.purchase_data_path, self.dm.get_watch_paths())
+
+        # 이 프로그램이 저장한 경우는 외부 변경이 아님
+        self.assertTrue(self.dm.save_purchase_data()[0])
+        self.assertEqual(self.dm.get_external_changes(), [])
+
+        later = time.time() + 10
+        os.utime(self.dm.purchase_data_path, (later, later))
+        self.assertEqual(self.dm.get_external_changes(), ["purchase"])
+
+    def test_background_read_is_applied_later(self):
+        loaded = self.dm.read_data()
+        self.assertFalse(self.dm.is_stale(loaded))
+        success, msg = self.dm.apply_loaded_data(loaded)
+        self.assertTrue(success, msg)
+        self.assertEqual(self.dm.df_clients["업체명"].tolist(), ["Client A"])
+
+    def test_async_load_applies_on_ui_thread(self):
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client B"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+        applied_on = []
+        apply = self.dm.load_handler.apply_loaded_data
+        self.dm.load_handler.apply_loaded_data = lambda loaded: applied_on.append(threading.current_thread()) or apply(loaded)
+        results = []
+
+        self.dm.load_data_async(callback=results.append).result(timeout=30)
+        # 백그라운드에서는 읽기만 하고 메모리는 그대로
+        self.assertEqual(self.dm.df_clients["업체명"].tolist(), ["Client A"])
+        self.assertEqual(applied_on, [])
+
+        deadline = time.time() + 10
+        while not results and time.time() < deadline:
+            self.dm.worker.process_callbacks()
+            time.sleep(0.01)
+        self.assertEqual(results, [(True, "데이터 로드 완료")])
+        self.assertEqual(applied_on, [threading.current_thread()])
+        self.assertEqual(self.dm.df_clients["업체명"].tolist(), ["Client B"])
+        self.dm.worker.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
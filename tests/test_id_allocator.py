@@ -0,0 +1,98 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from managers.data.id_allocator import IdAllocator
+
+
+class TestIdAllocator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.today = datetime.now().strftime("%y%m%d")
+        self.dm = self._new_dm()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _new_dm(self):
+        dm = DataManager()
+        dm.storage_engine = "excel"
+        dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        dm.df_data = pd.DataFrame({"관리번호": [
+            f"OD-{self.today}-001", f"OD-{self.today}-007", f"QT-{self.today}-002",
+            "OD-200101-099", f"OD-{self.today}-abc", "-",
+        ]})
+        return dm
+
+    def test_next_id_follows_high_water_mark(self):
+        self.assertEqual(self.dm.get_next_order_id(), f"OD-{self.today}-008")
+        self.assertEqual(self.dm.get_next_order_id(), f"OD-{self.today}-009")
+        self.assertEqual(self.dm.get_next_quote_id(), f"QT-{self.today}-003")
+        self.assertEqual(self.dm.get_next_purchase_id(), f"PU-{self.today}-001")
+
+    def test_marks_are_computed_once_per_sheet(self):
+        with patch.object(IdAllocator, "_scan", wraps=IdAllocator._scan) as spy:
+            self.dm.get_next_order_id()
+            self.dm.get_next_quote_id()
+            self.assertEqual(spy.call_count, 1)
+
+            # 저장으로 시트가 바뀌면 다시 계산
+            self.dm.df_data = pd.concat([self.dm.df_data, pd.DataFrame({"관리번호": [f"OD-{self.today}-050"]})])
+            self.assertEqual(self.dm.get_next_order_id(), f"OD-{self.today}-051")
+            self.assertEqual(spy.call_count, 2)
+
+    def test_two_users_never_get_the_same_id(self):
+        other = self._new_dm()
+        ids = {self.dm.get_next_order_id(), other.get_next_order_id(),
+               self.dm.get_next_order_id(), other.get_next_order_id()}
+        self.assertEqual(len(ids), 4)
+
+        with open(self.dm.id_allocator.counter_path, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {f"OD-{self.today}": 11})
+        self.assertFalse(os.path.exists(self.dm.id_allocator.counter_path + ".lock"))
+
+    def test_unwritable_share_falls_back_to_local_data(self):
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "missing", "SalesList.xlsx")
+        self.assertEqual(self.dm.get_next_order_id(), f"OD-{self.today}-008")
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir, "missing")))
+
+    def test_cancelled_popup_does_not_burn_a_number(self):
+        self.assertEqual(self.dm.peek_next_id("OD"), f"OD-{self.today}-008")
+        self.assertEqual(self.dm.peek_next_id("OD"), f"OD-{self.today}-008")
+        self.assertEqual(self.dm.reserve_id(f"OD-{self.today}-008"), f"OD-{self.today}-008")
+        self.assertEqual(self.dm.peek_next_id("OD"), f"OD-{self.today}-009")
+
+    def test_reserve_moves_on_when_number_was_taken(self):
+        other = self._new_dm()
+        shown = self.dm.peek_next_id("OD")
+        self.assertEqual(other.reserve_id(other.peek_next_id("OD")), shown)
+        self.assertEqual(self.dm.reserve_id(shown), f"OD-{self.today}-009")
+        # 직접 입력한 번호는 그대로
+        self.assertEqual(self.dm.reserve_id("QT-TEST"), "QT-TEST")
+
+    def test_stale_lock_is_removed_by_one_client_only(self):
+        allocator = self.dm.id_allocator
+        lock_path = allocator.counter_path + ".lock"
+        with open(lock_path, "w") as f: f.write("crashed")
+        os.utime(lock_path, (0, 0))
+        self.assertTrue(allocator._remove_stale_lock(lock_path))
+
+        # 다른 PC가 새로 잡은 잠금은 오래된 잠금으로 판단한 뒤라도 지우지 않음
+        with open(lock_path, "w") as f: f.write("live")
+        stale = os.stat(lock_path)
+        with patch("managers.data.id_allocator.os.stat",
+                   side_effect=[os.stat_result((*stale[:7], 0, 0, 0)), stale]):
+            self.assertTrue(allocator._remove_stale_lock(lock_path))
+        with open(lock_path) as f: self.assertEqual(f.read(), "live")
+        self.assertEqual(os.listdir(self.tmp_dir), [os.path.basename(lock_path)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestIncrementalTransaction(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+        data = pd.DataFrame([{
+            "관리번호": "OD-231210-001", "업체명": "Test Client", "모델명": "Model A",
+            "수량": 1, "합계금액": 1100, "Status": "주문"
+        }])
+        clients = pd.DataFrame([{"업체명": "Test Client", "국가": "KR"}])
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            clients.to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+            pd.DataFrame(columns=Config.LOG_COLUMNS).to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
+
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_only_changed_sheets_are_written(self):
+        with patch.object(self.dm.file_handler, "write_sheets", wraps=self.dm.file_handler.write_sheets) as spy, \
+             patch.object(self.dm.file_handler, "read_all_sheets", wraps=self.dm.file_handler.read_all_sheets) as read_spy, \
+             patch.object(self.dm.file_handler, "save_purchase_data") as purchase_spy:
+            success, msg = self.dm.update_order_status("OD-231210-001", "생산중")
+            self.assertTrue(success, msg)
+            self.dm.flush_journal()
+
+        self.assertEqual(sorted(spy.call_args[0][1]), ["data", "log"])
+        # 통합문서 전체를 다시 읽지 않고, 처음 쓰는 Log 시트만 읽음
+        read_spy.assert_called_once_with(None, ["log"])
+        purchase_spy.assert_not_called()
+
+        self.assertEqual(self.dm.df_data.iloc[0]["Status"], "생산중")
+        # 상태 변경 로그 + 저널 반영 표시
+        self.assertEqual(self.dm.df_log["구분"].tolist()[-1], "저널 반영")
+        self.assertEqual(len(self.dm.df_log), 2)
+
+        on_disk = pd.read_excel(self.dm.current_excel_path, sheet_name=None)
+        self.assertEqual(on_disk[Config.SHEET_DATA].iloc[0]["Status"], "생산중")
+        self.assertEqual(on_disk[Config.SHEET_CLIENTS].iloc[0]["업체명"], "Test Client")
+
+    def test_background_save_is_applied_on_ui_thread(self):
+        self.addCleanup(self.dm.worker.shutdown)
+        before = self.dm.df_data
+        future = self.dm.run_async(self.dm.update_order_status, "OD-231210-001", "생산중")
+        self.assertTrue(future.result(timeout=30)[0])
+        # 작업 스레드에서는 화면이 읽는 시트를 교체하지 않음
+        self.assertIs(self.dm.df_data, before)
+
+        # 다음 작업은 아직 반영되지 않은 직전 결과 위에서 실행
+        future = self.dm.run_async(self.dm.update_order_fields, "OD-231210-001", {"모델명": "Model B"})
+        self.assertTrue(future.result(timeout=30)[0])
+        self.dm.worker.process_callbacks()
+        row = self.dm.df_data.iloc[0]
+        self.assertEqual((row["Status"], row["모델명"]), ("생산중", "Model B"))
+
+        self.dm.flush_journal()
+        on_disk = pd.read_excel(self.dm.current_excel_path, sheet_name=Config.SHEET_DATA)
+        self.assertEqual((on_disk.iloc[0]["Status"], on_disk.iloc[0]["모델명"]), ("생산중", "Model B"))
+
+    def test_external_change_reloads_before_update(self):
+        # 다른 사용자가 업체를 추가한 상황
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+            pd.DataFrame([{"업체명": "Test Client"}, {"업체명": "Other Client"}]).to_excel(
+                writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+        self.dm.last_file_timestamp = 0.0
+
+        success, msg = self.dm.update_order_status("OD-231210-001", "생산중")
+
+        self.assertTrue(success, msg)
+        self.assertIn("Other Client", self.dm.df_clients["업체명"].values)
+
+    def test_snapshot_keeps_unsaved_memory_edits_out(self):
+        # 출고예정일 동기화처럼 메모리에만 반영되고 파일에는 저장하지 않은 변경
+        df = self.dm.df_data.copy()
+        df["출고예정일"] = "2030-01-01"
+        self.dm.df_data = df
+
+        success, msg = self.dm.add_tax_invoice({"관리번호": "OD-231210-001", "금액": 1000})
+        self.assertTrue(success, msg)
+
+        # 다음 실행의 콜드 로드는 스냅샷을 사용하므로 파일 내용과 같아야 함
+        cold = self.dm.file_handler.load_sheet("data")
+        self.assertNotEqual(cold.iloc[0]["출고예정일"], "2030-01-01")
+        self.assertEqual(len(self.dm.file_handler.load_sheet("tax_invoice")), 1)
+
+    def test_failed_update_writes_nothing(self):
+        with patch.object(self.dm.file_handler, "write_sheets") as spy:
+            success, _ = self.dm.update_order_status("OD-000000-000", "생산중")
+        self.assertFalse(success)
+        spy.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestIndexHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+        data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A", "합계금액": 1100, "Status": "주문"},
+            {"관리번호": "OD-231210-002", "업체명": "Client B", "모델명": "Model B", "합계금액": 2200, "Status": "주문"},
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model C", "합계금액": 3300, "Status": "주문"},
+        ])
+        clients = pd.DataFrame([{"업체명": "Client A", "운송방법": "DHL"}, {"업체명": "Client B", "운송방법": "FedEx"}])
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            clients.to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_lookup_returns_all_rows_of_order(self):
+        rows = self.dm.get_rows("data", "OD-231210-001")
+        self.assertEqual(rows["모델명"].tolist(), ["Model A", "Model C"])
+        self.assertTrue(self.dm.get_rows("data", "OD-000000-000").empty)
+        self.assertEqual(self.dm.get_client_shipping_method("Client B"), "FedEx")
+
+    def test_index_follows_transactions(self):
+        success, msg = self.dm.delete_order("OD-231210-002")
+        self.assertTrue(success, msg)
+        self.assertTrue(self.dm.get_rows("data", "OD-231210-002").empty)
+        self.assertEqual(len(self.dm.get_rows("data", "OD-231210-001")), 2)
+
+        success, msg = self.dm.update_client("Client A", {"업체명": "Client A2"})
+        self.assertTrue(success, msg)
+        self.assertIsNone(self.dm.get_first_row("clients", "Client A"))
+        self.assertEqual(self.dm.get_client_shipping_method("Client A2"), "DHL")
+
+    def test_in_place_key_edit_is_seen_by_later_lookups(self):
+        index = self.dm.index_handler
+        # 트랜잭션 안에서 업체명을 바꾼 뒤 같은 작업 사본으로 다시 조회 (update_client 등)
+        clients = self.dm.df_clients.copy()
+        self.assertTrue(index.contains("clients", "Client A", clients))
+        clients.at[0, "업체명"] = "Client C"
+        index.columns_changed("clients", clients, {"업체명": "Client C"})
+        self.assertFalse(index.contains("clients", "Client A", clients))
+        self.assertEqual(list(index.positions("clients", "Client C", clients)), [0])
+
+        # 알리지 않고 바꿔도 찾은 행의 값을 확인하여 다시 만듦
+        df = self.dm.df_data.copy()
+        self.assertEqual(list(index.positions("data", "OD-231210-002", df)), [1])
+        df.loc[1, "관리번호"] = "OD-231210-009"
+        self.assertEqual(len(index.positions("data", "OD-231210-002", df)), 0)
+        self.assertEqual(list(index.positions("data", "OD-231210-009", df)), [1])
+
+    def test_new_key_written_in_place_is_found(self):
+        index = self.dm.index_handler
+        # 메모리 시트의 인덱스를 공유하는 작업 사본에서 관리번호만 바꾸고 새 값으로만 조회
+        self.assertEqual(list(index.positions("data", "OD-231210-002")), [1])
+        df = self.dm.df_data.copy()
+        index.adopt("data", df, self.dm.df_data)
+        df.loc[1, "관리번호"] = "OD-231210-009"
+        self.assertEqual(list(index.positions("data", "OD-231210-009", df)), [1])
+        self.assertFalse(index.contains("data", "OD-231210-009"))
+
+    def test_status_update_touches_only_matching_rows(self):
+        success, msg = self.dm.update_order_status("OD-231210-001", "생산중")
+        self.assertTrue(success, msg)
+        statuses = self.dm.df_data.set_index("모델명")["Status"].to_dict()
+        self.assertEqual(statuses, {"Model A": "생산중", "Model B": "주문", "Model C": "생산중"})
+
+
+if __name__ == "__main__":
+    unittest.main()
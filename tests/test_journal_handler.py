@@ -0,0 +1,190 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestJournalHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A", "수량": 1, "합계금액": 1100, "Status": "주문"},
+            {"관리번호": "OD-231210-002", "업체명": "Client A", "모델명": "Model B", "수량": 1, "합계금액": 2200, "Status": "주문"},
+        ])
+        self.dm = self._new_dm()
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client A"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+            pd.DataFrame([{"관리번호": "OD-000000-000", "일시": "2023-12-01 10:00:00", "입금액": 0}], columns=Config.PAYMENT_COLUMNS).to_excel(
+                writer, sheet_name=Config.SHEET_PAYMENT, index=False)
+            pd.DataFrame(columns=Config.LOG_COLUMNS).to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
+
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+        # 자동 저장 타이머가 테스트 도중 끼어들지 않도록 지연을 크게 설정
+        self.dm.journal_handler.commit_delay = 60
+        self.dm.journal_handler.max_delay = 60
+
+    def tearDown(self):
+        self.dm.worker.shutdown(wait=True)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _new_dm(self):
+        dm = DataManager()
+        dm.group_commit = True
+        dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+        return dm
+
+    def _disk_statuses(self):
+        df = pd.read_excel(self.dm.current_excel_path, sheet_name=Config.SHEET_DATA)
+        return dict(zip(df["관리번호"], df["Status"]))
+
+    def test_rapid_edits_are_written_once(self):
+        with patch.object(self.dm.file_handler, "write_sheets", wraps=self.dm.file_handler.write_sheets) as spy:
+            self.assertTrue(self.dm.update_order_status("OD-231210-001", "생산중")[0])
+            self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+            self.assertTrue(self.dm.update_order_status("OD-231210-001", "납품대기")[0])
+
+            # 메모리는 즉시 반영, 파일은 아직 그대로
+            statuses = dict(zip(self.dm.df_data["관리번호"], self.dm.df_data["Status"]))
+            self.assertEqual(statuses, {"OD-231210-001": "납품대기", "OD-231210-002": "생산중"})
+            spy.assert_not_called()
+            self.assertTrue(os.path.exists(self.dm.journal_handler.path))
+
+            success, msg = self.dm.flush_journal()
+            self.assertTrue(success, msg)
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(self._disk_statuses(), {"OD-231210-001": "납품대기", "OD-231210-002": "생산중"})
+        # 작업 로그 3건 + 저널 반영 표시 1건
+        self.assertEqual(len(self.dm.df_log), 4)
+        self.assertEqual(self.dm.df_log["구분"].iloc[-1], "저널 반영")
+        self.assertFalse(self.dm.journal_handler.has_pending)
+        self.assertFalse(os.path.exists(self.dm.journal_handler.path))
+
+    def test_plain_transaction_flushes_pending_first(self):
+        self.assertTrue(self.dm.update_order_status("OD-231210-001", "생산중")[0])
+        success, msg = self.dm.delete_order("OD-231210-002")
+        self.assertTrue(success, msg)
+
+        self.assertFalse(self.dm.journal_handler.has_pending)
+        self.assertEqual(self._disk_statuses(), {"OD-231210-001": "생산중"})
+
+    def test_recover_unsaved_journal_on_load(self):
+        self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+        # 저장 전에 비정상 종료된 상황: 저널 파일만 남음
+        self.assertEqual(self._disk_statuses()["OD-231210-002"], "주문")
+
+        dm2 = self._new_dm()
+        success, msg = dm2.load_data()
+        self.assertTrue(success, msg)
+
+        self.assertEqual(self._disk_statuses()["OD-231210-002"], "생산중")
+        self.assertEqual(dm2.get_first_row("data", "OD-231210-002")["Status"], "생산중")
+        self.assertFalse(os.path.exists(dm2.journal_handler.path))
+        dm2.worker.shutdown(wait=True)
+
+    def test_recover_skips_batch_already_written(self):
+        success, msg = self.dm.add_payment({"관리번호": "OD-231210-001", "일시": "2023-12-10 10:00:00", "입금액": 500})
+        self.assertTrue(success, msg)
+        self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+        # 파일 저장 직후, 저널을 지우기 전에 종료된 상황
+        with open(self.dm.journal_handler.path, encoding="utf-8") as f:
+            journal = f.read()
+        self.assertTrue(self.dm.flush_journal()[0])
+        with open(self.dm.journal_handler.path, "w", encoding="utf-8") as f:
+            f.write(journal)
+        log_rows = len(pd.read_excel(self.dm.current_excel_path, sheet_name=Config.SHEET_LOG))
+
+        dm2 = self._new_dm()
+        with patch.object(dm2.file_handler, "write_sheets") as write:
+            self.assertTrue(dm2.load_data()[0])
+        write.assert_not_called()
+        self.assertEqual(len(dm2.df_log), log_rows)
+        self.assertEqual(len(dm2.df_payment), 2)
+        self.assertFalse(os.path.exists(dm2.journal_handler.path))
+        dm2.worker.shutdown(wait=True)
+
+    def test_failed_replay_is_kept_and_reported(self):
+        journal = self.dm.journal_handler
+        rejected = []
+        journal.add_reject_listener(rejected.extend)
+        self.assertTrue(self.dm.update_order_status("OD-231210-001", "생산중")[0])
+        self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+        # 저장 전에 다른 사용자가 OD-231210-002를 삭제한 상황
+        data = journal._committed["data"]
+        journal._committed["data"] = data[data["관리번호"] != "OD-231210-002"].reset_index(drop=True)
+
+        self.assertTrue(journal.flush()[0])
+        self.dm.worker.process_callbacks()
+
+        self.assertEqual(self._disk_statuses(), {"OD-231210-001": "생산중"})
+        self.assertEqual([(entry["op"], entry["params"]["mgmt_no"]) for entry in rejected],
+                         [("update_status", "OD-231210-002")])
+        with open(journal.rejects_path, encoding="utf-8") as f:
+            kept = [json.loads(line) for line in f]
+        self.assertEqual(kept, rejected)
+        self.assertTrue(kept[0]["error"])
+        self.assertIn("실패 1건", self.dm.df_log["상세내용"].iloc[-1])
+
+    def test_failed_flush_backs_off_and_notifies(self):
+        journal = self.dm.journal_handler
+        messages = []
+        journal.add_status_listener(messages.append)
+        self.assertTrue(self.dm.update_order_status("OD-231210-001", "생산중")[0])
+
+        delays = []
+        with patch.object(journal, "_start_timer", side_effect=delays.append), \
+                patch.object(self.dm.file_handler, "write_sheets", side_effect=PermissionError("열려 있음")):
+            self.assertFalse(journal.flush()[0])
+            self.assertFalse(journal.flush()[0])
+            # 재시도 중에는 새 작업이 들어와도 재시도 간격을 당기지 않음
+            self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+            self.dm.worker.process_callbacks()
+            self.assertEqual(delays, [Config.JOURNAL_RETRY_DELAY, Config.JOURNAL_RETRY_DELAY * 2])
+            self.assertTrue(messages[-1].startswith("⚠️ 저장 재시도 중"))
+
+        self.assertTrue(journal.flush()[0])
+        self.dm.worker.process_callbacks()
+        self.assertEqual(messages[-1], "")
+        self.assertEqual(self._disk_statuses(), {"OD-231210-001": "생산중", "OD-231210-002": "생산중"})
+
+    def test_each_batch_is_logged_once(self):
+        journal = self.dm.journal_handler
+        messages = []
+        journal.add_status_listener(messages.append)
+        # 파일에 저장되기 전에는 저장 대기로 안내
+        self.assertEqual(self.dm.update_order_status("OD-231210-001", "생산중"), (True, journal.QUEUED_MSG))
+        self.dm.worker.process_callbacks()
+        self.assertEqual(messages, ["💾 저장 대기 중 (1건)"])
+        first = journal._pending[0][0]
+        self.assertTrue(journal.flush()[0])
+
+        # 이미 반영된 묶음이 다음 저장에 다시 섞여도 로그는 묶음당 한 줄
+        self.assertTrue(self.dm.update_order_status("OD-231210-002", "생산중")[0])
+        journal._pending.insert(0, (first, journal._build(first["op"], first["params"])))
+        self.assertTrue(journal.flush()[0])
+        details = self.dm.df_log.loc[self.dm.df_log["구분"] == journal.LOG_ACTION, "상세내용"].tolist()
+        batches = [batch for text in details for batch in journal._BATCH_PATTERN.search(text).group(1).split(",")]
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(set(batches)), 2)
+
+    def test_disabled_writes_immediately(self):
+        self.dm.group_commit = False
+        self.assertTrue(self.dm.update_order_status("OD-231210-001", "생산중")[0])
+        self.assertEqual(self._disk_statuses()["OD-231210-001"], "생산중")
+        self.assertFalse(os.path.exists(self.dm.journal_handler.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
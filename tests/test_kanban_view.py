@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from ui.views.kanban_view import KanbanView, board_rows
+
+
+class FakeCard:
+    """화면 없이 카드 재사용/갱신 횟수를 세는 대역"""
+    def __init__(self):
+        self.values, self.updates, self.packed = None, 0, False
+
+    def show(self, *values):
+        if values == self.values: return False
+        self.values, self.updates = values, self.updates + 1
+        return True
+
+    def pack(self, **kwargs): self.packed = True
+    def pack_forget(self): self.packed = False
+
+
+class TestKanbanView(unittest.TestCase):
+    def setUp(self):
+        self.dm = DataManager()
+        self.dm.df_data = pd.DataFrame([
+            {"관리번호": f"OD-{i:03d}", "업체명": "A", "모델명": "M", "합계금액": 100 * i, "Status": "주문"}
+            for i in range(1, 6)
+        ] + [
+            {"관리번호": "OD-006", "업체명": "B", "모델명": "M1", "합계금액": 10, "Status": "납품대기/입금완료"},
+            {"관리번호": "OD-006", "업체명": "B", "모델명": "M2", "합계금액": 20, "Status": "납품대기/입금완료"},
+            {"관리번호": "OD-007", "업체명": "C", "모델명": "M", "합계금액": 10, "Status": "취소"},
+        ])
+
+        self.view = KanbanView.__new__(KanbanView)
+        self.view.dm = self.dm
+        self.view.columns = {"견적": {}, "주문": {}, "생산중": {}, "납품/입금": {}, "완료": {}}
+        self.view.column_frames = {s: {"frame": MagicMock(), "badge": MagicMock(), "more": MagicMock()}
+                                   for s in self.view.columns}
+        self.view.PAGE_SIZE = 3
+        self.view._init_pool()
+        self.created = []
+        self.view._new_card = lambda status: self.created.append(FakeCard()) or self.created[-1]
+
+    def _shown(self, status):
+        return [self.view.cards[status][m].values[0] for m in self.view.packed[status]]
+
+    def test_board_rows_groups_orders_into_columns(self):
+        rows = board_rows(self.dm.get_order_summary(), self.view.columns)
+        self.assertEqual(list(rows.index), [f"OD-{i:03d}" for i in range(1, 7)])
+        self.assertEqual(rows.loc["OD-006", "column"], "납품/입금")
+        self.assertEqual((rows.loc["OD-006", "모델명"], rows.loc["OD-006", "합계금액"]), ("M1 외 1건", 30))
+
+    def test_columns_are_capped_and_extended(self):
+        self.view.refresh_data()
+        self.assertEqual(self._shown("주문"), ["OD-001", "OD-002", "OD-003"])
+        self.view.column_frames["주문"]["badge"].configure.assert_called_with(text="5")
+        self.view.column_frames["주문"]["more"].configure.assert_called_with(text="더 보기 (2건 남음)")
+
+        self.view.show_more("주문")
+        self.assertEqual(self._shown("주문"), [f"OD-{i:03d}" for i in range(1, 6)])
+        self.view.column_frames["주문"]["more"].pack_forget.assert_called()
+
+    def test_refresh_reuses_cards_and_updates_only_changed_ones(self):
+        self.view.refresh_data()
+        self.assertEqual(len(self.created), 4)
+        first = self.view.cards["주문"]["OD-001"]
+
+        # 변경 없이 다시 호출하면 아무것도 하지 않음
+        self.view.refresh_data()
+        self.assertEqual(sum(card.updates for card in self.created), 4)
+
+        # OD-002가 생산중으로 이동, OD-001 금액 변경
+        df = self.dm.df_data.copy()
+        df.loc[df["관리번호"] == "OD-002", "Status"] = "생산중"
+        df.loc[df["관리번호"] == "OD-001", "합계금액"] = 999
+        self.dm.df_data = df
+        self.view.refresh_data()
+
+        self.assertIs(self.view.cards["주문"]["OD-001"], first)
+        self.assertEqual(first.updates, 2)
+        self.assertEqual(self._shown("주문"), ["OD-001", "OD-003", "OD-004"])
+        self.assertEqual(self._shown("생산중"), ["OD-002"])
+        # 주문 컬럼에서 빠진 카드를 OD-004에 재사용, 생산중 컬럼 카드만 새로 생성
+        self.assertEqual(len(self.created), 5)
+        self.assertEqual(self.view.cards["주문"]["OD-003"].updates, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
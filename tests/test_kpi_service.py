@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data import kpi_service, schema
+from managers.data.kpi_service import compute_kpis
+from managers.data_manager import DataManager
+
+
+class TestKpiService(unittest.TestCase):
+    def setUp(self):
+        self.today = datetime(2023, 12, 10)
+        self.dm = DataManager()
+        self.dm.df_data = schema.apply_data_schema(pd.DataFrame([
+            {"관리번호": "OD-001", "Status": "완료", "입금완료일": "2023-12-01", "합계금액": "1,000", "미수금액": 0, "출고예정일": "2023-12-01"},
+            {"관리번호": "OD-002", "Status": "완료", "입금완료일": "2023-11-30", "합계금액": 500, "미수금액": 0, "출고예정일": "-"},
+            {"관리번호": "OD-003", "Status": "주문", "입금완료일": "-", "합계금액": 300, "미수금액": 300, "출고예정일": "2023-12-10"},
+            {"관리번호": "OD-004", "Status": "납품완료/입금대기", "입금완료일": "-", "합계금액": 200, "미수금액": 150, "출고예정일": "2023-12-05"},
+            {"관리번호": "OD-005", "Status": "견적", "입금완료일": "-", "합계금액": 100, "미수금액": 0, "출고예정일": "-"},
+            {"관리번호": "OD-006", "Status": "취소", "입금완료일": "-", "합계금액": 100, "미수금액": 0, "출고예정일": "2023-12-03"},
+        ]))
+
+    def test_kpis_match_dashboard_rules(self):
+        # "납품완료/입금대기"도 기존 규칙대로 "완료"가 포함된 상태로 취급
+        kpis = compute_kpis(self.dm.df_data, self.today)
+        self.assertEqual((kpis["revenue"], kpis["unpaid"]), (1000, 450))
+        self.assertEqual((kpis["active"], kpis["today_shipments"]), (2, 1))
+        self.assertEqual(kpis["pipeline"], {"견적": 1, "주문": 1, "생산중": 0, "납품대기": 0, "입금대기": 1, "완료": 3})
+        self.assertEqual(kpis["deliveries"]["관리번호"].tolist(), ["OD-003"])
+
+    def test_results_are_memoized_per_data_version(self):
+        with patch.object(kpi_service, "compute_kpis", wraps=compute_kpis) as spy:
+            first = self.dm.kpi_service.get(self.today)
+            self.assertIs(self.dm.kpi_service.get(self.today), first)
+            self.assertEqual(spy.call_count, 1)
+
+            # 날짜가 바뀌면 다시 계산
+            self.dm.kpi_service.get(datetime(2023, 12, 11))
+            self.assertEqual(spy.call_count, 2)
+
+            # 저장으로 시트가 교체되면 다시 계산
+            df = self.dm.df_data.copy()
+            df.loc[2, "미수금액"] = 0
+            self.dm.df_data = df
+            self.assertEqual(self.dm.kpi_service.get(self.today)["unpaid"], 150)
+            self.assertEqual(spy.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
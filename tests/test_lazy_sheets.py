@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestLazySheets(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.group_commit = False
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+        data = pd.DataFrame([{
+            "관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A",
+            "수량": 1, "합계금액": 1100, "Status": "주문"
+        }])
+        payment = pd.DataFrame([{"관리번호": "OD-231210-001", "입금액": 500}])
+        log = pd.DataFrame([{"일시": "2023-12-10 09:00:00", "작업자": "tester", "구분": "주문 등록", "상세내용": "-"}])
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client A"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+            payment.to_excel(writer, sheet_name=Config.SHEET_PAYMENT, index=False)
+            log.to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
+
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _disk(self, sheet_name):
+        return pd.read_excel(self.dm.current_excel_path, sheet_name=sheet_name)
+
+    def test_load_skips_lazy_sheets(self):
+        for key in Config.LAZY_SHEET_KEYS:
+            self.assertFalse(self.dm.sheets.is_loaded(key), key)
+        self.assertTrue(self.dm.sheets.is_loaded("data"))
+        self.assertTrue(self.dm.sheets.is_loaded("clients"))
+
+    def test_first_access_reads_sheet_once(self):
+        with patch.object(self.dm.file_handler, "read_all_sheets", wraps=self.dm.file_handler.read_all_sheets) as spy:
+            self.assertEqual(self.dm.df_payment.iloc[0]["입금액"], 500)
+            self.assertEqual(len(self.dm.df_payment), 1)
+        spy.assert_called_once_with(None, ["payment"])
+        self.assertFalse(self.dm.sheets.is_loaded("delivery"))
+
+    def test_transaction_keeps_unread_sheets_on_disk(self):
+        success, msg = self.dm.update_order_status("OD-231210-001", "생산중")
+        self.assertTrue(success, msg)
+
+        self.assertFalse(self.dm.sheets.is_loaded("payment"))
+        self.assertEqual(len(self.dm.df_log), 2)
+        self.assertEqual(len(self._disk(Config.SHEET_LOG)), 2)
+        self.assertEqual(self._disk(Config.SHEET_PAYMENT).iloc[0]["입금액"], 500)
+
+    def test_full_save_includes_unread_sheets(self):
+        success, msg = self.dm.save_to_excel()
+        self.assertTrue(success, msg)
+        self.assertEqual(self._disk(Config.SHEET_PAYMENT).iloc[0]["입금액"], 500)
+        self.assertEqual(len(self._disk(Config.SHEET_LOG)), 1)
+
+    def test_reload_discards_cached_sheets(self):
+        self.assertEqual(len(self.dm.df_log), 1)
+        self.assertTrue(self.dm.sheets.is_loaded("log"))
+
+        self.assertTrue(self.dm.load_data()[0])
+        self.assertFalse(self.dm.sheets.is_loaded("log"))
+
+
+if __name__ == "__main__":
+    unittest.main()
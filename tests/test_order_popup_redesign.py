@@ -52,9 +52,12 @@ class TestOrderPopupRedesign(unittest.TestCase):
             "세액": [10],
             "합계금액": [110]
         })
-        self.mock_dm.get_next_order_id.return_value = "OD-231210-001"
+        self.mock_dm.peek_next_id.return_value = "OD-231210-001"
+        self.mock_dm.reserve_id.side_effect = lambda mgmt_no: mgmt_no
         self.mock_dm.add_order.return_value = (True, "Success")
         self.mock_dm.update_order.return_value = (True, "Success")
+        # 백그라운드 저장을 바로 실행
+        self.mock_dm.run_async.side_effect = lambda func, *args, callback=None, **kwargs: callback(func(*args, **kwargs))
 
     def test_load_quote_data(self):
         # Open OrderPopup with Quote ID
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data import order_summary
+from managers.data_manager import DataManager
+
+
+class TestOrderSummary(unittest.TestCase):
+    def setUp(self):
+        self.dm = DataManager()
+        self.dm.df_data = pd.DataFrame([
+            {"관리번호": "OD-002", "업체명": "B", "모델명": "M1", "수량": "1,000", "공급가액": 100, "합계금액": 110, "Status": "주문", "출고예정일": "-"},
+            {"관리번호": "OD-001", "업체명": "A", "모델명": "M2", "수량": "2", "공급가액": 200, "합계금액": 220, "Status": "생산중", "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-001", "업체명": "A", "모델명": "M3", "수량": "3", "공급가액": 300, "합계금액": 330, "Status": "주문", "출고예정일": "2023-12-05"},
+            {"관리번호": "OD-001", "업체명": "A", "모델명": "M4", "수량": "x", "공급가액": 400, "합계금액": 440, "Status": "주문", "출고예정일": "-"},
+        ])
+
+    def test_rollup_columns(self):
+        summary = self.dm.get_order_summary()
+        self.assertEqual(list(summary.index), ["OD-002", "OD-001"])
+        row = summary.loc["OD-001"]
+        self.assertEqual((row["품목수"], row["모델명"], row["Status"]), (3, "M2", "생산중"))
+        self.assertEqual((row["수량합계"], row["공급가액합계"], row["합계금액합계"]), (5, 900, 990))
+        self.assertEqual((row["대표상태"], row["최초출고예정일"]), ("주문", "2023-12-05"))
+        self.assertEqual(summary.loc["OD-002", "수량합계"], 1000)
+        self.assertTrue(pd.isna(summary.loc["OD-002", "최초출고예정일"]))
+
+    def test_only_changed_orders_are_summarized_again(self):
+        self.dm.order_summary.FULL_REBUILD_RATIO = 1.0  # 건 수가 적어도 부분 갱신하도록
+        self.dm.get_order_summary()
+        self.assertIs(self.dm.get_order_summary(), self.dm.get_order_summary())
+
+        df = self.dm.df_data.copy()
+        df.loc[0, "Status"] = "생산중"
+        df = pd.concat([df, pd.DataFrame([{"관리번호": "OD-003", "업체명": "C", "모델명": "M9", "수량": "1", "공급가액": 10,
+                                           "합계금액": 11, "Status": "견적", "출고예정일": "-"}])], ignore_index=True)
+        self.dm.df_data = df
+        with patch.object(order_summary, "summarize_orders", wraps=order_summary.summarize_orders) as spy:
+            summary = self.dm.get_order_summary()
+        self.assertEqual(sorted(spy.call_args[0][0]["관리번호"].unique()), ["OD-002", "OD-003"])
+        self.assertEqual(list(summary.index), ["OD-002", "OD-001", "OD-003"])
+        self.assertEqual(summary.loc["OD-002", "대표상태"], "생산중")
+        pd.testing.assert_frame_equal(summary, order_summary.summarize_orders(df), check_dtype=False)
+
+        # 삭제된 건은 요약에서 빠짐
+        self.dm.df_data = df[df["관리번호"] != "OD-001"]
+        self.assertEqual(list(self.dm.get_order_summary().index), ["OD-002", "OD-003"])
+
+    def test_production_date_sync_refreshes_summary(self):
+        self.assertTrue(pd.isna(self.dm.get_order_summary().loc["OD-002", "최초출고예정일"]))
+        self.dm.delivery_handler.apply_production_dates({"OD-002": "2023-12-01"})
+        self.assertEqual(self.dm.get_order_summary().loc["OD-002", "최초출고예정일"], "2023-12-01")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data.parallel_loader import ParallelLoader
+
+
+class TestParallelLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "Book.xlsx")
+        with pd.ExcelWriter(self.path, engine="openpyxl") as writer:
+            pd.DataFrame({"관리번호": ["A", "B"], "수량": [1, 2]}).to_excel(writer, sheet_name="Data", index=False)
+            pd.DataFrame({"업체명": ["Client A"]}).to_excel(writer, sheet_name="Clients", index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _check(self, sheets):
+        self.assertEqual(sheets["Data"]["수량"].tolist(), [1, 2])
+        self.assertEqual(sheets["Clients"]["업체명"].tolist(), ["Client A"])
+        self.assertIsNone(sheets["Missing"])
+
+    def test_sheets_parsed_in_worker_processes(self):
+        loader = ParallelLoader(max_workers=2, min_size=0)
+        loader.enabled = True
+        try:
+            self._check(loader.read_excel_sheets(self.path, ["Data", "Clients", "Missing"]))
+            self.assertIsNotNone(loader._pool)
+        finally:
+            loader.shutdown()
+
+    def test_small_file_read_in_current_thread(self):
+        loader = ParallelLoader(min_size=10 * 1024 * 1024)
+        self._check(loader.read_excel_sheets(self.path, ["Data", "Clients", "Missing"]))
+        self.assertIsNone(loader._pool)
+
+    def test_broken_pool_falls_back_to_sequential(self):
+        loader = ParallelLoader(min_size=0)
+        loader.enabled = True
+        with patch.object(loader, "_get_pool", side_effect=BrokenProcessPool("no workers")):
+            self._check(loader.read_excel_sheets(self.path, ["Data", "Clients", "Missing"]))
+        self.assertFalse(loader.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
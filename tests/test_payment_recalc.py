@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from managers.data.index_handler import IndexHandler
+from managers.data.payment_handler import PaymentHandler
+
+
+class TestPaymentRecalc(unittest.TestCase):
+    def setUp(self):
+        self.mock_dm = MagicMock(spec=DataManager)
+        self.mock_dm.log_handler = MagicMock()
+        self.mock_dm.index_handler = IndexHandler(self.mock_dm)
+        self.handler = PaymentHandler(self.mock_dm)
+
+        self.dfs = {
+            "data": pd.DataFrame([
+                {"관리번호": "OD-1", "합계금액": "1,000", "Delivery Status": "완료", "Payment Status": "대기", "Status": "주문", "입금완료일": "-"},
+                {"관리번호": "OD-1", "합계금액": 500, "Delivery Status": "완료", "Payment Status": "대기", "Status": "주문", "입금완료일": "-"},
+                {"관리번호": "OD-2", "합계금액": 300, "Delivery Status": "대기", "Payment Status": "대기", "Status": "주문", "입금완료일": "-"},
+                {"관리번호": "OD-3", "합계금액": 200, "Delivery Status": "완료", "Payment Status": "대기", "Status": "주문", "입금완료일": "-"},
+            ]),
+            "payment": pd.DataFrame([
+                {"관리번호": "OD-1", "입금액": 700, "일시": "2023-12-01 09:00:00"},
+                {"관리번호": "OD-1", "입금액": "800", "일시": "2023-12-05 10:00:00"},
+                {"관리번호": "OD-2", "입금액": 100, "일시": "2023-12-03"},
+            ]),
+        }
+
+    def test_fifo_allocation_and_promotion(self):
+        self.handler.recalc_all_payment_status(self.dfs)
+        df = self.dfs["data"]
+
+        self.assertEqual(df["기수금액"].tolist(), [1000, 500, 100, 0])
+        self.assertEqual(df["미수금액"].tolist(), [0, 0, 200, 200])
+        self.assertEqual(df["Payment Status"].tolist(), ["완료", "완료", "대기", "대기"])
+        self.assertEqual(df["입금완료일"].tolist(), ["2023-12-05", "2023-12-05", "-", "-"])
+        self.assertEqual(df["Status"].tolist(), ["회계처리", "회계처리", "주문", "주문"])
+
+    def test_partial_payment_fills_first_item(self):
+        self.dfs["payment"] = self.dfs["payment"].iloc[[0]]
+        self.handler.recalc_payment_status(self.dfs, "OD-1")
+        df = self.dfs["data"]
+
+        self.assertEqual(df["기수금액"].tolist()[:2], [700, 0])
+        self.assertEqual(df["Payment Status"].tolist()[:2], ["대기", "대기"])
+        # 대상이 아닌 주문은 변경하지 않음
+        self.assertTrue(pd.isna(df.loc[2, "기수금액"]))
+
+    def test_negative_item_uses_sequential_allocation(self):
+        self.dfs["data"].loc[1, "합계금액"] = -200
+        self.handler.recalc_all_payment_status(self.dfs, ["OD-1"])
+        df = self.dfs["data"]
+
+        self.assertEqual(df["기수금액"].tolist()[:2], [1000, -200])
+        self.assertEqual(df["미수금액"].tolist()[:2], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
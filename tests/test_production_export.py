@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import openpyxl
+import pandas as pd
+
+from managers.data_manager import DataManager
+
+
+class TestProductionExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.df_clients = pd.DataFrame([
+            {"업체명": "Client A", "특이사항": "포장 주의"},
+            {"업체명": "Client B", "특이사항": float("nan")},
+        ])
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append(["관리번호", "업체명", "모델명", "Description", "수량"])
+        ws.append(["OD-231210-001", "Client A", "Model A", "Desc A", 1])
+        ws.append(["OD-231210-009", "Client B", "Model Z", None, 5])
+        wb.save(self.dm.production_request_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _rows(self):
+        wb = openpyxl.load_workbook(self.dm.production_request_path)
+        rows = list(wb["Data"].iter_rows(min_row=2, values_only=True))
+        wb.close()
+        return rows
+
+    def test_updates_existing_and_appends_new_rows(self):
+        rows_data = [
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A", "Description": "Desc A", "수량": 3},
+            {"관리번호": "OD-231210-002", "업체명": "Client B", "모델명": "Model B", "Description": "Desc B", "수량": 2},
+            {"관리번호": "OD-231210-009", "업체명": "Client B", "모델명": "Model Z", "Description": "", "수량": 7},
+            {"관리번호": "OD-231210-002", "업체명": "Client B", "모델명": "Model B", "Description": "Desc B", "수량": 4},
+        ]
+        success, msg = self.dm.export_to_production_request(rows_data)
+        self.assertTrue(success, msg)
+        self.assertEqual(msg, "신규: 1건, 업데이트: 3건")
+
+        rows = self._rows()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual((rows[0][0], rows[0][4], rows[0][6]), ("OD-231210-001", 3, "포장 주의"))
+        self.assertEqual((rows[1][0], rows[1][4]), ("OD-231210-009", 7))
+        self.assertEqual((rows[2][0], rows[2][4], rows[2][6]), ("OD-231210-002", 4, "-"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+
+from managers.data import production_reader
+from managers.data_manager import DataManager
+
+
+class TestProductionReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self._write([
+            ["OD-231210-001", "Client A", "Model A", "Desc A", 1, "-", "-", "-", datetime(2023, 12, 20), "-", "SN-001", "-", "-", "생산 완료"],
+            ["OD-231210-002", "Client B", "Model B", None, 2, "-", "-", "-", "-", "-", None, "-", "-", None],
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write(self, rows):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append([f"col{i}" for i in range(14)])
+        for row in rows:
+            ws.append(row)
+        wb.save(self.dm.production_request_path)
+
+    def test_single_parse_serves_all_maps(self):
+        with patch.object(production_reader, "parse_production_request",
+                          wraps=production_reader.parse_production_request) as spy:
+            self.assertEqual(self.dm.delivery_handler.read_production_dates(), {"OD-231210-001": "2023-12-20"})
+            self.assertEqual(self.dm.get_production_status_map(),
+                             {"OD-231210-001": "생산 완료", "OD-231210-002": "-"})
+            serials = self.dm.get_serial_number_map()
+            self.assertEqual(serials[("OD-231210-001", "Model A", "Desc A")], "SN-001")
+            self.assertEqual(serials[("OD-231210-002", "Model B", "")], "-")
+        self.assertEqual(spy.call_count, 1)
+
+    def test_changed_file_is_parsed_again(self):
+        self.assertEqual(self.dm.get_production_status_map()["OD-231210-001"], "생산 완료")
+        self._write([["OD-231210-001", "Client A", "Model A", "Desc A", 1, "-", "-", "-", "-", "-", "-", "-", "-", "출고 대기"]])
+        os.utime(self.dm.production_request_path, (0, 1_000_000_000))
+        self.assertEqual(self.dm.get_production_status_map(), {"OD-231210-001": "출고 대기"})
+
+    def test_missing_file_returns_empty_maps(self):
+        os.remove(self.dm.production_request_path)
+        self.assertIsNone(self.dm.delivery_handler.read_production_dates())
+        self.assertEqual(self.dm.get_serial_number_map(), {})
+
+    def test_apply_dates_reports_changed_rows(self):
+        self.dm.df_data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "출고예정일": "-"},
+            {"관리번호": "OD-231210-001", "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-231210-003", "출고예정일": "2023-11-01"},
+        ])
+        changed = self.dm.sync_production_dates()
+        self.assertEqual(list(changed), [0])
+        self.assertEqual(self.dm.df_data["출고예정일"].tolist(), ["2023-12-20", "2023-12-20", "2023-11-01"])
+
+        # 변경 없는 재동기화는 빈 결과
+        self.assertTrue(self.dm.sync_production_dates().empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,7 +36,8 @@ class TestPurchasePopupUI(unittest.TestCase):
             "입고상태", "지급상태", "견적서경로", "예금주", "계좌번호", "은행명", "Swift Code", "은행주소",
             "품목명", "모델명", "Description", "수량", "단가", "공급가액", "세액", "합계금액"
         ])
-        self.mock_dm.get_next_purchase_id.return_value = "PO-20241209-001"
+        self.mock_dm.peek_next_id.return_value = "PO-20241209-001"
+        self.mock_dm.reserve_id.side_effect = lambda mgmt_no: mgmt_no
         
         self.popup = PurchasePopup(self.root, self.mock_dm, lambda: None)
 
@@ -34,7 +34,10 @@ class TestQuotePopupUI(unittest.TestCase):
             "유효기간", "결제조건", "지급조건", "보증기간",
             "품목명", "모델명", "Description", "수량", "단가", "공급가액", "세액", "합계금액"
         ])
-        self.mock_dm.get_next_quote_id.return_value = "QT-20241210-001"
+        self.mock_dm.peek_next_id.return_value = "QT-20241210-001"
+        self.mock_dm.reserve_id.side_effect = lambda mgmt_no: mgmt_no
+        # 백그라운드 저장을 바로 실행
+        self.mock_dm.run_async.side_effect = lambda func, *args, callback=None, **kwargs: callback(func(*args, **kwargs))
         
         self.popup = QuotePopup(self.root, self.mock_dm, lambda: None)
 
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from managers.data import schema
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestDataSchema(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dm = DataManager()
+        self.dm.group_commit = False
+        self.dm.current_excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        self.dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        self.dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+        data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A", "수량": "1,000",
+             "공급가액": 1000, "합계금액": "1,100", "Status": "주문", "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-231210-002", "업체명": "Client A", "모델명": "Model B", "수량": 2,
+             "공급가액": None, "합계금액": 2200, "Status": "주문", "출고예정일": None},
+        ])
+        with pd.ExcelWriter(self.dm.current_excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client A"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+            pd.DataFrame(columns=Config.LOG_COLUMNS).to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
+
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+
+    def tearDown(self):
+        self.dm.worker.shutdown(wait=True)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_columns_are_typed_after_load(self):
+        df = self.dm.df_data
+        for col in Config.DATA_NUMBER_COLS:
+            self.assertEqual(df[col].dtype, "float64", col)
+        for col in Config.DATA_CATEGORY_COLS:
+            if col not in df.columns: continue
+            self.assertIsInstance(df[col].dtype, pd.CategoricalDtype, col)
+        self.assertEqual(df["수량"].tolist(), [1000.0, 2.0])
+        self.assertEqual(df["공급가액"].tolist(), [1000.0, 0.0])
+        self.assertEqual(df["출고예정일"].tolist(), ["2023-12-20", "-"])
+
+    def test_transaction_can_write_new_category_values(self):
+        def update(dfs):
+            mask = dfs["data"]["관리번호"] == "OD-231210-002"
+            dfs["data"].loc[mask, "Status"] = "생산중"
+            dfs["data"].loc[mask, "업체명"] = "Client B"
+            return True, ""
+
+        success, msg = self.dm.execute_transaction(update)
+        self.assertTrue(success, msg)
+        df = self.dm.df_data
+        self.assertEqual(df["Status"].tolist(), ["주문", "생산중"])
+        self.assertEqual(df["업체명"].tolist(), ["Client A", "Client B"])
+        self.assertIsInstance(df["Status"].dtype, pd.CategoricalDtype)
+
+    def test_sheets_equal_ignores_category_dtype(self):
+        typed = self.dm.df_data
+        plain = schema.editable(typed)
+        self.assertTrue(schema.sheets_equal(typed, plain))
+        plain.loc[0, "Status"] = "완료"
+        self.assertFalse(schema.sheets_equal(typed, plain))
+
+    def test_to_float_handles_text(self):
+        self.assertEqual([schema.to_float(v) for v in ("1,200", "", "-", None, float("nan"), 3)],
+                         [1200.0, 0.0, 0.0, 0.0, 0.0, 3.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from managers.data_manager import DataManager
+from managers.data import search_index
+
+
+def _search(search, keyword, df, base, scope=None):
+    rows = search.match(keyword, df, search.candidates(keyword, df, base, scope))
+    search.commit(keyword, df, rows, scope)
+    return rows
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.dm = DataManager()
+        self.dm.df_data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "업체명": "한국전자", "모델명": "ABC-100", "Description": "Sensor", "Status": "주문"},
+            {"관리번호": "OD-231210-001", "업체명": "한국전자", "모델명": "ABC-200", "Description": "Cable", "Status": "주문"},
+            {"관리번호": "OD-231211-002", "업체명": "Global Tech", "모델명": "XYZ-9", "Description": "한국형 센서", "Status": "완료"},
+        ])
+
+    def _rows(self, keyword):
+        return list(self.dm.search_index.search(keyword))
+
+    def test_substring_search_over_target_columns(self):
+        self.assertEqual(self._rows("전자"), [0, 1])
+        self.assertEqual(self._rows("한국"), [0, 1, 2])
+        self.assertEqual(self._rows("abc-2"), [1])
+        self.assertEqual(self._rows("SENSOR"), [0])
+        self.assertEqual(self._rows("231211"), [2])
+        self.assertEqual(self._rows("없는값"), [])
+        self.assertEqual(self._rows("("), [])
+
+    def test_filtered_data_combines_status_and_keyword(self):
+        self.assertEqual(self.dm.get_filtered_data(["주문"], "abc")["모델명"].tolist(), ["ABC-100", "ABC-200"])
+        self.assertEqual(self.dm.get_filtered_data(["완료"], "abc").index.tolist(), [])
+        self.assertEqual(len(self.dm.get_filtered_data(None, "")), 3)
+
+    def test_mutation_only_indexes_new_values(self):
+        self.dm.search_index.update()
+        with patch.object(search_index, "_trigrams", wraps=search_index._trigrams) as spy:
+            new_row = {"관리번호": "OD-231212-003", "업체명": "한국전자", "모델명": "ABC-100", "Description": "신규 품목", "Status": "주문"}
+            self.dm.df_data = pd.concat([self.dm.df_data, pd.DataFrame([new_row])], ignore_index=True)
+            self.assertEqual(self._rows("신규"), [3])
+            self.assertEqual(self._rows("한국전자"), [0, 1, 3])
+        # 새 관리번호, 새 Description과 검색어 2개만 3-gram 분해
+        self.assertEqual(spy.call_count, 4)
+
+        # 값이 바뀐 행은 이전 값으로 검색되지 않음
+        df = self.dm.df_data.copy()
+        df.loc[3, "업체명"] = "대한상사"
+        self.dm.df_data = df
+        self.assertEqual(self._rows("한국전자"), [0, 1])
+        self.assertEqual(self._rows("대한"), [3])
+
+    def test_mask_matches_against_the_given_df(self):
+        index = self.dm.search_index
+        other = self.dm.df_data.assign(업체명="Other", Description="-")
+        trigrams = search_index._trigrams
+        updated = []
+
+        def update_elsewhere(keyword):
+            # 검색 도중 다른 스레드(저장/로드)가 다른 df로 인덱스를 갱신한 상황
+            if keyword == "전자" and not updated:
+                updated.append(True)
+                index.update(other)
+            return trigrams(keyword)
+
+        with patch.object(search_index, "_trigrams", side_effect=update_elsewhere):
+            self.assertEqual(list(index.mask("전자", self.dm.df_data)), [True, True, False])
+        self.assertTrue(updated)
+
+    def test_incremental_search_refines_previous_result(self):
+        search = search_index.IncrementalSearch(self.dm.search_index)
+        df = self.dm.df_data
+        base = np.arange(len(df))
+        self.assertEqual(list(_search(search, "한국", df, base)), [0, 1, 2])
+
+        # 검색어를 늘리면 직전 결과 행만 검사
+        self.assertEqual(list(search.candidates("한국전", df, base)), [0, 1, 2])
+        with patch.object(self.dm.search_index, "mask", wraps=self.dm.search_index.mask) as spy:
+            self.assertEqual(list(_search(search, "한국전", df, base)), [0, 1])
+            self.assertEqual(list(spy.call_args[0][2]), [0, 1, 2])
+
+        # 글자를 지우거나 범위(scope)가 바뀌면 처음부터
+        self.assertIs(search.candidates("한", df, base), base)
+        self.assertIs(search.candidates("한국전자", df, base, scope=("주문",)), base)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestSnapshotCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.excel_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        data = pd.DataFrame([{
+            "관리번호": "OD-231210-001", "업체명": "Test Client", "모델명": "Model A",
+            "수량": 1, "합계금액": 1100, "Status": "주문"
+        }])
+        with pd.ExcelWriter(self.excel_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Test Client"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _new_dm(self):
+        dm = DataManager()
+        dm.current_excel_path = self.excel_path
+        dm.purchase_data_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+        dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+        return dm
+
+    def test_second_load_uses_snapshot(self):
+        self.assertTrue(self._new_dm().load_data()[0])
+
+        dm = self._new_dm()
+        with patch.object(dm.file_handler, "read_all_sheets") as read_spy:
+            success, msg = dm.load_data()
+        self.assertTrue(success, msg)
+        read_spy.assert_not_called()
+        self.assertEqual(dm.df_data.iloc[0]["관리번호"], "OD-231210-001")
+
+    def test_modified_workbook_invalidates_snapshot(self):
+        self.assertTrue(self._new_dm().load_data()[0])
+
+        with pd.ExcelWriter(self.excel_path, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+            pd.DataFrame([{"업체명": "Test Client"}, {"업체명": "Other Client"}]).to_excel(
+                writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+        os.utime(self.excel_path, (0, 1_000_000_000))
+
+        dm = self._new_dm()
+        dm.load_data()
+        self.assertIn("Other Client", dm.df_clients["업체명"].values)
+
+    def test_transaction_refreshes_snapshot(self):
+        dm = self._new_dm()
+        dm.load_data()
+        success, msg = dm.update_order_status("OD-231210-001", "생산중")
+        self.assertTrue(success, msg)
+        self.assertTrue(dm.flush_journal()[0])
+
+        dm2 = self._new_dm()
+        with patch.object(dm2.file_handler, "read_all_sheets") as read_spy:
+            dm2.load_data()
+        read_spy.assert_not_called()
+        self.assertEqual(dm2.df_data.iloc[0]["Status"], "생산중")
+
+
+if __name__ == "__main__":
+    unittest.main()
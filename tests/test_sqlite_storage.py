@@ -0,0 +1,133 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from managers.data_manager import DataManager
+from src.config import Config
+
+
+class TestSqliteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.sales_path = os.path.join(self.tmp_dir, "SalesList.xlsx")
+        self.purchase_path = os.path.join(self.tmp_dir, "OrderList.xlsx")
+
+        data = pd.DataFrame([
+            {"관리번호": "OD-231210-001", "업체명": "Client A", "모델명": "Model A", "수량": 1, "합계금액": 1100, "Status": "주문"},
+            {"관리번호": "OD-231210-002", "업체명": "Client B", "모델명": "Model B", "수량": 2, "합계금액": 2200, "Status": "견적"},
+        ])
+        with pd.ExcelWriter(self.sales_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"업체명": "Client A"}, {"업체명": "Client B"}]).to_excel(writer, sheet_name=Config.SHEET_CLIENTS, index=False)
+            data.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
+        with pd.ExcelWriter(self.purchase_path, engine="openpyxl") as writer:
+            pd.DataFrame([{"관리번호": "PU-231210-001", "업체명": "Vendor"}]).to_excel(writer, sheet_name="Data", index=False)
+
+        self.dm = self._new_dm()
+        success, msg = self.dm.file_handler.import_workbooks(self.sales_path, self.purchase_path)
+        self.assertTrue(success, msg)
+        success, msg = self.dm.load_data()
+        self.assertTrue(success, msg)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _new_dm(self):
+        dm = DataManager()
+        dm.storage_engine = "sqlite"
+        dm.sqlite_path = os.path.join(self.tmp_dir, "SalesManager.db")
+        dm.production_request_path = os.path.join(self.tmp_dir, "생산 요청.xlsx")
+        dm.file_handler.snapshot.cache_dir = os.path.join(self.tmp_dir, "cache")
+        return dm
+
+    def test_import_creates_indexed_tables(self):
+        self.assertEqual(len(self.dm.df_data), 2)
+        self.assertEqual(len(self.dm.df_purchase), 1)
+
+        conn = sqlite3.connect(self.dm.sqlite_path)
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        self.assertIn("idx_data_관리번호", indexes)
+        self.assertIn("idx_data_Status", indexes)
+        self.assertIn("idx_clients_업체명", indexes)
+
+    def test_transaction_updates_rows_in_place(self):
+        rowids_before = list(self.dm.file_handler.sqlite._rowids["data"])
+
+        success, msg = self.dm.update_order_status("OD-231210-002", "주문")
+        self.assertTrue(success, msg)
+        self.assertTrue(self.dm.flush_journal()[0])
+
+        # 기존 행은 rowid를 유지한 채 UPDATE 되어야 함
+        self.assertEqual(self.dm.file_handler.sqlite._rowids["data"], rowids_before)
+
+        reloaded = self._new_dm()
+        reloaded.load_data()
+        statuses = dict(zip(reloaded.df_data["관리번호"], reloaded.df_data["Status"]))
+        self.assertEqual(statuses["OD-231210-002"], "주문")
+        # 상태 변경 로그 + 저널 반영 표시
+        self.assertEqual(len(reloaded.df_log), 2)
+
+    def test_delete_and_append_rows(self):
+        success, msg = self.dm.delete_order("OD-231210-001")
+        self.assertTrue(success, msg)
+        success, msg = self.dm.add_order([{"관리번호": "OD-231210-003", "업체명": "Client A", "Status": "주문"}],
+                                         "OD-231210-003", "Client A")
+        self.assertTrue(success, msg)
+        self.assertTrue(self.dm.flush_journal()[0])
+
+        reloaded = self._new_dm()
+        reloaded.load_data()
+        self.assertEqual(reloaded.df_data["관리번호"].tolist(), ["OD-231210-002", "OD-231210-003"])
+
+    def _db_rowids(self):
+        conn = sqlite3.connect(self.dm.sqlite_path)
+        rows = dict(conn.execute('SELECT "관리번호", rowid FROM "data"').fetchall())
+        conn.close()
+        return rows
+
+    def test_deleting_a_middle_row_keeps_later_rows(self):
+        success, msg = self.dm.add_order([{"관리번호": "OD-231210-003", "업체명": "Client A", "Status": "주문"}],
+                                         "OD-231210-003", "Client A")
+        self.assertTrue(success, msg)
+        self.assertTrue(self.dm.flush_journal()[0])
+        before = self._db_rowids()
+
+        storage = self.dm.file_handler.sqlite
+        statements, connect = [], storage._connect
+        def traced_connect():
+            conn = connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+        with patch.object(storage, "_connect", side_effect=traced_connect):
+            success, msg = self.dm.delete_order("OD-231210-001")
+            self.assertTrue(success, msg)
+        # 뒤의 행은 다시 쓰지 않고 지운 행만 DELETE
+        writes = [sql.split()[0] for sql in statements
+                  if sql.split()[0] in ("INSERT", "UPDATE", "DELETE") and '"data"' in sql]
+        self.assertEqual(writes, ["DELETE"])
+        after = self._db_rowids()
+        self.assertEqual(after, {no: before[no] for no in ("OD-231210-002", "OD-231210-003")})
+
+    def test_missing_db_is_an_error_not_empty_data(self):
+        dm = self._new_dm()
+        dm.sqlite_path = os.path.join(self.tmp_dir, "missing", "SalesManager.db")
+        success, msg = dm.load_data()
+        self.assertFalse(success)
+        self.assertIn("SQLite DB 파일이 없습니다", msg)
+        self.assertFalse(os.path.exists(dm.sqlite_path))
+
+    def test_export_to_excel(self):
+        out_path = os.path.join(self.tmp_dir, "Export.xlsx")
+        success, msg = self.dm.export_to_excel(out_path)
+        self.assertTrue(success, msg)
+        exported = pd.read_excel(out_path, sheet_name=Config.SHEET_DATA)
+        self.assertEqual(len(exported), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from utils.startup_timer import StartupTimer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartup(unittest.TestCase):
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        code = ("import sys, main; "
+                "print([m for m in sys.modules if m == 'matplotlib' or m.startswith(('ui.views.', 'ui.popups.'))])")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_timer_reports_each_step(self):
+        timer = StartupTimer(started=0.0)
+        timer.mark("import")
+        timer.mark("데이터 로드")
+        self.assertEqual([name for name, _ in timer.steps], ["import", "데이터 로드"])
+        self.assertAlmostEqual(sum(seconds for _, seconds in timer.steps), timer.total)
+        report = timer.report().splitlines()
+        self.assertEqual(report[0], "[시작 시간]")
+        self.assertIn("데이터 로드", report[2])
+        self.assertIn("합계", report[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,16 @@ from managers.data_manager import DataManager
 from managers.data.order_handler import OrderHandler
 from managers.data.delivery_handler import DeliveryHandler
 from managers.data.payment_handler import PaymentHandler
+from managers.data.index_handler import IndexHandler
+from managers.data.journal_handler import JournalHandler
 
 class TestStatusSchema(unittest.TestCase):
     def setUp(self):
         self.mock_dm = MagicMock(spec=DataManager)
         self.mock_dm.log_handler = MagicMock()
+        self.mock_dm.index_handler = IndexHandler(self.mock_dm)
+        self.mock_dm.group_commit = False
+        self.mock_dm.journal_handler = JournalHandler(self.mock_dm)
         self.mock_dm.df_data = pd.DataFrame()
         self.mock_dm.df_delivery = pd.DataFrame()
         self.mock_dm.df_payment = pd.DataFrame()
@@ -18,6 +23,8 @@ class TestStatusSchema(unittest.TestCase):
         self.order_handler = OrderHandler(self.mock_dm)
         self.delivery_handler = DeliveryHandler(self.mock_dm)
         self.payment_handler = PaymentHandler(self.mock_dm)
+        self.mock_dm.order_handler = self.order_handler
+        self.mock_dm.payment_handler = self.payment_handler
 
     def test_add_order_initializes_statuses(self):
         order_rows = [{
@@ -108,6 +115,18 @@ class TestStatusSchema(unittest.TestCase):
         df = dfs["data"]
         self.assertEqual(df.iloc[0]["Payment Status"], "완료")
         self.assertEqual(df.iloc[0]["Status"], "주문") # Status should remain "주문"
+    def test_payment_fee_is_checked_before_saving(self):
+        self.mock_dm.df_data = pd.DataFrame([{
+            "관리번호": "PO-231210-001", "품목명": "Item", "통화": "KRW", "Status": "주문",
+            "합계금액": 1100, "미수금액": 1100, "기수금액": 0
+        }])
+        self.mock_dm.df_payment = pd.DataFrame(columns=["관리번호", "입금액", "일시"])
+
+        # 미수금이 기준(KRW 5,000) 이내로 남으면 저장 전에 수수료 처리 여부를 물음
+        self.assertEqual(self.payment_handler.check_payment_fee(["PO-231210-001"], 1000), ("Item", 100, "KRW"))
+        self.assertIsNone(self.payment_handler.check_payment_fee(["PO-231210-001"], 1100))
+        # 메모리 데이터는 변경하지 않음
+        self.assertEqual(self.mock_dm.df_data.iloc[0]["미수금액"], 1100)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from managers.data.search_index import IncrementalSearch
+from managers.data_manager import DataManager
+from ui.views.table_view import TableView
+
+COLUMNS = ("관리번호", "Status", "업체명", "모델명")
+
+
+class TestTableViewSearch(unittest.TestCase):
+    def setUp(self):
+        self.dm = DataManager()
+        self.dm.df_data = pd.DataFrame({
+            "관리번호": [f"OD-{i:03d}" for i in range(25)],
+            "Status": ["주문"] * 20 + ["종료"] * 5,
+            "업체명": ["한국전자" if i % 2 else "Global" for i in range(25)],
+            "모델명": "M",
+        })
+
+        view = TableView.__new__(TableView)
+        view.dm = self.dm
+        view.sort_col, view.sort_reverse = "관리번호", False
+        view.search = IncrementalSearch(self.dm.search_index)
+        view._search_timer = view._stream_job = view._keys_cache = None
+        view.CHUNK_ROWS = 8
+        view.tree = {"columns": COLUMNS}
+        view.table = MagicMock()
+        view.status_filter = MagicMock(**{"get_selected.return_value": ["주문"]})
+        view.view_mode_var = MagicMock(**{"get.return_value": "품목별"})
+        view.search_entry = MagicMock(**{"get.return_value": ""})
+        self.idle = []
+        view.after_idle = lambda func, *args: self.idle.append((func, args)) or f"job{len(self.idle)}"
+        view.after_cancel = MagicMock()
+        self.view = view
+
+    def _shown(self):
+        values = self.view.table.set_rows.call_args[0][0]
+        return [row[0] for row in values]
+
+    def _run_idle(self):
+        while self.idle:
+            func, args = self.idle.pop(0)
+            func(*args)
+
+    def test_results_stream_in_chunks(self):
+        self.view.search_entry.get.return_value = "한국"
+        self.view.refresh_data()
+        # 첫 묶음(후보 8행) 결과가 바로 표시되고 나머지는 after_idle로 이어짐
+        self.assertEqual(self._shown(), ["OD-001", "OD-003", "OD-005", "OD-007"])
+        self.assertEqual(len(self.idle), 1)
+
+        # 중간 묶음은 다시 그리지 않고 마지막에 전체 결과를 한 번만 표시
+        self._run_idle()
+        self.assertEqual(self._shown(), [f"OD-{i:03d}" for i in range(1, 20, 2)])
+        self.assertEqual(self.view.table.set_rows.call_count, 2)
+
+    def test_slow_search_shows_intermediate_results(self):
+        # 묶음 사이에 RENDER_INTERVAL보다 오래 걸리면 중간 결과도 표시
+        self.view.search_entry.get.return_value = "한국"
+        clock = iter(range(100))
+        with patch("ui.views.table_view.time.monotonic", side_effect=lambda: next(clock)):
+            self.view.refresh_data()
+            self._run_idle()
+        shown = [len(call.args[0]) for call in self.view.table.set_rows.call_args_list]
+        self.assertEqual(shown, [4, 8, 10])
+
+    def test_default_chunks_stream_a_few_thousand_rows(self):
+        self.dm.df_data = pd.DataFrame({
+            "관리번호": [f"OD-{i:04d}" for i in range(3000)], "Status": "주문", "업체명": "한국전자", "모델명": "M"})
+        self.view.CHUNK_ROWS = TableView.CHUNK_ROWS
+        self.view.search_entry.get.return_value = "한국"
+        self.view.refresh_data()
+        # 앱 데이터 크기에서도 첫 묶음만 먼저 표시하고 나머지는 이어서 처리
+        self.assertEqual(len(self._shown()), TableView.CHUNK_ROWS)
+        self.assertEqual(len(self.idle), 1)
+        self._run_idle()
+        self.assertEqual(len(self._shown()), 3000)
+
+    def test_longer_query_filters_previous_result(self):
+        self.view.search_entry.get.return_value = "한국"
+        self.view.refresh_data()
+        self._run_idle()
+
+        self.view.search_entry.get.return_value = "한국전"
+        self.view.table.set_rows.reset_mock()
+        self.view.refresh_data()
+        # 직전 결과 10행만 검사하므로 두 묶음으로 끝남 (첫 묶음 + 최종 결과)
+        self._run_idle()
+        self.assertEqual(self.view.table.set_rows.call_count, 2)
+        self.assertEqual(len(self._shown()), 10)
+
+    def test_new_search_cancels_pending_chunks(self):
+        self.view.search_entry.get.return_value = "한국"
+        self.view.refresh_data()
+        self.view.search_entry.get.return_value = "global"
+        self.view.refresh_data()
+        self.view.after_cancel.assert_called_with("job1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import threading
+import time
+import unittest
+
+from managers.data.task_worker import TaskWorker
+
+
+class TestTaskWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = TaskWorker()
+
+    def tearDown(self):
+        self.worker.shutdown(wait=True)
+
+    def _drain(self, until, timeout=3):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            self.worker.process_callbacks()
+            time.sleep(0.01)
+
+    def test_tasks_run_in_submission_order(self):
+        order = []
+        gate = threading.Event()
+        self.worker.submit(gate.wait, 2)
+        futures = [self.worker.submit(order.append, i) for i in range(5)]
+        gate.set()
+        for f in futures: f.result(timeout=2)
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    def test_callbacks_run_only_when_processed(self):
+        results = []
+        callback_threads = []
+
+        def callback(result):
+            results.append(result)
+            callback_threads.append(threading.current_thread())
+
+        future = self.worker.submit(lambda: (True, "ok"), callback=callback)
+        future.result(timeout=2)
+        self.assertEqual(results, [])
+
+        self._drain(lambda: results)
+        self.assertEqual(results, [(True, "ok")])
+        self.assertIs(callback_threads[0], threading.current_thread())
+
+    def test_exception_is_reported_as_failure(self):
+        results = []
+
+        def fail():
+            raise ValueError("boom")
+
+        self.worker.submit(fail, callback=results.append)
+        self._drain(lambda: results)
+        self.assertFalse(results[0][0])
+        self.assertIn("boom", results[0][1])
+
+    def test_busy_notifications(self):
+        states = []
+        self.worker.add_busy_listener(states.append)
+        self.worker.submit(time.sleep, 0.05)
+        self.worker.submit(time.sleep, 0.05)
+        self._drain(lambda: states[-1:] == [False])
+        self.assertEqual(states, [True, False])
+        self.assertFalse(self.worker.is_busy)
+
+
+if __name__ == "__main__":
+    unittest.main()
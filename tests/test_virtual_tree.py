@@ -0,0 +1,153 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import customtkinter as ctk
+import numpy as np
+import pandas as pd
+
+from ui.widgets import virtual_tree
+from ui.widgets.virtual_tree import VirtualTreeview, format_number, group_rows, row_keys, sort_positions
+
+
+class FakeTree:
+    """화면 없이 Tk 호출 횟수를 세는 Treeview 대역"""
+    def __init__(self, *args, **kwargs):
+        self.items, self.selected, self.writes = {}, (), 0
+        self._next = 0
+
+    def insert(self, parent, index, **kwargs):
+        self._next += 1
+        iid = f"I{self._next}"
+        self.items[iid] = ()
+        return iid
+
+    def item(self, iid, values):
+        self.items[iid] = values
+        self.writes += 1
+
+    def delete(self, iid): del self.items[iid]
+    def selection(self): return self.selected
+    def selection_set(self, items): self.selected = tuple(items)
+    def focus(self): return ""
+    def identify_row(self, y): return list(self.items)[y // 30]
+    def winfo_height(self): return 150  # 행 높이 30 -> 5행
+    def yview_moveto(self, fraction): pass
+    def bind(self, *args, **kwargs): pass
+    def pack(self, *args, **kwargs): pass
+
+
+class TestVirtualTreeHelpers(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame([
+            {"관리번호": "OD-001", "모델명": "A", "수량": "1,000", "공급가액": 500, "출고예정일": "2023-12-20"},
+            {"관리번호": "OD-002", "모델명": "B", "수량": "5", "공급가액": 100, "출고예정일": "-"},
+            {"관리번호": "OD-001", "모델명": "C", "수량": "x", "공급가액": 250, "출고예정일": "2023-12-01"},
+            {"관리번호": "OD-003", "모델명": "D", "수량": "5", "공급가액": 100, "출고예정일": "2023-12-01"},
+        ], index=[10, 11, 12, 13])
+
+    def test_sort_positions_matches_table_rules(self):
+        self.assertEqual(list(sort_positions(self.df, "수량")), [2, 1, 3, 0])
+        self.assertEqual(list(sort_positions(self.df, "수량", reverse=True)), [0, 1, 3, 2])
+        # 빈 날짜("-")는 정렬 방향과 관계없이 맨 뒤
+        self.assertEqual(list(sort_positions(self.df, "출고예정일")), [2, 3, 0, 1])
+        self.assertEqual(list(sort_positions(self.df, "출고예정일", reverse=True)), [0, 2, 3, 1])
+        self.assertEqual(list(sort_positions(self.df, "없는컬럼")), [0, 1, 2, 3])
+
+    def test_group_rows_summarizes_multi_item_orders(self):
+        grouped = group_rows(self.df)
+        self.assertEqual(grouped["관리번호"].tolist(), ["OD-001", "OD-002", "OD-003"])
+        first = grouped.iloc[0]
+        self.assertEqual((first["모델명"], first["수량"], first["공급가액"]), ("A 외 1건", 1000, 750))
+        # 품목이 하나인 건은 원래 값 유지
+        self.assertEqual((grouped.iloc[1]["모델명"], grouped.iloc[1]["수량"]), ("B", "5"))
+
+    def test_format_number_only_touches_numbers(self):
+        self.assertEqual([format_number(v) for v in (1000.0, 2.5, 7, "-", "1,000")],
+                         ["1,000", "2.50", "7", "-", "1,000"])
+
+
+
+class TestVirtualTreeview(unittest.TestCase):
+    def setUp(self):
+        style = MagicMock()
+        style.return_value.lookup.return_value = 30
+        patches = [
+            patch.object(ctk.CTkFrame, "__init__", return_value=None),
+            patch.object(virtual_tree.ttk, "Treeview", FakeTree),
+            patch.object(virtual_tree.ttk, "Style", style),
+            patch.object(virtual_tree.ctk, "CTkScrollbar", MagicMock()),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.table = VirtualTreeview(None, columns=("관리번호", "Status"))
+        self.tree = self.table.tree
+
+        self.df = pd.DataFrame({"관리번호": [f"OD-{i // 2:03d}" for i in range(100)], "Status": "주문"})
+
+    def _show(self, df):
+        self.table.set_rows(df.to_numpy(dtype=object), None, row_keys(df))
+
+    def test_only_visible_window_is_materialized(self):
+        self._show(self.df)
+        self.assertEqual(len(self.tree.items), 5 + VirtualTreeview.BUFFER_ROWS)
+        self.table._scroll_by(50)
+        self.assertEqual(len(self.tree.items), 5 + VirtualTreeview.BUFFER_ROWS)
+        self.assertEqual(self.tree.items[self.table._slots[0]], ("OD-025", "주문"))
+
+    def test_refresh_touches_only_changed_rows_and_keeps_position(self):
+        self._show(self.df)
+        self.table._scroll_by(10)
+        self.tree.selected = (self.table._slots[1],)  # OD-005 두 번째 품목 선택
+        self.table._on_select()
+
+        # 한 건의 상태만 바뀐 갱신
+        df = self.df.copy()
+        df.loc[12, "Status"] = "생산중"
+        self.tree.writes = 0
+        self._show(df)
+        self.assertEqual(self.tree.writes, 1)
+
+        # 앞쪽 행이 삭제되어도 같은 행을 기준으로 스크롤/선택 유지
+        df = df.drop(index=[0, 1, 2]).reset_index(drop=True)
+        self._show(df)
+        self.assertEqual(self.tree.items[self.table._slots[0]], ("OD-005", "주문"))
+        self.assertEqual(self.table.selected_values(), [("OD-005", "주문")])
+        self.assertEqual(list(row_keys(df)[:2]), ["OD-001#0", "OD-002#0"])
+
+    def _click(self, slot, state=0):
+        """slot 번째 화면 행 클릭 (Tk 기본 동작처럼 보이는 항목의 선택을 바꾼 뒤 <<TreeviewSelect>>)"""
+        iid = self.table._slots[slot]
+        self.table._on_click(MagicMock(y=slot * 30, state=state))
+        self.tree.selected = self.tree.selected + (iid,) if state & 0x0004 else (iid,)
+        self.table._on_select()
+
+    def test_plain_click_after_scroll_replaces_hidden_selection(self):
+        self._show(self.df)
+        self._click(0)
+        self.table._scroll_by(50)
+        self._click(1)
+        self.assertEqual(self.table.selected_values(), [("OD-025", "주문")])
+
+        # 우클릭도 한 행만 선택
+        self.table._scroll_by(-50)
+        self.table.select_item(self.table._slots[2])
+        self.assertEqual(self.table.selected_values(), [("OD-001", "주문")])
+
+    def test_modifier_clicks_keep_hidden_rows(self):
+        self._show(self.df)
+        self._click(0)
+        self.table._scroll_by(50)
+        self._click(0, state=0x0004) # Ctrl
+        self.assertEqual(len(self.table.selected_values()), 2)
+
+        # Shift 범위는 화면에 그려지지 않은 행까지 포함
+        self._click(4)
+        self.table._scroll_by(-50)
+        self._click(1, state=0x0001) # Shift
+        self.assertEqual(len(self.table.selected_values()), 54) # 1 ~ 54번째 행
+        self.assertEqual(set(self.tree.selected), set(self.table._slots[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -201,7 +201,7 @@ class AccountingPopup(BasePopup):
         # 2. Business Registration (from Client sheet)
         client_name = first_row.get("업체명", "")
         if client_name:
-            client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+            client_row = self.dm.get_rows("clients", client_name)
             if not client_row.empty:
                 if self._add_file_row("사업자등록증", client_row.iloc[0].get("사업자등록증경로")): has_files = True
                 
@@ -272,7 +272,7 @@ class AccountingPopup(BasePopup):
         if hasattr(self.dm, 'df_data'):
             mgmt_no = row.get("관리번호")
             if mgmt_no:
-                main_row = self.dm.df_data[self.dm.df_data["관리번호"] == mgmt_no]
+                main_row = self.dm.get_rows("data", mgmt_no)
                 if not main_row.empty:
                     model_name = main_row.iloc[0].get("모델명", "")
 
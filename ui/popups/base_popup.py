@@ -9,6 +9,9 @@ from src.styles import COLORS, FONT_FAMILY, FONTS
 from utils.file_dnd import FileDnDManager
 
 class BasePopup(ctk.CTkToplevel):
+    _saving = False # 백그라운드 저장 진행 중
+    _reserved_id = None # 저장 시 확정한 신규 번호
+
     def __init__(self, parent, data_manager, refresh_callback, popup_title="Popup", mgmt_no=None):
         super().__init__(parent)
         self.dm = data_manager
@@ -294,5 +297,57 @@ class BasePopup(ctk.CTkToplevel):
         if hasattr(self, "lbl_total_amt"):
             self.lbl_total_amt.configure(text=f"총 합계: {total_amt:,.0f}")
 
+    def _run_in_background(self, func, *args, success_msg=None, error_title="실패", close=True,
+                           on_success=None, **kwargs):
+        """
+        저장 작업을 백그라운드 작업 스레드에서 실행합니다. (저장 중에도 메인 창이 멈추지 않음)
+        끝날 때까지 팝업 입력을 막고, 성공하면 안내(success_msg, 없으면 작업 결과 메시지) 후 화면을 갱신하고 팝업을 닫습니다.
+        on_success(msg)가 있으면 안내/닫기 대신 호출합니다.
+        """
+        if self._saving: return None # 저장 버튼/단축키 중복 실행 방지
+        self._set_busy(True)
+
+        def on_done(result):
+            success, msg = result
+            if success: self.refresh_callback()
+            if not self.winfo_exists(): return
+            self._set_busy(False)
+            if not success:
+                messagebox.showerror(error_title, msg, parent=self)
+            elif on_success:
+                on_success(msg)
+            else:
+                messagebox.showinfo("완료", success_msg or msg, parent=self)
+                if close: self.destroy()
+        return self.dm.run_async(func, *args, callback=on_done, **kwargs)
+
+    def _set_busy(self, busy):
+        """저장 중에는 저장/취소 버튼과 창 닫기를 막고 대기 커서를 표시합니다."""
+        self._saving = busy
+        for name in ("btn_save", "btn_cancel", "btn_confirm", "btn_start_production"):
+            button = getattr(self, name, None)
+            try:
+                if button is not None: button.configure(state="disabled" if busy else "normal")
+            except tk.TclError: pass # 버튼을 다시 만든 경우
+        self.configure(cursor="watch" if busy else "")
+        self.protocol("WM_DELETE_WINDOW", (lambda: None) if busy else self.destroy)
+        self.bind("<Escape>", (lambda e: None) if busy else (lambda e: self.destroy()))
+
+    def _reserve_new_id(self, mgmt_no):
+        """
+        신규/복사 등록이면 화면의 임시 번호를 저장 시점에 확정합니다.
+        그 사이 다른 사용자가 같은 번호를 저장했으면 다음 번호로 바꿔 화면에도 반영합니다.
+        """
+        if self.mgmt_no and not getattr(self, "copy_mode", False): return mgmt_no # 수정
+        if mgmt_no == self._reserved_id: return mgmt_no # 저장 실패 후 다시 저장
+        reserved = self._reserved_id = self.dm.reserve_id(mgmt_no)
+        if reserved != mgmt_no and hasattr(self, "entry_id"):
+            state = self.entry_id.cget("state")
+            self.entry_id.configure(state="normal")
+            self.entry_id.delete(0, "end")
+            self.entry_id.insert(0, reserved)
+            self.entry_id.configure(state=state)
+        return reserved
+
     def save(self): raise NotImplementedError
     def delete(self): raise NotImplementedError
\ No newline at end of file
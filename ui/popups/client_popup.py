@@ -206,8 +206,7 @@ class ClientPopup(BasePopup):
     def _load_data(self):
         # BasePopup calls this if mgmt_no is set.
         # Here mgmt_no is client_name.
-        df = self.dm.df_clients
-        row = df[df["업체명"] == self.client_name].iloc[0]
+        row = self.dm.get_rows("clients", self.client_name).iloc[0]
         
         for key, widget in self.entries.items():
             val = str(row.get(key, ""))
@@ -320,15 +320,14 @@ class CompletePopup(BasePopup):
         self.scroll_tax_invoice.pack(fill="both", expand=True, padx=5, pady=5)
 
     def _load_data(self):
-        df = self.dm.df_data
-        rows = df[df["관리번호"].astype(str) == str(self.mgmt_no)]
+        rows = self.dm.get_rows("data", self.mgmt_no)
         if rows.empty: return
 
         # Delivery 시트 데이터 로드
         delivery_df = self.dm.df_delivery
         current_deliveries = pd.DataFrame()
         if not delivery_df.empty:
-            current_deliveries = delivery_df[delivery_df["관리번호"].astype(str) == str(self.mgmt_no)]
+            current_deliveries = self.dm.get_rows("delivery", self.mgmt_no)
 
         first = rows.iloc[0]
 
@@ -400,7 +399,7 @@ class CompletePopup(BasePopup):
         # 3. 입금 이력 로드
         for widget in self.scroll_payment.winfo_children(): widget.destroy()
         if not self.dm.df_payment.empty:
-            pay_rows = self.dm.df_payment[self.dm.df_payment["관리번호"].astype(str) == str(self.mgmt_no)]
+            pay_rows = self.dm.get_rows("payment", self.mgmt_no)
             if not pay_rows.empty:
                 pay_rows = pay_rows.sort_values(by="일시", ascending=False)
                 for _, p_row in pay_rows.iterrows():
@@ -413,7 +412,7 @@ class CompletePopup(BasePopup):
         # 4. 납품 이력 로드
         for widget in self.scroll_delivery.winfo_children(): widget.destroy()
         if not self.dm.df_delivery.empty:
-            del_rows = self.dm.df_delivery[self.dm.df_delivery["관리번호"].astype(str) == str(self.mgmt_no)]
+            del_rows = self.dm.get_rows("delivery", self.mgmt_no)
             if not del_rows.empty:
                 del_rows = del_rows.sort_values(by="일시", ascending=False)
                 for _, d_row in del_rows.iterrows():
@@ -426,7 +425,7 @@ class CompletePopup(BasePopup):
         # 5. 세금계산서 이력 로드
         for widget in self.scroll_tax_invoice.winfo_children(): widget.destroy()
         if hasattr(self.dm, 'df_tax_invoice') and not self.dm.df_tax_invoice.empty:
-            tax_rows = self.dm.df_tax_invoice[self.dm.df_tax_invoice["관리번호"].astype(str) == str(self.mgmt_no)]
+            tax_rows = self.dm.get_rows("tax_invoice", self.mgmt_no)
             if not tax_rows.empty:
                 tax_rows = tax_rows.sort_values(by="발행일", ascending=False)
                 for _, t_row in tax_rows.iterrows():
@@ -445,7 +444,7 @@ class CompletePopup(BasePopup):
         
         # 6-2. 사업자등록증
         client_name = str(first.get("업체명", ""))
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if not client_row.empty:
             if self._add_file_row("사업자등록증", client_row.iloc[0].get("사업자등록증경로")): has_files = True
 
@@ -684,14 +683,9 @@ class CompletePopup(BasePopup):
                         return False, "해당 데이터를 찾을 수 없습니다."
                 return False, "시트를 찾을 수 없습니다."
 
-            success, msg = self.dm._execute_transaction(update_logic)
-            
-            if success:
-                messagebox.showinfo("성공", "파일이 업로드되었습니다.", parent=self)
-                self.refresh_callback() # 팝업 닫힘 및 메인 갱신
-                self.destroy()
-            else:
-                 messagebox.showerror("실패", f"저장 중 오류가 발생했습니다: {msg}", parent=self)
+            # 저장은 백그라운드에서 (완료 후 메인 갱신 및 팝업 닫힘)
+            self._run_in_background(self.dm.execute_transaction, update_logic,
+                                    success_msg="파일이 업로드되었습니다.", error_title="저장 실패")
 
         except Exception as e:
             messagebox.showerror("오류", f"파일 업로드 중 오류 발생: {e}", parent=self)
@@ -879,14 +873,9 @@ class CompletePopup(BasePopup):
                         return False, "해당 데이터를 찾을 수 없습니다."
                 return False, "시트를 찾을 수 없습니다."
 
-            success, msg = self.dm._execute_transaction(update_logic)
-            
-            if success:
-                messagebox.showinfo("성공", "파일이 업로드되었습니다.", parent=self)
-                self.refresh_callback() # 팝업 닫힘 및 메인 갱신
-                self.destroy()
-            else:
-                 messagebox.showerror("실패", f"저장 중 오류가 발생했습니다: {msg}", parent=self)
+            # 저장은 백그라운드에서 (완료 후 메인 갱신 및 팝업 닫힘)
+            self._run_in_background(self.dm.execute_transaction, update_logic,
+                                    success_msg="파일이 업로드되었습니다.", error_title="저장 실패")
 
         except Exception as e:
             messagebox.showerror("오류", f"파일 업로드 중 오류 발생: {e}", parent=self)
@@ -93,7 +93,7 @@ class MiniAccountingPopup(BasePopup):
             # Find amount from data
             amt = 0
             if hasattr(self.dm, 'df_data'):
-                row = self.dm.df_data[self.dm.df_data["관리번호"] == mgmt_no]
+                row = self.dm.get_rows("data", mgmt_no)
                 if not row.empty:
                     # Use "합계금액" (Total Amount) which corresponds to Tax Invoice Amount
                     val = row.iloc[0].get("합계금액", 0)
@@ -79,11 +79,11 @@ class MiniDeliveryPopup(BasePopup):
         self._load_client_shipping_info()
 
     def _load_client_shipping_info(self):
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == self.mgmt_nos[0]]
+        rows = self.dm.get_rows("data", self.mgmt_nos[0])
         if rows.empty: return
         client_name = rows.iloc[0]["업체명"]
         
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if not client_row.empty:
             method = str(client_row.iloc[0].get("운송방법", "")).replace("nan", "")
             account = str(client_row.iloc[0].get("운송계정", "")).replace("nan", "")
@@ -110,7 +110,7 @@ class MiniDeliveryPopup(BasePopup):
             
         # Get full order data for the first mgmt_no
         mgmt_no = self.mgmt_nos[0]
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == mgmt_no]
+        rows = self.dm.get_rows("data", mgmt_no)
         if rows.empty:
             messagebox.showerror("오류", "주문 정보를 찾을 수 없습니다.", parent=self)
             return None, None, None
@@ -120,7 +120,7 @@ class MiniDeliveryPopup(BasePopup):
         
         # Client Info
         client_info = {}
-        c_rows = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        c_rows = self.dm.get_rows("clients", client_name)
         if not c_rows.empty:
             client_info = c_rows.iloc[0].to_dict()
             
@@ -185,7 +185,7 @@ class MiniDeliveryPopup(BasePopup):
         
         # File Saving
         saved_paths = {}
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == self.mgmt_nos[0]]
+        rows = self.dm.get_rows("data", self.mgmt_nos[0])
         client_name = rows.iloc[0]["업체명"] if not rows.empty else "Unknown"
         safe_client = "".join([c for c in client_name if c.isalnum() or c in (' ', '_')]).strip()
         info_text = f"{safe_client}_{self.mgmt_nos[0]}_Delivery"
@@ -198,7 +198,8 @@ class MiniDeliveryPopup(BasePopup):
         delivery_no = self.dm.get_next_delivery_id()
         waybill_path = saved_paths.get("운송장경로", "")
         
-        success, msg = self.dm.process_delivery(
+        self._run_in_background(
+            self.dm.process_delivery,
             delivery_no,
             date,
             invoice_no,
@@ -206,16 +207,11 @@ class MiniDeliveryPopup(BasePopup):
             waybill_path,
             self.delivery_items,
             ci_path=self.ci_path,
-            pl_path=self.pl_path
+            pl_path=self.pl_path,
+            success_msg="납품 처리가 완료되었습니다.",
+            error_title="처리 실패"
         )
 
-        if success:
-            messagebox.showinfo("성공", "납품 처리가 완료되었습니다.", parent=self)
-            self.refresh_callback()
-            self.destroy()
-        else:
-            messagebox.showerror("실패", f"처리 실패: {msg}", parent=self)
-
     # Abstract methods
     def delete(self): pass
     def _generate_new_id(self): pass
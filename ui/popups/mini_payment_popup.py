@@ -83,7 +83,7 @@ class MiniPaymentPopup(BasePopup):
         # File Saving
         saved_paths = {}
         # Need client name for file naming, fetch from DM using first mgmt_no
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == self.mgmt_nos[0]]
+        rows = self.dm.get_rows("data", self.mgmt_nos[0])
         client_name = rows.iloc[0]["업체명"] if not rows.empty else "Unknown"
         safe_client = "".join([c for c in client_name if c.isalnum() or c in (' ', '_')]).strip()
         info_text = f"{safe_client}_{self.mgmt_nos[0]}_{int(amount)}"
@@ -103,21 +103,21 @@ class MiniPaymentPopup(BasePopup):
                                        f"[{item_name}] 의 총 잔액이 {diff:,.0f} ({curr}) 남습니다.\n"
                                        f"이를 수수료로 처리하여 '완납' 하시겠습니까?", parent=self)
 
-        success, msg = self.dm.process_payment(
+        # 수수료 확인은 저장 전에 UI 스레드에서 묻고, 답만 백그라운드 저장에 전달
+        fee = self.dm.check_payment_fee(self.mgmt_nos, amount)
+        is_fee = bool(fee) and confirm_fee(*fee)
+
+        self._run_in_background(
+            self.dm.process_payment,
             self.mgmt_nos,
             amount,
             date,
             saved_paths,
-            confirm_fee
+            lambda *args: is_fee,
+            success_msg="입금 처리가 완료되었습니다.",
+            error_title="처리 실패"
         )
 
-        if success:
-            messagebox.showinfo("성공", "입금 처리가 완료되었습니다.", parent=self)
-            self.refresh_callback()
-            self.destroy()
-        else:
-            messagebox.showerror("실패", f"처리 실패: {msg}", parent=self)
-
     # Abstract methods
     def delete(self): pass
     def _generate_new_id(self): pass
@@ -191,7 +191,7 @@ class OrderPopup(BasePopup):
 
     def _on_client_select(self, client_name):
         # 1. 업체 특이사항 표시
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if not client_row.empty:
             note = str(client_row.iloc[0].get("특이사항", ""))
             self.lbl_client_note.configure(text=f"※ {note}" if note else "")
@@ -386,7 +386,7 @@ class OrderPopup(BasePopup):
 
     def _on_client_select(self, client_name):
         # 1. 업체 특이사항 표시
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if not client_row.empty:
             note = str(client_row.iloc[0].get("특이사항", ""))
             self.lbl_client_note.configure(text=f"※ {note}" if note else "")
@@ -423,8 +423,7 @@ class OrderPopup(BasePopup):
         self.entry_payment_cond.insert(0, "납품 전 100%" if is_korea else "T/T in advance")
 
     def _load_data(self):
-        df = self.dm.df_data
-        rows = df[df["관리번호"] == self.mgmt_no]
+        rows = self.dm.get_rows("data", self.mgmt_no)
         if rows.empty: return
         
         first = rows.iloc[0]
@@ -481,8 +480,7 @@ class OrderPopup(BasePopup):
         self._update_action_buttons()
 
     def _load_copied_data(self):
-        df = self.dm.df_data
-        rows = df[df["관리번호"] == self.copy_src_no]
+        rows = self.dm.get_rows("data", self.copy_src_no)
         if rows.empty: return
         
         first = rows.iloc[0]
@@ -526,7 +524,8 @@ class OrderPopup(BasePopup):
     # ==========================================================================
     # 저장 및 삭제
     # ==========================================================================
-    def save(self, destroy_after=True):
+    def save(self, on_saved=None):
+        """저장은 백그라운드에서 실행됩니다. on_saved(new_rows)가 있으면 안내/닫기 대신 저장 후 호출합니다."""
         mgmt_no = self.entry_id.get()
         client = self.entry_client.get()
         
@@ -536,6 +535,7 @@ class OrderPopup(BasePopup):
         if not self.item_rows:
             messagebox.showwarning("경고", "최소 1개 이상의 품목을 추가해주세요.", parent=self)
             return
+        mgmt_no = self._reserve_new_id(mgmt_no)
 
         try: tax_rate_val = float(self.entry_tax_rate.get().strip())
         except: tax_rate_val = 0
@@ -595,30 +595,16 @@ class OrderPopup(BasePopup):
             new_rows.append(row_data)
 
         if self.mgmt_no and not self.copy_mode:
-            success, msg = self.dm.update_order(mgmt_no, new_rows, client)
+            save_func, args = self.dm.update_order, (mgmt_no, new_rows, client)
         else:
             # Copy mode or New
-            success, msg = self.dm.add_order(new_rows, mgmt_no, client)
-        
-        if success:
-            messagebox.showinfo("완료", "저장되었습니다.", parent=self)
-            self.refresh_callback()
-            if destroy_after:
-                self.destroy()
-            return True, "저장되었습니다.", new_rows
-        else:
-            messagebox.showerror("실패", msg, parent=self)
-            return False, msg, []
+            save_func, args = self.dm.add_order, (new_rows, mgmt_no, client)
+        self._run_in_background(save_func, *args,
+                                on_success=(lambda msg: on_saved(new_rows)) if on_saved else None)
 
     def delete(self):
         if messagebox.askyesno("삭제 확인", f"정말 이 주문({self.mgmt_no})을 삭제하시겠습니까?", parent=self):
-            success, msg = self.dm.delete_order(self.mgmt_no)
-            if success:
-                messagebox.showinfo("삭제 완료", "삭제되었습니다.", parent=self)
-                self.refresh_callback()
-                self.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.delete_order, self.mgmt_no, success_msg="삭제되었습니다.")
 
     def export_quote(self):
         client_name = self.entry_client.get()
@@ -626,7 +612,7 @@ class OrderPopup(BasePopup):
             messagebox.showwarning("경고", "고객사를 선택해주세요.", parent=self)
             return
 
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return
@@ -672,7 +658,7 @@ class OrderPopup(BasePopup):
             messagebox.showwarning("경고", "고객사를 선택해주세요.", parent=self)
             return
 
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return
@@ -709,7 +695,7 @@ class OrderPopup(BasePopup):
             messagebox.showwarning("경고", "고객사를 선택해주세요.", parent=self)
             return
 
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return
@@ -742,7 +728,7 @@ class OrderPopup(BasePopup):
             messagebox.showerror("실패", result, parent=self)
 
     def _generate_new_id(self):
-        new_id = self.dm.get_next_order_id()
+        new_id = self.dm.peek_next_id("OD") # 저장할 때 확정
         if hasattr(self, 'entry_id'):
             self.entry_id.configure(state="normal")
             self.entry_id.delete(0, "end")
@@ -801,16 +787,18 @@ class OrderPopup(BasePopup):
     def start_production(self):
         if messagebox.askyesno("생산 시작", "주문 상태를 '생산중'으로 변경하고 저장하시겠습니까?", parent=self):
             self.combo_status.set("생산중")
-            # 저장 후 데이터 받아오기 (팝업 닫지 않음)
-            success, msg, saved_rows = self.save(destroy_after=False)
-            
-            if success:
-                # 생산 요청 파일로 내보내기
-                export_success, export_msg = self.dm.export_to_production_request(saved_rows)
-                
-                if export_success:
-                    messagebox.showinfo("생산 요청 완료", f"생산 요청이 완료되었습니다.\n{export_msg}", parent=self)
-                else:
-                    messagebox.showwarning("생산 요청 실패", f"주문은 저장되었으나 생산 요청 파일 업데이트에 실패했습니다.\n{export_msg}", parent=self)
-                
-                self.destroy()
\ No newline at end of file
+            # 저장 후 생산 요청 파일로 내보내고 닫음
+            self.save(on_saved=self._export_production_request)
+
+    def _export_production_request(self, saved_rows):
+        def on_exported(result):
+            export_success, export_msg = result
+            if not self.winfo_exists(): return
+            if export_success:
+                messagebox.showinfo("생산 요청 완료", f"생산 요청이 완료되었습니다.\n{export_msg}", parent=self)
+            else:
+                messagebox.showwarning("생산 요청 실패", f"주문은 저장되었으나 생산 요청 파일 업데이트에 실패했습니다.\n{export_msg}", parent=self)
+            self.destroy()
+
+        self._set_busy(True)
+        self.dm.export_to_production_request_async(saved_rows, callback=on_exported)
@@ -241,20 +241,20 @@ class PaymentPopup(BasePopup):
                                        f"[{item_name}] 항목의 잔액이 {diff:,.0f} ({curr}) 남습니다.\n"
                                        f"이를 수수료로 처리하여 '완납' 하시겠습니까?", parent=self)
 
-        success, msg = self.dm.process_payment(
+        # 수수료 확인은 저장 전에 UI 스레드에서 묻고, 답만 백그라운드 저장에 전달
+        fee = self.dm.check_payment_fee(self.mgmt_nos, payment_amount)
+        is_fee = bool(fee) and confirm_fee(*fee)
+
+        self._run_in_background(
+            self.dm.process_payment,
             self.mgmt_nos,
             payment_amount,
             payment_date,
             saved_paths,
-            confirm_fee
+            lambda *args: is_fee,
+            success_msg="수금 처리가 완료되었습니다.",
+            error_title="저장 실패"
         )
-
-        if success:
-            messagebox.showinfo("성공", "수금 처리가 완료되었습니다.", parent=self)
-            self.refresh_callback()
-            self.destroy()
-        else:
-            messagebox.showerror("실패", f"저장에 실패했습니다: {msg}", parent=self)
     
     # BasePopup 추상 메서드 구현 (사용 안함)
     def _generate_new_id(self): pass
@@ -381,7 +381,7 @@ class ProductionPopup(BasePopup):
         if not self.cached_client_name:
             messagebox.showwarning("경고", "고객사 정보가 없습니다.", parent=self)
             return None
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == self.cached_client_name]
+        client_row = self.dm.get_rows("clients", self.cached_client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return None
@@ -421,7 +421,7 @@ class ProductionPopup(BasePopup):
         if client_info is None: return
 
         main_mgmt_no = self.mgmt_nos[0]
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == main_mgmt_no]
+        rows = self.dm.get_rows("data", main_mgmt_no)
         if rows.empty: return
         first = rows.iloc[0]
 
@@ -449,7 +449,7 @@ class ProductionPopup(BasePopup):
         if client_info is None: return
 
         main_mgmt_no = self.mgmt_nos[0]
-        rows = self.dm.df_data[self.dm.df_data["관리번호"] == main_mgmt_no]
+        rows = self.dm.get_rows("data", main_mgmt_no)
         if rows.empty: return
         first = rows.iloc[0]
 
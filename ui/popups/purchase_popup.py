@@ -231,7 +231,7 @@ class PurchasePopup(BasePopup):
         df = self.dm.df_clients
         if df.empty: return
         
-        row = df[df["업체명"] == client_name]
+        row = self.dm.get_rows("clients", client_name)
         if not row.empty:
             data = row.iloc[0]
             
@@ -286,7 +286,7 @@ class PurchasePopup(BasePopup):
         df = self.dm.df_purchase
         if df.empty: return
         
-        rows = df[df["관리번호"] == self.mgmt_no]
+        rows = self.dm.get_rows("purchase", self.mgmt_no)
         if rows.empty:
             messagebox.showerror("오류", "데이터를 찾을 수 없습니다.", parent=self)
             self.destroy()
@@ -358,7 +358,7 @@ class PurchasePopup(BasePopup):
         df = self.dm.df_purchase
         if df.empty: return
         
-        rows = df[df["관리번호"] == self.copy_src_no]
+        rows = self.dm.get_rows("purchase", self.copy_src_no)
         if rows.empty: return
             
         data = rows.iloc[0]
@@ -409,6 +409,7 @@ class PurchasePopup(BasePopup):
         if not client:
             messagebox.showwarning("경고", "매입처를 선택해주세요.", parent=self)
             return
+        mgmt_no = self._reserve_new_id(mgmt_no)
             
         # File Save
         success, msg, quote_path = self.file_manager.save_file(
@@ -489,7 +490,7 @@ class PurchasePopup(BasePopup):
                 messagebox.showerror("오류", f"삭제 실패: {msg}", parent=self)
 
     def _generate_new_id(self):
-        new_id = self.dm.get_next_purchase_id()
+        new_id = self.dm.peek_next_id("PU") # 저장할 때 확정
         
         if hasattr(self, 'entry_id'):
             self.entry_id.configure(state="normal")
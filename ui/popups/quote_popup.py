@@ -215,7 +215,7 @@ class QuotePopup(BasePopup):
 
     def _on_client_select(self, client_name):
         # 1. 업체 특이사항 표시
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if not client_row.empty:
             note = str(client_row.iloc[0].get("특이사항", ""))
             self.lbl_client_note.configure(text=f"※ {note}" if note else "")
@@ -249,8 +249,7 @@ class QuotePopup(BasePopup):
         self.entry_warranty.insert(0, "2년" if is_korea else "2 years conditional")
 
     def _load_data(self):
-        df = self.dm.df_data
-        rows = df[df["관리번호"] == self.mgmt_no]
+        rows = self.dm.get_rows("data", self.mgmt_no)
         if rows.empty: return
         
         first = rows.iloc[0]
@@ -317,8 +316,7 @@ class QuotePopup(BasePopup):
             self.title(f"견적 수정 ({self.mgmt_no}) - Sales Manager")
 
     def _load_copied_data(self):
-        df = self.dm.df_data
-        rows = df[df["관리번호"] == self.copy_src_no]
+        rows = self.dm.get_rows("data", self.copy_src_no)
         if rows.empty: return
         
         first = rows.iloc[0]
@@ -384,6 +382,7 @@ class QuotePopup(BasePopup):
         if not self.item_rows:
             messagebox.showwarning("경고", "최소 1개 이상의 품목을 추가해주세요.", parent=self)
             return
+        mgmt_no = self._reserve_new_id(mgmt_no)
 
         try: tax_rate_val = float(self.entry_tax_rate.get().strip())
         except: tax_rate_val = 0
@@ -422,27 +421,14 @@ class QuotePopup(BasePopup):
             new_rows.append(row_data)
 
         if self.mgmt_no and not self.copy_mode:
-            success, msg = self.dm.update_quote(mgmt_no, new_rows, client)
+            self._run_in_background(self.dm.update_quote, mgmt_no, new_rows, client)
         else:
             # Copy mode or New
-            success, msg = self.dm.add_quote(new_rows, mgmt_no, client)
-        
-        if success:
-            messagebox.showinfo("완료", "저장되었습니다.", parent=self)
-            self.refresh_callback()
-            self.destroy()
-        else:
-            messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.add_quote, new_rows, mgmt_no, client)
 
     def delete(self):
         if messagebox.askyesno("삭제 확인", f"정말 이 견적({self.mgmt_no})을 삭제하시겠습니까?", parent=self):
-            success, msg = self.dm.delete_quote(self.mgmt_no)
-            if success:
-                messagebox.showinfo("삭제 완료", "삭제되었습니다.", parent=self)
-                self.refresh_callback()
-                self.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.delete_quote, self.mgmt_no, success_msg="삭제되었습니다.")
 
     def export_quote(self):
         client_name = self.entry_client.get()
@@ -450,7 +436,7 @@ class QuotePopup(BasePopup):
             messagebox.showwarning("경고", "고객사를 선택해주세요.", parent=self)
             return
 
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return
@@ -484,7 +470,7 @@ class QuotePopup(BasePopup):
             messagebox.showerror("실패", result, parent=self)
 
     def _generate_new_id(self):
-        new_id = self.dm.get_next_quote_id()
+        new_id = self.dm.peek_next_id("QT") # 저장할 때 확정
         
         # UI 업데이트 (entry_id가 존재한다면)
         if hasattr(self, 'entry_id'):
@@ -573,6 +559,7 @@ class QuotePopup(BasePopup):
         if not self.item_rows:
             messagebox.showwarning("경고", "최소 1개 이상의 품목을 추가해주세요.", parent=self)
             return
+        mgmt_no = self._reserve_new_id(mgmt_no)
 
         try: tax_rate_val = float(self.entry_tax_rate.get().strip())
         except: tax_rate_val = 0
@@ -611,27 +598,14 @@ class QuotePopup(BasePopup):
             new_rows.append(row_data)
 
         if self.mgmt_no and not self.copy_mode:
-            success, msg = self.dm.update_quote(mgmt_no, new_rows, client)
+            self._run_in_background(self.dm.update_quote, mgmt_no, new_rows, client)
         else:
             # Copy mode or New
-            success, msg = self.dm.add_quote(new_rows, mgmt_no, client)
-        
-        if success:
-            messagebox.showinfo("완료", "저장되었습니다.", parent=self)
-            self.refresh_callback()
-            self.destroy()
-        else:
-            messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.add_quote, new_rows, mgmt_no, client)
 
     def delete(self):
         if messagebox.askyesno("삭제 확인", f"정말 이 견적({self.mgmt_no})을 삭제하시겠습니까?", parent=self):
-            success, msg = self.dm.delete_quote(self.mgmt_no)
-            if success:
-                messagebox.showinfo("삭제 완료", "삭제되었습니다.", parent=self)
-                self.refresh_callback()
-                self.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.delete_quote, self.mgmt_no, success_msg="삭제되었습니다.")
 
     def export_quote(self):
         client_name = self.entry_client.get()
@@ -639,7 +613,7 @@ class QuotePopup(BasePopup):
             messagebox.showwarning("경고", "고객사를 선택해주세요.", parent=self)
             return
 
-        client_row = self.dm.df_clients[self.dm.df_clients["업체명"] == client_name]
+        client_row = self.dm.get_rows("clients", client_name)
         if client_row.empty:
             messagebox.showerror("오류", "고객 정보를 찾을 수 없습니다.", parent=self)
             return
@@ -673,7 +647,7 @@ class QuotePopup(BasePopup):
             messagebox.showerror("실패", result, parent=self)
 
     def _generate_new_id(self):
-        new_id = self.dm.get_next_quote_id()
+        new_id = self.dm.peek_next_id("QT") # 저장할 때 확정
         
         # UI 업데이트 (entry_id가 존재한다면)
         if hasattr(self, 'entry_id'):
@@ -713,12 +687,7 @@ class QuotePopup(BasePopup):
         from ui.popups.mini_order_popup import MiniOrderPopup
         
         def on_confirm(confirm_data):
-            success, msg = self.dm.confirm_order(self.mgmt_no, confirm_data)
-            if success:
-                messagebox.showinfo("완료", "주문이 확정되었습니다.", parent=self)
-                self.refresh_callback()
-                self.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            self._run_in_background(self.dm.confirm_order, self.mgmt_no, confirm_data,
+                                    success_msg="주문이 확정되었습니다.")
                 
         MiniOrderPopup(self, self.dm, self.mgmt_no, on_confirm)
\ No newline at end of file
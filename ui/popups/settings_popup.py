@@ -1,3 +1,4 @@
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 
@@ -129,6 +130,43 @@ class SettingsPopup(ctk.CTkToplevel):
         ctk.CTkButton(prod_frame, text="찾기", width=60, command=self.browse_production_file, 
                       fg_color=COLORS["bg_medium"], text_color=COLORS["text"]).pack(side="right")
 
+        ctk.CTkFrame(parent, height=1, fg_color=COLORS["border"]).pack(fill="x", pady=15)
+
+        # 5. 저장소 엔진 설정 (Excel / SQLite)
+        ctk.CTkLabel(parent, text="데이터 저장소 (Storage Engine)", font=FONTS["header"]).pack(pady=(0, 5), anchor="w")
+
+        self.engine_var = ctk.StringVar(value="SQLite" if self.dm.storage_engine == "sqlite" else "Excel")
+        ctk.CTkSegmentedButton(
+            parent,
+            values=["Excel", "SQLite"],
+            variable=self.engine_var,
+            font=(FONT_FAMILY, 12, "bold"),
+            selected_color=COLORS["primary"],
+            selected_hover_color=COLORS["primary_hover"]
+        ).pack(fill="x")
+
+        ctk.CTkLabel(parent, text="SQLite DB 파일 경로", font=FONTS["main"], text_color=COLORS["text_dim"]).pack(pady=(10, 2), anchor="w")
+
+        sqlite_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        sqlite_frame.pack(fill="x")
+
+        self.sqlite_path_entry = ctk.CTkEntry(sqlite_frame, font=FONTS["main"])
+        self.sqlite_path_entry.insert(0, self.dm.sqlite_path)
+        self.sqlite_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
+
+        ctk.CTkButton(sqlite_frame, text="찾기", width=60, command=self.browse_sqlite_file, 
+                      fg_color=COLORS["bg_medium"], text_color=COLORS["text"]).pack(side="right")
+
+        io_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        io_frame.pack(fill="x", pady=(10, 0))
+
+        ctk.CTkButton(io_frame, text="📤 엑셀로 내보내기", height=30, command=self.do_export_excel,
+                      fg_color=COLORS["bg_medium"], text_color=COLORS["text"]).pack(side="left", fill="x", expand=True, padx=(0, 5))
+        ctk.CTkButton(io_frame, text="📥 엑셀에서 가져오기", height=30, command=self.do_import_excel,
+                      fg_color=COLORS["bg_medium"], text_color=COLORS["text"]).pack(side="right", fill="x", expand=True, padx=(5, 0))
+
+        ctk.CTkFrame(parent, height=1, fg_color=COLORS["border"]).pack(fill="x", pady=15)
+
 
 
         # 6. 개발자 모드 설정
@@ -186,6 +224,39 @@ class SettingsPopup(ctk.CTkToplevel):
 
 
 
+    def browse_sqlite_file(self):
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".db", confirmoverwrite=False,
+                                                 filetypes=[("SQLite DB", "*.db;*.sqlite")])
+        if file_path:
+            self.sqlite_path_entry.delete(0, "end")
+            self.sqlite_path_entry.insert(0, file_path)
+
+    def do_export_excel(self):
+        sales_path = filedialog.asksaveasfilename(parent=self, title="판매 데이터 내보내기", defaultextension=".xlsx",
+                                                  initialfile="SalesList.xlsx", filetypes=[("Excel files", "*.xlsx")])
+        if not sales_path: return
+        purchase_path = filedialog.asksaveasfilename(parent=self, title="구매 데이터 내보내기 (취소 시 생략)", defaultextension=".xlsx",
+                                                     initialfile="OrderList.xlsx", filetypes=[("Excel files", "*.xlsx")])
+        success, msg = self.dm.export_to_excel(sales_path, purchase_path or None)
+        if success:
+            messagebox.showinfo("내보내기", msg, parent=self)
+        else:
+            messagebox.showerror("실패", msg, parent=self)
+
+    def do_import_excel(self):
+        sales_path = filedialog.askopenfilename(parent=self, title="가져올 판매 데이터 (SalesList)", filetypes=[("Excel files", "*.xlsx;*.xls;*.xlsm")])
+        if not sales_path: return
+        purchase_path = filedialog.askopenfilename(parent=self, title="가져올 구매 데이터 (OrderList, 취소 시 생략)", filetypes=[("Excel files", "*.xlsx;*.xls;*.xlsm")])
+        if not messagebox.askyesno("가져오기", "현재 저장소의 데이터가 선택한 엑셀 내용으로 교체됩니다.\n계속하시겠습니까?", parent=self):
+            return
+        success, msg = self.dm.import_from_excel(sales_path, purchase_path or None)
+        if success:
+            messagebox.showinfo("가져오기", msg, parent=self)
+            if self.refresh_callback:
+                self.refresh_callback()
+        else:
+            messagebox.showerror("실패", msg, parent=self)
+
     def browse_purchase_file(self):
         file_path = filedialog.askopenfilename(parent=self, filetypes=[("Excel files", "*.xlsx;*.xls;*.xlsm")])
         if file_path:
@@ -226,15 +297,47 @@ class SettingsPopup(ctk.CTkToplevel):
         new_attach = self.attach_path_entry.get()
         new_prod_path = self.prod_path_entry.get()
         new_purchase_path = self.purchase_path_entry.get()
+        new_engine = "sqlite" if self.engine_var.get() == "SQLite" else "excel"
+        new_sqlite_path = self.sqlite_path_entry.get()
         
         if new_path:
+            storage_changed = (new_engine != self.dm.storage_engine or
+                               (new_engine == "sqlite" and new_sqlite_path != self.dm.sqlite_path))
+            old_storage = (self.dm.storage_engine, self.dm.sqlite_path)
+            # 아직 없는 DB로 전환하면 빈 데이터가 되므로 현재 엑셀 데이터를 먼저 옮김 (거절하면 전환하지 않음)
+            migrate = storage_changed and new_engine == "sqlite" and not os.path.exists(new_sqlite_path)
+            if migrate and not messagebox.askyesno(
+                    "SQLite 전환", f"SQLite DB 파일이 없습니다.\n{new_sqlite_path}\n\n"
+                    "현재 엑셀 데이터를 새 DB로 옮긴 뒤 전환하시겠습니까?", parent=self):
+                return
+            if storage_changed:
+                # 저장 대기 중인 작업은 이전 저장소에 먼저 저장
+                success, msg = self.dm.flush_journal()
+                if not success:
+                    messagebox.showerror("저장 실패", f"저장 대기 중인 변경사항을 저장하지 못했습니다.\n{msg}", parent=self)
+                    return
+
             self.dm.save_config(
                 new_path=new_path, 
                 new_theme=new_theme, 
                 new_attachment_dir=new_attach,
                 new_prod_path=new_prod_path,
-                new_purchase_path=new_purchase_path
+                new_purchase_path=new_purchase_path,
+                new_storage_engine=new_engine,
+                new_sqlite_path=new_sqlite_path
             )
+
+            # 저장소가 바뀌면 메모리 데이터를 새 저장소 기준으로 다시 로드 (실패하면 이전 저장소로 되돌림)
+            if storage_changed:
+                if migrate:
+                    success, msg = self.dm.import_from_excel(self.dm.current_excel_path, self.dm.purchase_data_path)
+                else:
+                    success, msg = self.dm.load_data()
+                if not success:
+                    self.dm.save_config(new_storage_engine=old_storage[0], new_sqlite_path=old_storage[1])
+                    self.dm.load_data()
+                    messagebox.showerror("저장소 전환 실패", f"이전 저장소를 계속 사용합니다.\n{msg}", parent=self)
+                    return
             
             messagebox.showinfo("설정 저장", "설정이 저장되었습니다.", parent=self)
             self.destroy()
@@ -6,9 +6,56 @@ import customtkinter as ctk
 import pandas as pd
 
 from src.styles import COLORS, FONT_FAMILY, FONTS
+from ui.widgets.virtual_tree import display_rollup
+
+# 달력에 표시하지 않는 상태
+HIDDEN_STATUSES = ["완료", "취소", "보류"]
+# 일정 미정 목록에 표시하는 상태
+UNSCHEDULED_STATUSES = ["주문", "생산중", "납품대기"]
+CALENDAR_DAYS = 35  # 5주 표시
+
+
+def calendar_index(summary):
+    """
+    관리번호별 요약에서 출고예정일 -> 일정 목록 사전을 만듭니다. (관리번호 순)
+    일정: (관리번호, 표시 문자열, 드래그 문자열). 건은 가장 이른 출고예정일에 표시합니다.
+    """
+    summary = display_rollup(summary.sort_index())
+    target = summary[summary["최초출고예정일"].notna() & ~summary["대표상태"].isin(HIDDEN_STATUSES)]
+    index = {}
+    for mgmt_no, date, client, model, count in zip(
+            target.index, target["최초출고예정일"], target["업체명"], target["모델명"], target["품목수"]):
+        count_str = f" ({count})" if count > 1 else ""
+        index.setdefault(date, []).append((mgmt_no, f"[{client}] {model}", f"[{mgmt_no}] {client}{count_str}"))
+    return index
+
+
+def unscheduled_items(summary):
+    """
+    출고예정일이 하나도 없는 진행 중인 건 목록. (관리번호 순)
+    항목: (관리번호, 제목, 정보, 드래그 문자열)
+    """
+    summary = display_rollup(summary.sort_index())
+    mask_status = summary["Status"].astype(str).str.contains("|".join(UNSCHEDULED_STATUSES), regex=True)
+    target = summary[summary["최초출고예정일"].isna() & mask_status]
+    items = []
+    for mgmt_no, client, model, status, qty, count in zip(
+            target.index, target["업체명"], target["모델명"], target["Status"], target["수량합계"], target["품목수"]):
+        info = f"{qty:g}개 | {status}"
+        if count > 1: info += f" ({count} items)"
+        count_str = f" ({count})" if count > 1 else ""
+        items.append((mgmt_no, f"[{client}] {model}", info, f"[{mgmt_no}] {client}{count_str}"))
+    return items
 
 
 class CalendarView(ctk.CTkFrame):
+    """
+    4주(5주 표시) 달력 + 일정 미정 사이드바.
+    날짜 칸과 일정/사이드바 라벨은 한 번 만들어 두고 재사용하며,
+    기간 이동이나 데이터 변경 시에는 내용이 바뀐 칸만 라벨을 고칩니다.
+    날짜별 일정 사전은 주문 요약이 바뀔 때만 다시 만듭니다.
+    """
+
     def __init__(self, parent, data_manager, popup_manager):
         super().__init__(parent, fg_color="transparent")
         self.dm = data_manager
@@ -23,6 +70,13 @@ class CalendarView(ctk.CTkFrame):
         self.click_timer = None
         self.drag_started = False
 
+        # 데이터 버전(주문 요약)별 캐시
+        self._summary = None
+        self._events = {}
+        self._unscheduled = []
+
+        self.cells = []
+        self.sidebar_items = []
         self.create_widgets()
         self.refresh_data()
 
@@ -71,6 +125,7 @@ class CalendarView(ctk.CTkFrame):
         # 달력 프레임
         self.calendar_frame = ctk.CTkFrame(content_container, fg_color=COLORS["bg_dark"], corner_radius=10)
         self.calendar_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
+        self._create_grid()
 
         # 우측 사이드바 (일정 미정 목록 등)
         self.sidebar_frame = ctk.CTkFrame(content_container, width=300, fg_color=COLORS["bg_dark"], corner_radius=10)
@@ -80,187 +135,141 @@ class CalendarView(ctk.CTkFrame):
         ctk.CTkLabel(self.sidebar_frame, text="📅 일정 미정 (납품대기)", font=FONTS["header"], text_color=COLORS["warning"]).pack(pady=(15, 5), padx=15, anchor="w")
         self.unscheduled_scroll = ctk.CTkScrollableFrame(self.sidebar_frame, fg_color=COLORS["bg_medium"], corner_radius=6)
         self.unscheduled_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.lbl_no_data = ctk.CTkLabel(self.unscheduled_scroll, text="데이터 없음", text_color=COLORS["text_dim"])
+
+    def _create_grid(self):
+        """요일 헤더와 날짜 칸을 한 번만 만듭니다. (내용은 update_calendar에서 채움)"""
+        days_header = ["일", "월", "화", "수", "목", "금", "토"]
+        for i, day in enumerate(days_header):
+            color = COLORS["danger"] if i == 0 else (COLORS["primary"] if i == 6 else COLORS["text"])
+            ctk.CTkLabel(self.calendar_frame, text=day, font=FONTS["main_bold"], text_color=color).grid(row=0, column=i, sticky="nsew", pady=5)
+
+        for i in range(7): self.calendar_frame.grid_columnconfigure(i, weight=1, uniform="days")
+
+        for i in range(CALENDAR_DAYS):
+            r, c = (i // 7) + 1, i % 7
+            self.calendar_frame.grid_rowconfigure(r, weight=1, uniform="weeks")
+
+            cell = ctk.CTkFrame(self.calendar_frame, fg_color=COLORS["bg_medium"], border_width=1, border_color=COLORS["border"])
+            cell.grid(row=r, column=c, sticky="nsew", padx=1, pady=1)
+            cell.target_date = None # 드래그 타겟용 속성
+            cell.day_lbl = ctk.CTkLabel(cell, text="", font=FONTS["small"])
+            cell.day_lbl.pack(anchor="nw", padx=5, pady=2)
+            cell.day_style = None  # (날짜, 색상, 오늘 여부)
+            cell.scroll = None     # 일정이 처음 생길 때 만듦
+            cell.labels = []       # 재사용하는 일정 라벨
+            cell.shown = ()        # 현재 표시 중인 일정 목록
+            self.cells.append(cell)
 
     def refresh_data(self):
+        self._load_index()
         self.update_calendar()
         self.update_sidebar()
 
-    def update_sidebar(self):
-        for widget in self.unscheduled_scroll.winfo_children(): widget.destroy()
-
+    def _load_index(self):
+        """주문 요약이 바뀐 경우에만 날짜별 일정/일정 미정 목록을 다시 만듭니다."""
         df = self.dm.df_data
-        if df.empty: return
-
-        # 조건: '납품대기'가 포함된 상태이면서, 출고예정일이 없거나(-)인 경우
-        target_status = ["주문", "생산중", "납품대기"]
-        
-        # 출고예정일이 '-' 이거나 비어있는 데이터
-        mask_date = (df['출고예정일'] == '-') | (df['출고예정일'] == '') | (df['출고예정일'].isna())
-        mask_status = df['Status'].apply(lambda x: any(s in str(x) for s in target_status))
-        
-        target_df = df[mask_date & mask_status].copy()
-        
-        if target_df.empty:
-            ctk.CTkLabel(self.unscheduled_scroll, text="데이터 없음", text_color=COLORS["text_dim"]).pack(pady=10)
+        if df.empty or "관리번호" not in df.columns:
+            self._summary, self._events, self._unscheduled = None, {}, []
             return
+        summary = self.dm.get_order_summary()
+        if summary is self._summary: return
+        self._summary = summary
+        self._events = calendar_index(summary)
+        self._unscheduled = unscheduled_items(summary)
 
-        # [수정] 그룹화 (관리번호, 업체명)
-        grouped = target_df.groupby(["관리번호", "업체명"])
-        
-        for (mgmt_no, client_name), group in grouped:
-            item_count = len(group)
-            first_row = group.iloc[0]
-            first_model = first_row.get("모델명", "")
-            
-            # 모델명 요약
-            model_display = first_model
-            if item_count > 1:
-                 model_display = f"{first_model} 외 {item_count-1}건"
-            
-            # 수량 합계 (문자열일 수 있으므로 처리)
-            total_qty = 0
-            try:
-                # 숫자만 추출하거나 변환
-                for q in group["수량"]:
-                    total_qty += float(str(q).replace(",", ""))
-            except: total_qty = 0
-
-            # 카드 데이터 생성
-            card_data = {
-                "mgmt_no": mgmt_no,
-                "client_name": client_name,
-                "model": model_display,
-                "status": first_row['Status'], # 대표 상태
-                "qty": total_qty,
-                "item_count": item_count
-            }
-            self._create_sidebar_item(card_data)
-
-    def _create_sidebar_item(self, data):
+    def update_sidebar(self):
+        items = self._unscheduled
+        if items: self.lbl_no_data.pack_forget()
+        else: self.lbl_no_data.pack(pady=10)
+
+        while len(self.sidebar_items) < len(items):
+            self.sidebar_items.append(self._create_sidebar_item())
+        for card, item in zip(self.sidebar_items, items):
+            if card.shown != item:
+                card.mgmt_no, title, info, card.drag_text = item
+                card.lbl_title.configure(text=title)
+                card.lbl_info.configure(text=info)
+                card.shown = item
+            if not card.winfo_manager(): card.pack(fill="x", pady=3, padx=5)
+        for card in self.sidebar_items[len(items):]:
+            card.pack_forget()
+
+    def _create_sidebar_item(self):
         card = ctk.CTkFrame(self.unscheduled_scroll, fg_color=COLORS["bg_dark"], corner_radius=5)
-        card.pack(fill="x", pady=3, padx=5)
-        
-        mgmt_no = data['mgmt_no']
-        title = f"[{data['client_name']}] {data['model']}"
-        
-        # 수량 포맷
-        qty_str = f"{data['qty']:g}" 
-        info = f"{qty_str}개 | {data['status']}"
-        if data['item_count'] > 1:
-            info += f" ({data['item_count']} items)"
-        
-        ctk.CTkLabel(card, text=title, font=(FONT_FAMILY, 11, "bold"), anchor="w").pack(fill="x", padx=5, pady=(5,0))
-        ctk.CTkLabel(card, text=info, font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"], anchor="w").pack(fill="x", padx=5, pady=(0,5))
-        
-        # 드래그 이벤트 연결
-        count_str = f" ({data['item_count']})" if data['item_count'] > 1 else ""
-        drag_text = f"[{mgmt_no}] {data['client_name']}{count_str}"
+        card.mgmt_no, card.drag_text, card.shown = None, "", None
+
+        card.lbl_title = ctk.CTkLabel(card, text="", font=(FONT_FAMILY, 11, "bold"), anchor="w")
+        card.lbl_title.pack(fill="x", padx=5, pady=(5,0))
+        card.lbl_info = ctk.CTkLabel(card, text="", font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"], anchor="w")
+        card.lbl_info.pack(fill="x", padx=5, pady=(0,5))
         
+        # 드래그 이벤트 연결 (표시 중인 건을 참조하므로 재사용 시 다시 바인딩하지 않음)
         for w in [card] + card.winfo_children():
-            w.bind("<Button-1>", lambda e, r=mgmt_no, d=None, t=drag_text, w=card: self.start_drag(e, r, d, t, w))
+            w.bind("<Button-1>", lambda e: self.start_drag(e, card.mgmt_no, None, card.drag_text, card))
             w.bind("<B1-Motion>", self.do_drag)
             w.bind("<ButtonRelease-1>", self.stop_drag)
+        return card
 
     def update_calendar(self):
-        for widget in self.calendar_frame.winfo_children(): widget.destroy()
-
         # 달력 날짜 계산 (4주)
         offset = (self.base_date.weekday() + 1) % 7
         start_date = self.base_date - timedelta(days=offset)
-        calendar_days = [start_date + timedelta(days=i) for i in range(35)] # 5주 표시
+        calendar_days = [start_date + timedelta(days=i) for i in range(CALENDAR_DAYS)]
         end_date = calendar_days[-1]
 
         self.period_label.configure(text=f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}")
+        today = datetime.now().strftime("%Y-%m-%d")
 
-        # 요일 헤더
-        days_header = ["일", "월", "화", "수", "목", "금", "토"]
-        for i, day in enumerate(days_header):
-            color = COLORS["danger"] if i == 0 else (COLORS["primary"] if i == 6 else COLORS["text"])
-            ctk.CTkLabel(self.calendar_frame, text=day, font=FONTS["main_bold"], text_color=color).grid(row=0, column=i, sticky="nsew", pady=5)
-
-        for i in range(7): self.calendar_frame.grid_columnconfigure(i, weight=1, uniform="days")
-
-        # 데이터 매핑 (그룹화 적용)
-        df = self.dm.df_data
-        events = {}
-
-        if not df.empty:
-            s_str = start_date.strftime("%Y-%m-%d")
-            e_str = end_date.strftime("%Y-%m-%d")
-            
-            # 출고예정일이 범위 내에 있는 데이터
-            mask = (df['출고예정일'] >= s_str) & (df['출고예정일'] <= e_str) & (df['출고예정일'] != '-')
-            mask_status = ~df['Status'].isin(['완료', '취소', '보류'])
-            
-            target_df = df[mask & mask_status]
-            
-            if not target_df.empty:
-                # [수정] 날짜, 관리번호, 업체명으로 그룹화하여 카드 생성
-                grouped = target_df.groupby(["출고예정일", "관리번호", "업체명"])
-                
-                for (d_str, mgmt_no, client_name), group in grouped:
-                    if d_str not in events: events[d_str] = []
-                    
-                    item_count = len(group)
-                    first_row = group.iloc[0]
-                    first_model = first_row.get("모델명", "")
-                    
-                    model_display = first_model
-                    if item_count > 1:
-                         model_display = f"{first_model} 외 {item_count-1}건"
-                    
-                    # 카드 정보 객체 생성
-                    card_data = {
-                        "mgmt_no": mgmt_no,
-                        "client_name": client_name,
-                        "model": model_display,
-                        "item_count": item_count
-                    }
-                    events[d_str].append(card_data)
-
-        # 달력 셀 그리기
-        for i, curr_date in enumerate(calendar_days):
-            r, c = (i // 7) + 1, i % 7
-            self.calendar_frame.grid_rowconfigure(r, weight=1, uniform="weeks")
-            
-            cell = ctk.CTkFrame(self.calendar_frame, fg_color=COLORS["bg_medium"], border_width=1, border_color=COLORS["border"])
-            cell.grid(row=r, column=c, sticky="nsew", padx=1, pady=1)
-            
+        for i, (cell, curr_date) in enumerate(zip(self.cells, calendar_days)):
+            c = i % 7
             date_str = curr_date.strftime("%Y-%m-%d")
-            cell.target_date = date_str # 드래그 타겟용 속성
-            
-            # 오늘 날짜 강조
-            if date_str == datetime.now().strftime("%Y-%m-%d"):
-                cell.configure(border_color=COLORS["primary"], border_width=2)
+            cell.target_date = date_str
 
-            # 날짜 표시
+            # 날짜 표시 (다른 달 날짜 흐리게, 오늘 날짜 강조)
             day_color = COLORS["danger"] if c == 0 else (COLORS["primary"] if c == 6 else COLORS["text"])
-            if curr_date.month != self.base_date.month: day_color = COLORS["text_dim"] # 다른 달 날짜 흐리게
-            
-            day_lbl = ctk.CTkLabel(cell, text=str(curr_date.day), font=FONTS["small"], text_color=day_color)
-            day_lbl.pack(anchor="nw", padx=5, pady=2)
-
-            # 이벤트 표시 (스크롤 가능)
-            if date_str in events:
-                scroll = ctk.CTkScrollableFrame(cell, fg_color="transparent")
-                scroll.pack(fill="both", expand=True, padx=2, pady=2)
-                
-                for card in events[date_str]:
-                    mgmt_no = card['mgmt_no']
-                    comp = card['client_name']
-                    txt = f"[{comp}] {card['model']}"
-                    
-                    lbl = ctk.CTkLabel(scroll, text=txt, font=(FONT_FAMILY, 10), anchor="w", fg_color=COLORS["bg_dark"], corner_radius=4)
-                    lbl.pack(fill="x", pady=1)
-                    
-                    count_str = f" ({card['item_count']})" if card['item_count'] > 1 else ""
-                    drag_text = f"[{mgmt_no}] {comp}{count_str}"
-                    
-                    lbl.bind("<Button-1>", lambda e, r=mgmt_no, d=date_str, t=drag_text, w=lbl: self.start_drag(e, r, d, t, w))
-                    lbl.bind("<B1-Motion>", self.do_drag)
-                    lbl.bind("<ButtonRelease-1>", self.stop_drag)
-                    # 더블클릭 시 상세
-                    lbl.bind("<Double-1>", lambda e, r=mgmt_no: self.pm.open_quote_popup(r))
+            if curr_date.month != self.base_date.month: day_color = COLORS["text_dim"]
+            style = (curr_date.day, day_color, date_str == today)
+            if cell.day_style != style:
+                cell.day_lbl.configure(text=str(curr_date.day), text_color=day_color)
+                if style[2]: cell.configure(border_color=COLORS["primary"], border_width=2)
+                else: cell.configure(border_color=COLORS["border"], border_width=1)
+                cell.day_style = style
+
+            self._show_events(cell, tuple(self._events.get(date_str, ())))
+
+    def _show_events(self, cell, events):
+        """칸의 일정 라벨을 events에 맞춥니다. (같으면 아무것도 하지 않음)"""
+        if events == cell.shown: return
+        if events and cell.scroll is None:
+            cell.scroll = ctk.CTkScrollableFrame(cell, fg_color="transparent")
+
+        while len(cell.labels) < len(events):
+            cell.labels.append(self._create_event_label(cell))
+        for lbl, event in zip(cell.labels, events):
+            if lbl.event != event:
+                lbl.mgmt_no, text, lbl.drag_text = event
+                lbl.configure(text=text)
+                lbl.event = event
+            if not lbl.winfo_manager(): lbl.pack(fill="x", pady=1)
+        for lbl in cell.labels[len(events):]:
+            lbl.pack_forget()
+
+        # 일정이 없는 칸은 스크롤 영역을 숨김
+        if events and not cell.shown: cell.scroll.pack(fill="both", expand=True, padx=2, pady=2)
+        elif not events and cell.scroll is not None: cell.scroll.pack_forget()
+        cell.shown = events
+
+    def _create_event_label(self, cell):
+        lbl = ctk.CTkLabel(cell.scroll, text="", font=(FONT_FAMILY, 10), anchor="w", fg_color=COLORS["bg_dark"], corner_radius=4)
+        lbl.mgmt_no, lbl.drag_text, lbl.event = None, "", None
+        # 칸의 날짜와 표시 중인 건을 이벤트 시점에 읽으므로 기간 이동 후에도 다시 바인딩하지 않음
+        lbl.bind("<Button-1>", lambda e: self.start_drag(e, lbl.mgmt_no, cell.target_date, lbl.drag_text, lbl))
+        lbl.bind("<B1-Motion>", self.do_drag)
+        lbl.bind("<ButtonRelease-1>", self.stop_drag)
+        # 더블클릭 시 상세
+        lbl.bind("<Double-1>", lambda e: self.pm.open_quote_popup(lbl.mgmt_no))
+        return lbl
 
     # --- 드래그 앤 드롭 로직 (간소화) ---
     def _start_drag_window(self, text):
@@ -307,13 +316,10 @@ class CalendarView(ctk.CTkFrame):
             origin_date = self.drag_data["origin_date"]
 
             if target_date and mgmt_no and target_date != origin_date:
-                # 날짜 업데이트
-                df = self.dm.df_data
-                mask = df["관리번호"] == mgmt_no
-                if mask.any():
-                    self.dm.df_data.loc[mask, "출고예정일"] = target_date
-                    # 사이드바에서 드래그했다면 상태 변경 (납품대기 -> 생산중 등) 고려 가능하나 여기선 날짜만
-                    self.dm.save_to_excel()
+                # 날짜 업데이트 (트랜잭션으로 저장하여 요약 테이블 등도 갱신되도록 함)
+                # 사이드바에서 드래그했다면 상태 변경 (납품대기 -> 생산중 등) 고려 가능하나 여기선 날짜만
+                success, _ = self.dm.update_order_fields(mgmt_no, {"출고예정일": target_date})
+                if success:
                     self.refresh_data()
         
         self.drag_started = False
@@ -2,13 +2,21 @@ import tkinter as tk
 from datetime import datetime
 
 import customtkinter as ctk
-import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 
 # [변경] 경로 수정
 from src.config import Config
 from src.styles import COLORS, FONT_FAMILY, FONTS, get_color_str
+from managers.data.kpi_service import PIPELINE_ORDER
+from ui.widgets.charts import PipelineChart
+from ui.widgets.virtual_tree import format_number
+
+PIPELINE_COLORS = {
+    '견적': '#90CAF9', '주문': '#42A5F5', '생산중': '#1E88E5',
+    '납품대기': '#FFB74D', '입금대기': '#EF5350', '완료': '#66BB6A'
+}
 
 
 class DashboardView(ctk.CTkFrame):
@@ -22,9 +30,16 @@ class DashboardView(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=0)
         self.grid_rowconfigure(1, weight=1)
 
+        self._shown_kpis = None
         self.create_widgets()
         self.refresh_data()
 
+    def destroy(self):
+        # pyplot을 거치지 않은 Figure이므로 캔버스와 함께 정리
+        self.canvas.get_tk_widget().destroy()
+        self.figure.clear()
+        super().destroy()
+
     def create_widgets(self):
         title_frame = ctk.CTkFrame(self, fg_color="transparent")
         title_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=20, pady=(20, 10))
@@ -76,7 +91,12 @@ class DashboardView(ctk.CTkFrame):
         
         self.chart_area = ctk.CTkFrame(chart_container, fg_color="transparent")
         self.chart_area.pack(fill="both", expand=True, padx=10, pady=10)
-        self.canvas = None
+
+        # Figure/캔버스는 한 번만 만들고 갱신 시 막대 길이와 눈금만 바꿈
+        self.figure = Figure(figsize=(6, 4), dpi=100, tight_layout=True)
+        self.pipeline_chart = PipelineChart(self.figure.add_subplot(), PIPELINE_ORDER)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.chart_area)
+        self.lbl_chart_empty = ctk.CTkLabel(self.chart_area, text="데이터가 없습니다.", font=FONTS["main"])
 
         list_container = ctk.CTkFrame(content_frame, fg_color=COLORS["bg_medium"], corner_radius=10)
         list_container.grid(row=0, column=1, sticky="nsew")
@@ -87,129 +107,61 @@ class DashboardView(ctk.CTkFrame):
         self.list_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_data(self):
-        df = self.dm.df_data.copy() if not self.dm.df_data.empty else None
-
-        if df is None or df.empty:
+        if self.dm.df_data.empty:
+            self._shown_kpis = None
             self._update_empty_state()
             return
 
-        self._update_kpi_cards(df)
-        self._update_pipeline_chart(df)
-        self._update_delivery_list(df)
+        # 지표는 데이터가 바뀌었을 때만 다시 계산되며, 같은 결과면 화면도 그대로 둠
+        kpis = self.dm.get_dashboard_kpis()
+        if kpis is self._shown_kpis: return
+        self._shown_kpis = kpis
+
+        self._update_kpi_cards(kpis)
+        self._update_pipeline_chart(kpis["pipeline"])
+        self._update_delivery_list(kpis["deliveries"])
 
     def _update_empty_state(self):
         for lbl in self.card_widgets:
             lbl.configure(text="-")
         
-        for widget in self.chart_area.winfo_children(): widget.destroy()
-        ctk.CTkLabel(self.chart_area, text="데이터가 없습니다.", font=FONTS["main"]).pack(expand=True)
-
-    def _update_kpi_cards(self, df):
-        now = datetime.now()
-        
-        if '입금완료일' not in df.columns:
-            df['입금완료일'] = pd.NaT
-            
-        df['입금완료일_dt'] = pd.to_datetime(df['입금완료일'], errors='coerce', format='mixed')
-        
-        mask_month = (df['입금완료일_dt'].dt.year == now.year) & (df['입금완료일_dt'].dt.month == now.month)
-        mask_complete = df['Status'].astype(str).str.contains("완료")
-        
-        revenue_df = df[mask_month & mask_complete]
-        total_revenue = pd.to_numeric(revenue_df['합계금액'], errors='coerce').sum()
-
-        total_unpaid = pd.to_numeric(df['미수금액'], errors='coerce').sum()
-
-        exclude_status = ['견적', '완료', '보류', '취소']
-        active_orders = df[~df['Status'].isin(exclude_status)]
-        active_count = len(active_orders)
-
-        today_str = now.strftime("%Y-%m-%d")
-        today_delivery = df[df['출고예정일'] == today_str]
-        today_count = len(today_delivery)
-
+        self._show_chart(False)
+
+    def _show_chart(self, visible):
+        """차트 캔버스와 '데이터 없음' 안내 중 하나를 표시합니다."""
+        widget = self.canvas.get_tk_widget()
+        if visible:
+            self.lbl_chart_empty.pack_forget()
+            if not widget.winfo_manager(): widget.pack(fill="both", expand=True)
+        else:
+            widget.pack_forget()
+            if not self.lbl_chart_empty.winfo_manager(): self.lbl_chart_empty.pack(expand=True)
+
+    def _update_kpi_cards(self, kpis):
         kpi_values = [
-            f"₩ {total_revenue:,.0f}",
-            f"₩ {total_unpaid:,.0f}",
-            f"{active_count} 건",
-            f"{today_count} 건"
+            f"₩ {kpis['revenue']:,.0f}",
+            f"₩ {kpis['unpaid']:,.0f}",
+            f"{kpis['active']} 건",
+            f"{kpis['today_shipments']} 건"
         ]
 
         for lbl, val in zip(self.card_widgets, kpi_values):
             lbl.configure(text=val)
 
-    def _update_pipeline_chart(self, df):
-        if self.canvas:
-            self.canvas.get_tk_widget().destroy()
-            self.canvas = None
+    def _update_pipeline_chart(self, counts):
+        has_data = self.pipeline_chart.update(counts, PIPELINE_COLORS, get_color_str("bg_medium"),
+                                              get_color_str("text"), FONT_FAMILY)
+        self._show_chart(has_data)
+        if has_data: self.canvas.draw_idle()
 
-        pipeline_order = ['견적', '주문', '생산중', '납품대기', '입금대기', '완료']
-        status_counts = df['Status'].value_counts()
-        
-        data = []
-        labels = []
-        colors = []
-        
-        color_map = {
-            '견적': '#90CAF9', '주문': '#42A5F5', '생산중': '#1E88E5',
-            '납품대기': '#FFB74D', '입금대기': '#EF5350', '완료': '#66BB6A'
-        }
-
-        for status in pipeline_order:
-            count = 0
-            for idx, val in status_counts.items():
-                if status in str(idx):
-                    count += val
-            
-            if count > 0:
-                data.append(count)
-                labels.append(status)
-                colors.append(color_map.get(status, '#BDBDBD'))
-
-        if not data:
-            return
-
-        bg_color = get_color_str("bg_medium")
-        text_color = get_color_str("text")
-
-        fig, ax = plt.subplots(figsize=(6, 4), dpi=100)
-        fig.patch.set_facecolor(bg_color)
-        ax.set_facecolor(bg_color)
-
-        y_pos = range(len(labels))
-        ax.barh(y_pos, data, color=colors, align='center', height=0.6)
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(labels, color=text_color, fontfamily=FONT_FAMILY)
-        ax.invert_yaxis()
-        
-        ax.tick_params(axis='x', colors=text_color)
-        ax.spines['bottom'].set_color(text_color)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-
-        for i, v in enumerate(data):
-            ax.text(v + 0.1, i, str(v), color=text_color, va='center', fontweight='bold')
-
-        plt.tight_layout()
-
-        self.canvas = FigureCanvasTkAgg(fig, master=self.chart_area)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _update_delivery_list(self, df):
+    def _update_delivery_list(self, target_df):
         for w in self.list_scroll.winfo_children(): w.destroy()
 
-        mask = (df['출고예정일'] != '-') & (~df['Status'].str.contains('완료')) & (~df['Status'].str.contains('취소'))
-        target_df = df[mask].copy()
-        
         if target_df.empty:
             ctk.CTkLabel(self.list_scroll, text="예정된 납품이 없습니다.", text_color=COLORS["text_dim"]).pack(pady=20)
             return
 
-        target_df = target_df.sort_values(by='출고예정일')
-
-        for _, row in target_df.head(10).iterrows():
+        for _, row in target_df.iterrows():
             card = ctk.CTkFrame(self.list_scroll, fg_color=COLORS["bg_dark"], corner_radius=5)
             card.pack(fill="x", pady=5, padx=5)
             
@@ -238,7 +190,9 @@ class DashboardView(ctk.CTkFrame):
             title = f"[{row['업체명']}] {row['모델명']}"
             ctk.CTkLabel(center, text=title, font=(FONT_FAMILY, 12, "bold"), anchor="w").pack(fill="x")
             
-            info = f"수량: {row['수량']} | 금액: {row['합계금액']:,}원" if str(row['합계금액']).replace(',','').replace('.','').isdigit() else f"수량: {row['수량']}"
+            amount = row['합계금액']
+            qty = format_number(row['수량'])
+            info = f"수량: {qty} | 금액: {format_number(amount)}원" if pd.api.types.is_number(amount) and amount == amount else f"수량: {qty}"
             ctk.CTkLabel(center, text=info, font=(FONT_FAMILY, 11), text_color=COLORS["text_dim"], anchor="w").pack(fill="x")
 
             ctk.CTkLabel(card, text=row['Status'], font=(FONT_FAMILY, 11), text_color=COLORS["text"]).pack(side="right", padx=15)
\ No newline at end of file
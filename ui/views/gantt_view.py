@@ -1,27 +1,37 @@
 import tkinter as tk
 
 import customtkinter as ctk
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
-import pandas as pd
+import matplotlib
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 
 # [변경] 경로 수정
 from src.styles import COLORS, FONT_FAMILY, FONTS, get_color_str
+from ui.widgets.charts import GanttChart, gantt_rows
 
 
 class GanttView(ctk.CTkFrame):
+    # 화면 높이에서 보이는 행 수를 계산할 때의 행 높이 (픽셀)
+    ROW_HEIGHT = 36
+
     def __init__(self, parent, data_manager, popup_manager):
         super().__init__(parent, fg_color="transparent")
         self.dm = data_manager
         self.pm = popup_manager
 
-        plt.rcParams['font.family'] = FONT_FAMILY
-        plt.rcParams['axes.unicode_minus'] = False
+        matplotlib.rcParams['font.family'] = FONT_FAMILY
+        matplotlib.rcParams['axes.unicode_minus'] = False
 
+        self.offset = 0
         self.create_widgets()
         self.refresh_data()
 
+    def destroy(self):
+        # pyplot을 거치지 않은 Figure이므로 캔버스와 함께 정리
+        self.canvas.get_tk_widget().destroy()
+        self.figure.clear()
+        super().destroy()
+
     def create_widgets(self):
         toolbar = ctk.CTkFrame(self, height=50, fg_color="transparent")
         toolbar.pack(fill="x", padx=20, pady=(10, 0))
@@ -31,65 +41,48 @@ class GanttView(ctk.CTkFrame):
 
         self.chart_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_dark"], corner_radius=10)
         self.chart_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.canvas = None
+
+        # Figure/캔버스는 한 번만 만들고 갱신 시 막대와 눈금만 바꿈
+        self.figure = Figure(figsize=(10, 4), dpi=100)
+        self.figure.subplots_adjust(left=0.3, right=0.97, top=0.97, bottom=0.08)
+        self.chart = GanttChart(self.figure.add_subplot())
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.chart_frame)
+
+        self.scrollbar = ctk.CTkScrollbar(self.chart_frame, orientation="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        widget = self.canvas.get_tk_widget()
+        widget.pack(side="left", fill="both", expand=True)
+        widget.bind("<Configure>", lambda e: self.after_idle(self._render), add="+")
+        widget.bind("<MouseWheel>", lambda e: self._scroll_by(-3 if e.delta > 0 else 3))
+        widget.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        widget.bind("<Button-5>", lambda e: self._scroll_by(3))
 
     def refresh_data(self):
-        if self.canvas:
-            self.canvas.get_tk_widget().destroy()
-            self.canvas = None
-
-        df = self.dm.df_data
-        if df.empty: return
-
-        df['start'] = pd.to_datetime(df['수주일'], errors='coerce', format='mixed')
-        df['start'] = df['start'].fillna(pd.to_datetime(df['견적일'], errors='coerce', format='mixed'))
-        
-        df['end'] = pd.to_datetime(df['출고예정일'], errors='coerce', format='mixed')
-        
-        mask = df['start'].notna() & (~df['Status'].isin(['완료', '취소', '보류']))
-        target_df = df[mask].copy()
-        
-        if target_df.empty: return
-        
-        mask_no_end = target_df['end'].isna()
-        target_df.loc[mask_no_end, 'end'] = target_df.loc[mask_no_end, 'start'] + pd.Timedelta(days=3)
-        
-        target_df['duration'] = (target_df['end'] - target_df['start']).dt.days
-        target_df.loc[target_df['duration'] < 1, 'duration'] = 1 
-        
-        target_df = target_df.sort_values(by='start')
-
-        self.draw_chart(target_df)
-
-    def draw_chart(self, df):
-        bg_color = get_color_str("bg_dark")
-        text_color = get_color_str("text")
-        
-        labels = [f"[{row['업체명']}] {row['모델명']}" for _, row in df.iterrows()]
-        starts = mdates.date2num(df['start'])
-        durations = df['duration'].tolist()
-        
-        height = max(4, len(df) * 0.5)
-        fig, ax = plt.subplots(figsize=(10, height), dpi=100)
-        fig.patch.set_facecolor(bg_color)
-        ax.set_facecolor(bg_color)
-        
-        y_pos = range(len(labels))
-        bars = ax.barh(y_pos, durations, left=starts, height=0.5, align='center', color=get_color_str("primary"))
-        
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(labels, color=text_color)
-        ax.xaxis_date()
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax.tick_params(axis='x', colors=text_color)
-        ax.spines['bottom'].set_color(text_color)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.grid(True, axis='x', linestyle='--', alpha=0.3)
-
-        plt.tight_layout()
-
-        self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
\ No newline at end of file
+        self.chart.set_rows(gantt_rows(self.dm.df_data))
+        self._render()
+
+    def _page_size(self):
+        """차트 높이에 들어가는 행 수"""
+        return max(5, self.canvas.get_tk_widget().winfo_height() // self.ROW_HEIGHT)
+
+    def _render(self):
+        page = self._page_size()
+        self.offset = self.chart.show(self.offset, page, get_color_str("primary"),
+                                      get_color_str("bg_dark"), get_color_str("text"))
+        count = self.chart.row_count
+        if count: self.scrollbar.set(self.offset / count, min(1.0, (self.offset + page) / count))
+        else: self.scrollbar.set(0.0, 1.0)
+        self.canvas.draw_idle()
+
+    def _scroll_by(self, rows):
+        self.offset += rows
+        self._render()
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self.chart.row_count)
+            self._render()
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._page_size() if args[2] == "pages" else 1)
+            self._scroll_by(step)
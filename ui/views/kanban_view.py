@@ -1,13 +1,86 @@
 import tkinter as tk
+from tkinter import messagebox
 
 import customtkinter as ctk
 import pandas as pd
 
 # [변경] 경로 수정
 from src.styles import COLORS, FONT_FAMILY, FONTS
+from ui.widgets.virtual_tree import display_rollup
+
+# 납품/입금 컬럼으로 모으는 진행 상태
+PROCESSING_STATUSES = ["납품완료/입금대기", "납품대기/입금완료", "납품대기"]
+
+
+def board_rows(summary, columns):
+    """
+    관리번호별 요약에서 칸반 카드 목록을 만듭니다. (관리번호 순)
+    column: 카드가 들어갈 컬럼 (대표상태가 컬럼명과 같거나, 진행 상태면 "납품/입금")
+    컬럼에 해당하지 않는 건(취소/보류 등)은 제외합니다.
+    """
+    summary = display_rollup(summary.sort_index())
+    status = summary["대표상태"].astype(str)
+    target = status.where(status.isin(list(columns)))
+    processing = status.str.contains("|".join(PROCESSING_STATUSES), regex=True)
+    target = target.mask(target.isna() & processing, "납품/입금")
+    amounts = summary["합계금액합계"] if "합계금액합계" in summary.columns else pd.Series(0, index=summary.index)
+    rows = pd.DataFrame({
+        "column": target, "업체명": summary["업체명"].astype(str), "모델명": summary["모델명"].astype(str),
+        "합계금액": amounts, "상태": status, "품목수": summary["품목수"],
+    }, index=summary.index)
+    return rows[target.notna()]
+
+
+class KanbanCard(ctk.CTkFrame):
+    """
+    칸반 카드 위젯. 컬럼별로 재사용하며 show()로 다른 건의 내용을 표시합니다.
+    이벤트 핸들러는 현재 표시 중인 건(self.mgmt_no)을 참조하므로 다시 바인딩하지 않습니다.
+    """
+
+    def __init__(self, parent, view, column):
+        super().__init__(parent, fg_color=COLORS["bg_medium"], corner_radius=6)
+        self.column = column
+        self.mgmt_no = None
+        self.status = None
+        self.drag_text = ""
+        self.values = None
+
+        self.lbl_client = ctk.CTkLabel(self, text="", font=(FONT_FAMILY, 11, "bold"), text_color=COLORS["primary"])
+        self.lbl_client.pack(anchor="w", padx=8, pady=(5,0))
+        self.lbl_model = ctk.CTkLabel(self, text="", font=(FONT_FAMILY, 11))
+        self.lbl_model.pack(anchor="w", padx=8)
+        self.lbl_amount = ctk.CTkLabel(self, text="", font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"])
+        self.lbl_amount.pack(anchor="e", padx=8, pady=(0,5))
+
+        for w in [self] + self.winfo_children():
+            w.bind("<Button-1>", lambda e: view.start_drag(e, self.mgmt_no, self.column, self.drag_text, self))
+            w.bind("<B1-Motion>", view.do_drag)
+            w.bind("<ButtonRelease-1>", view.stop_drag)
+            w.bind("<Double-1>", lambda e: view._on_card_double_click(self.mgmt_no, self.status))
+
+    def show(self, mgmt_no, client, model, amount, status, item_count):
+        """내용이 바뀐 경우에만 라벨을 갱신합니다."""
+        values = (mgmt_no, client, model, amount, status, item_count)
+        if values == self.values: return False
+        self.mgmt_no, self.status = mgmt_no, status
+
+        try: amt_str = f"{float(amount):,.0f}"
+        except: amt_str = str(amount)
+        count_str = f" ({item_count} items)" if item_count > 1 else ""
+        self.drag_text = f"[{mgmt_no}] {client}{count_str}"
+
+        old = self.values or (None,) * 6
+        if client != old[1]: self.lbl_client.configure(text=client)
+        if model != old[2]: self.lbl_model.configure(text=model)
+        if amount != old[3]: self.lbl_amount.configure(text=f"₩ {amt_str}")
+        self.values = values
+        return True
 
 
 class KanbanView(ctk.CTkFrame):
+    # 컬럼별로 처음 표시하는 카드 수 ("더 보기"를 누를 때마다 이만큼 추가)
+    PAGE_SIZE = 50
+
     def __init__(self, parent, data_manager, popup_manager):
         super().__init__(parent, fg_color="transparent")
         self.dm = data_manager
@@ -22,6 +95,7 @@ class KanbanView(ctk.CTkFrame):
         }
         
         self.column_frames = {}
+        self._init_pool()
         self.drag_data = {"item": None, "mgmt_no": None, "text": None, "window": None, "start_status": None}
         self.drag_started = False
         self.click_timer = None
@@ -55,87 +129,83 @@ class KanbanView(ctk.CTkFrame):
             ctk.CTkLabel(header, text=status, font=FONTS["header"]).pack(side="left")
             count_badge = ctk.CTkLabel(header, text="0", width=24, height=24, fg_color=COLORS["bg_medium"], corner_radius=12)
             count_badge.pack(side="right")
+            # "더 보기" 버튼 자리 (스크롤 영역보다 먼저 배치해야 공간이 확보됨)
+            footer = ctk.CTkFrame(col_container, height=1, fg_color="transparent")
+            footer.pack(side="bottom", fill="x")
+            more_btn = ctk.CTkButton(footer, text="", height=28, command=lambda s=status: self.show_more(s),
+                                     fg_color=COLORS["bg_medium"], hover_color=COLORS["bg_light"], text_color=COLORS["text"])
             scroll = ctk.CTkScrollableFrame(col_container, fg_color="transparent")
             scroll.pack(fill="both", expand=True, padx=5, pady=5)
-            self.column_frames[status] = {"frame": scroll, "badge": count_badge}
+            self.column_frames[status] = {"frame": scroll, "badge": count_badge, "more": more_btn}
+
+    def _init_pool(self):
+        self.cards = {status: {} for status in self.columns}       # 컬럼 -> {관리번호: 표시 중인 카드}
+        self.free_cards = {status: [] for status in self.columns}  # 컬럼 -> 숨겨둔 재사용 카드
+        self.packed = {status: [] for status in self.columns}      # 컬럼 -> 화면 순서대로의 관리번호
+        self.limits = {status: self.PAGE_SIZE for status in self.columns}
+        self._rendered = None
 
     def refresh_data(self):
         df = self.dm.df_data
         if df.empty: return
+        if "관리번호" not in df.columns or "업체명" not in df.columns: return
+
+        # 요약이 바뀌지 않았으면(뷰 전환 등) 다시 그리지 않음
+        summary = self.dm.get_order_summary()
+        state = (summary, dict(self.limits))
+        if self._rendered is not None and self._rendered[0] is state[0] and self._rendered[1] == state[1]:
+            return
+        self._rendered = state
+
+        rows = board_rows(summary, self.columns)
         for status in self.column_frames:
-            for w in self.column_frames[status]["frame"].winfo_children(): w.destroy()
-            self.column_frames[status]["badge"].configure(text="0")
-            
-        processing_statuses = ["납품완료/입금대기", "납품대기/입금완료", "납품대기"]
-        
-        # [변경] 관리번호 및 업체명 기준으로 그룹화
-        if "관리번호" in df.columns and "업체명" in df.columns:
-            grouped = df.groupby(["관리번호", "업체명"])
-            
-            for (mgmt_no, client_name), group in grouped:
-                # 대표 상태 결정 (빈도수 기준)
-                statuses = group["Status"].tolist()
-                main_status = max(set(statuses), key=statuses.count)
-                
-                target_col = None
-                if main_status in self.columns: target_col = main_status
-                else:
-                    for ps in processing_statuses:
-                        if ps in main_status: target_col = "납품/입금"; break
-                
-                if target_col and target_col in self.column_frames:
-                    # 카드 데이터 구성
-                    try: total_amt = group["합계금액"].sum()
-                    except: total_amt = 0
-                    
-                    item_count = len(group)
-                    first_model = group.iloc[0].get("모델명", "")
-                    
-                    model_display = first_model
-                    if item_count > 1:
-                        model_display = f"{first_model} 외 {item_count-1}건"
-                        
-                    card_data = {
-                        "mgmt_no": mgmt_no,
-                        "client_name": client_name,
-                        "model": model_display,
-                        "total_amt": total_amt,
-                        "status": main_status,
-                        "item_count": item_count
-                    }
-                    self.create_card(target_col, card_data)
-        
-        for status in self.column_frames:
-            cnt = len(self.column_frames[status]["frame"].winfo_children())
-            self.column_frames[status]["badge"].configure(text=str(cnt))
+            self._sync_column(status, rows[rows["column"] == status])
 
-    def create_card(self, col_name, data):
-        parent = self.column_frames[col_name]["frame"]
-        card = ctk.CTkFrame(parent, fg_color=COLORS["bg_medium"], corner_radius=6)
-        card.pack(fill="x", pady=4, padx=2)
-        
-        comp = data["client_name"]
-        model = data["model"]
-        amt = data["total_amt"]
-        
-        try: amt_str = f"{float(amt):,.0f}"
-        except: amt_str = str(amt)
-        
-        ctk.CTkLabel(card, text=comp, font=(FONT_FAMILY, 11, "bold"), text_color=COLORS["primary"]).pack(anchor="w", padx=8, pady=(5,0))
-        ctk.CTkLabel(card, text=model, font=(FONT_FAMILY, 11)).pack(anchor="w", padx=8)
-        ctk.CTkLabel(card, text=f"₩ {amt_str}", font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"]).pack(anchor="e", padx=8, pady=(0,5))
-        
-        mgmt_no = data["mgmt_no"]
-        status = data["status"]
-        count_str = f" ({data['item_count']} items)" if data['item_count'] > 1 else ""
-        drag_text = f"[{mgmt_no}] {comp}{count_str}"
-        
-        for w in [card] + card.winfo_children():
-            w.bind("<Button-1>", lambda e, r=mgmt_no, s=col_name, t=drag_text, wi=card: self.start_drag(e, r, s, t, wi))
-            w.bind("<B1-Motion>", self.do_drag)
-            w.bind("<ButtonRelease-1>", self.stop_drag)
-            
-            w.bind("<Double-1>", lambda e, r=mgmt_no, s=status: self._on_card_double_click(r, s))
+    def show_more(self, status):
+        self.limits[status] += self.PAGE_SIZE
+        self.refresh_data()
+
+    def _new_card(self, status):
+        return KanbanCard(self.column_frames[status]["frame"], self, status)
+
+    def _sync_column(self, status, rows):
+        """
+        컬럼의 카드를 rows(관리번호 순) 앞쪽 limit건에 맞춥니다.
+        이미 표시 중인 건은 카드를 그대로 두고 내용이 바뀐 경우만 갱신하며,
+        빠진 건의 카드는 숨겨 두었다가 새로 들어온 건에 재사용합니다.
+        """
+        widgets = self.column_frames[status]
+        cards, free = self.cards[status], self.free_cards[status]
+        visible = rows.iloc[:self.limits[status]]
+        wanted = list(visible.index)
+
+        for mgmt_no in set(cards) - set(wanted):
+            card = cards.pop(mgmt_no)
+            card.pack_forget()
+            free.append(card)
+
+        for mgmt_no, client, model, amount, state, count in zip(
+                wanted, visible["업체명"], visible["모델명"], visible["합계금액"], visible["상태"], visible["품목수"]):
+            card = cards.get(mgmt_no)
+            if card is None:
+                card = cards[mgmt_no] = free.pop() if free else self._new_card(status)
+            card.show(mgmt_no, client, model, amount, state, int(count))
+
+        # 화면 순서: 앞부분이 같으면 달라진 뒤쪽만 다시 배치
+        packed = [m for m in self.packed[status] if m in cards]
+        keep = 0
+        while keep < min(len(packed), len(wanted)) and packed[keep] == wanted[keep]: keep += 1
+        for mgmt_no in packed[keep:]: cards[mgmt_no].pack_forget()
+        for mgmt_no in wanted[keep:]: cards[mgmt_no].pack(fill="x", pady=4, padx=2)
+        self.packed[status] = wanted
+
+        widgets["badge"].configure(text=str(len(rows)))
+        remaining = len(rows) - len(wanted)
+        if remaining > 0:
+            widgets["more"].configure(text=f"더 보기 ({remaining}건 남음)")
+            widgets["more"].pack(fill="x", padx=5, pady=(0, 5))
+        else:
+            widgets["more"].pack_forget()
 
     def _on_card_double_click(self, mgmt_no, status):
         if status in ["완료", "취소", "보류"]:
@@ -212,9 +282,12 @@ class KanbanView(ctk.CTkFrame):
                         return True, ""
                     return False, "데이터 없음"
 
-                success, _ = self.dm._execute_transaction(update_logic)
-                if success:
-                    self.refresh_data()
+                # 저장은 백그라운드에서, 끝나면 UI 스레드에서 화면 갱신
+                def on_saved(result):
+                    success, msg = result
+                    if success: self.refresh_data()
+                    else: messagebox.showerror("오류", f"상태 변경 실패: {msg}")
+                self.dm.execute_transaction_async(update_logic, callback=on_saved)
         
         self.drag_started = False
 
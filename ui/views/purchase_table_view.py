@@ -2,11 +2,13 @@ import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 import customtkinter as ctk
+import numpy as np
 import pandas as pd
 from tkinter import messagebox
 
 from src.styles import COLORS, FONT_FAMILY, FONTS
 from ui.components.context_menu import ContextMenu
+from ui.widgets.virtual_tree import VirtualTreeview, format_number, group_rows, row_keys, sort_positions
 
 # Dropdown 클래스는 필요 시 공통 모듈로 분리 권장 (여기서는 포함 유지)
 class MultiSelectDropdown(ctk.CTkFrame):
@@ -201,7 +203,9 @@ class PurchaseTableView(ctk.CTkFrame):
         table_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         columns = ("관리번호", "입고상태", "지급상태", "업체명", "모델명", "수량", "공급가액", "발주일", "입고예정일", "입고일")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended")
+        self.table = VirtualTreeview(table_frame, columns=columns, selectmode="extended",
+                                     formats={"수량": format_number, "공급가액": format_number})
+        self.tree = self.table.tree
         
         col_widths = {
             "관리번호": 100, "입고상태": 70, "지급상태": 70, "업체명": 120, "모델명": 150, 
@@ -213,12 +217,8 @@ class PurchaseTableView(ctk.CTkFrame):
             self.tree.column(col, width=col_widths.get(col, 100), anchor="center" if col in ["관리번호","업체명","모델명", "입고상태", "지급상태", "수량", "발주일", "입고예정일", "입고일"] else "w")
             if col == "공급가액":
                 self.tree.column(col, anchor="e")
-            
-        scrollbar = ctk.CTkScrollbar(table_frame, orientation="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+
+        self.table.pack(fill="both", expand=True)
         
         self.tree.bind("<Double-1>", self.on_double_click)
         self.tree.bind("<Button-3>", self.on_right_click)
@@ -239,108 +239,58 @@ class PurchaseTableView(ctk.CTkFrame):
         self.refresh_data()
 
     def refresh_data(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
         # [중요] df_purchase 데이터 사용
         df = self.dm.df_purchase
-        if df is None or df.empty: return
+        columns = list(self.tree["columns"])
+        if df is None or df.empty:
+            self.table.set_rows(np.empty((0, len(columns)), dtype=object))
+            return
         
         selected_recv = self.filter_receiving.get_selected()
         selected_pay = self.filter_payment.get_selected()
         search_text = self.search_entry.get().lower().strip()
         view_mode = self.view_mode_var.get()
         
-        filtered_rows = []
-        
-        for _, row in df.iterrows():
-            recv_status = str(row.get("입고상태", "미입고")).strip()
-            pay_status = str(row.get("지급상태", "미지급")).strip()
-            
-            # 기존 Status 호환성 (데이터가 비어있을 경우)
-            if pd.isna(recv_status) or recv_status == "nan": recv_status = "미입고"
-            if pd.isna(pay_status) or pay_status == "nan": pay_status = "미지급"
+        # 상태 정규화 (기존 데이터에 상태가 비어있을 경우 기본값)
+        recv_status = self._normalize_status(df, "입고상태", "미입고")
+        pay_status = self._normalize_status(df, "지급상태", "미지급")
 
-            # 필터링
-            if recv_status not in selected_recv and "All" not in selected_recv:
-                if not (len(selected_recv) == len(self.receiving_statuses)):
-                     if recv_status not in selected_recv: continue
+        # 필터링 (모든 상태 선택 시 필터 없음)
+        mask = np.ones(len(df), dtype=bool)
+        if len(selected_recv) != len(self.receiving_statuses):
+            mask &= recv_status.isin(selected_recv).to_numpy()
+        if len(selected_pay) != len(self.payment_statuses):
+            mask &= pay_status.isin(selected_pay).to_numpy()
 
-            if pay_status not in selected_pay and "All" not in selected_pay:
-                if not (len(selected_pay) == len(self.payment_statuses)):
-                     if pay_status not in selected_pay: continue
+        if search_text:
+            found = np.zeros(len(df), dtype=bool)
+            for col in ["관리번호", "업체명", "모델명"]:
+                if col in df.columns:
+                    found |= df[col].astype(str).str.lower().str.contains(search_text, regex=False).to_numpy()
+            mask &= found
 
-            if search_text:
-                mgmt_no = str(row.get("관리번호", "")).lower()
-                client = str(row.get("업체명", "")).lower()
-                model = str(row.get("모델명", "")).lower()
-                
-                if (search_text not in mgmt_no and 
-                    search_text not in client and 
-                    search_text not in model):
-                    continue
-            
-            # 행 데이터에 상태 정규화하여 저장 (표시용)
-            row["입고상태"] = recv_status
-            row["지급상태"] = pay_status
-            filtered_rows.append(row)
+        # 행 데이터에 상태 정규화하여 저장 (표시용)
+        filtered = df[mask].copy()
+        filtered["입고상태"] = recv_status[mask].to_numpy()
+        filtered["지급상태"] = pay_status[mask].to_numpy()
 
+        # 행 식별자(관리번호 + 품목 순번)로 갱신 전후의 선택/스크롤 위치를 유지
         if view_mode == "발주별":
-            grouped_data = {}
-            for row in filtered_rows:
-                mgmt_no = row.get("관리번호", "")
-                if mgmt_no not in grouped_data:
-                    grouped_data[mgmt_no] = []
-                grouped_data[mgmt_no].append(row)
-            
-            aggregated_rows = []
-            for mgmt_no, items in grouped_data.items():
-                if not items: continue
-                base_item = items[0]
-                new_row = base_item.copy()
-                
-                if len(items) > 1:
-                    first_model = str(base_item.get("모델명", ""))
-                    new_row["모델명"] = f"{first_model} 외 {len(items)-1}건"
-                    try:
-                        total_qty = sum(float(str(item.get("수량", "0")).replace(",", "") or 0) for item in items)
-                        new_row["수량"] = f"{int(total_qty):,}"
-                        
-                        total_price = sum(float(str(item.get("공급가액", "0")).replace(",", "") or 0) for item in items)
-                        new_row["공급가액"] = f"{total_price:,.0f}"
-                    except: pass
-                
-                aggregated_rows.append(new_row)
-            filtered_rows = aggregated_rows
+            filtered = group_rows(filtered)
+            keys = filtered["관리번호"].astype(str).to_numpy(dtype=object)
+        else:
+            keys = row_keys(df)[mask]
 
-        def sort_key(x):
-            val = x.get(self.sort_col, "")
-            if self.sort_col in ["수량", "공급가액"]:
-                try: return float(str(val).replace(",", ""))
-                except: return 0
-            if "일" in self.sort_col:
-                date_str = str(val).strip()
-                if not date_str or date_str == "-":
-                    return "9999-99-99" if not self.sort_reverse else "0000-00-00"
-                return date_str
-            return str(val)
-            
-        filtered_rows.sort(key=sort_key, reverse=self.sort_reverse)
-        
-        for row in filtered_rows:
-            values = (
-                row.get("관리번호", ""),
-                row.get("입고상태", ""),
-                row.get("지급상태", ""),
-                row.get("업체명", ""),
-                row.get("모델명", ""),
-                row.get("수량", ""),
-                row.get("공급가액", ""),
-                row.get("발주일", ""),
-                row.get("입고예정일", ""),
-                row.get("입고일", "")
-            )
-            self.tree.insert("", "end", values=values)
+        # 결과는 값 배열 + 정렬 순서로만 넘기고, 화면에 보이는 행만 Tk 항목으로 만듦
+        values = filtered.reindex(columns=columns, fill_value="").to_numpy(dtype=object)
+        self.table.set_rows(values, sort_positions(filtered, self.sort_col, self.sort_reverse), keys)
+
+    @staticmethod
+    def _normalize_status(df, col, default):
+        if col not in df.columns:
+            return pd.Series(default, index=df.index)
+        status = df[col].astype(str).str.strip()
+        return status.mask(status == "nan", default)
 
     def on_double_click(self, event):
         item = self.tree.selection()
@@ -355,7 +305,7 @@ class PurchaseTableView(ctk.CTkFrame):
         item = self.tree.identify_row(event.y)
         if not item: return
         
-        self.tree.selection_set(item)
+        self.table.select_item(item)
         values = self.tree.item(item, "values")
         mgmt_no = values[0]
         
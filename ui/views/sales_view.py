@@ -44,16 +44,13 @@ class SalesView(ctk.CTkFrame):
         self.table_view.tree.bind("<Button-3>", self.on_right_click)
         
     def get_selected_mgmt_nos(self):
-        selection = self.table_view.tree.selection()
+        # 스크롤로 화면 밖에 있는 선택 행도 포함
+        selection = self.table_view.table.selected_values()
         if not selection:
             messagebox.showwarning("경고", "항목을 선택해주세요.")
             return []
         
-        mgmt_nos = []
-        for item in selection:
-            values = self.table_view.tree.item(item, "values")
-            mgmt_nos.append(values[0]) # Assuming first column is mgmt_no
-        return mgmt_nos
+        return [values[0] for values in selection] # Assuming first column is mgmt_no
 
     def on_quote(self):
         self.pm.open_quote_popup()
@@ -88,7 +85,7 @@ class SalesView(ctk.CTkFrame):
         if not item: return
         
         # Select the row
-        self.table_view.tree.selection_set(item)
+        self.table_view.table.select_item(item)
         
         # Get item values
         values = self.table_view.tree.item(item, "values")
@@ -150,14 +147,21 @@ class SalesView(ctk.CTkFrame):
         else:
             messagebox.showerror("오류", f"삭제 실패: {msg}")
 
-    def confirm_order(self, mgmt_no):
-        def on_confirm(po_no):
-            success, msg = self.dm.confirm_order(mgmt_no, po_no)
+    def _run_in_background(self, func, *args, success_msg="", error_prefix="", **kwargs):
+        """저장 작업을 백그라운드에서 실행하고, 끝나면 결과를 알리고 화면을 갱신합니다."""
+        def on_done(result):
+            success, msg = result
             if success:
-                messagebox.showinfo("성공", "주문이 확정되었습니다.")
+                messagebox.showinfo("성공", success_msg)
                 self.refresh_data()
             else:
-                messagebox.showerror("오류", f"주문 확정 실패: {msg}")
+                messagebox.showerror("오류", f"{error_prefix}: {msg}")
+        self.dm.run_async(func, *args, callback=on_done, **kwargs)
+
+    def confirm_order(self, mgmt_no):
+        def on_confirm(po_no):
+            self._run_in_background(self.dm.confirm_order, mgmt_no, po_no,
+                                    success_msg="주문이 확정되었습니다.", error_prefix="주문 확정 실패")
                 
         self.pm.open_mini_order_popup(mgmt_no, on_confirm)
 
@@ -165,50 +169,47 @@ class SalesView(ctk.CTkFrame):
         if not messagebox.askyesno("생산 시작", "주문 상태를 '생산중'으로 변경하고 생산 요청을 진행하시겠습니까?"):
             return
 
-        # 1. 상태 업데이트
-        success, msg = self.dm.update_order_status(mgmt_no, "생산중")
-        if not success:
-            messagebox.showerror("오류", f"상태 변경 실패: {msg}")
-            return
+        def task():
+            # 1. 상태 업데이트
+            success, msg = self.dm.update_order_status(mgmt_no, "생산중")
+            if not success:
+                return "status_failed", msg
 
-        # 2. 변경된 데이터 가져오기
-        df = self.dm.df_data
-        target_rows = df[df["관리번호"] == mgmt_no].to_dict("records")
-        
-        if not target_rows:
-            messagebox.showwarning("경고", "데이터를 찾을 수 없어 생산 요청 파일 생성을 건너뜁니다.")
-            self.refresh_data()
-            return
+            # 2. 변경된 데이터 가져오기
+            target_rows = self.dm.get_rows("data", mgmt_no).to_dict("records")
+            if not target_rows:
+                return "no_rows", ""
 
-        # 3. 생산 요청 파일 내보내기
-        export_success, export_msg = self.dm.export_to_production_request(target_rows)
+            # 3. 생산 요청 파일 내보내기
+            export_success, export_msg = self.dm.export_to_production_request(target_rows)
+            return ("exported" if export_success else "export_failed"), export_msg
 
-        if export_success:
-            messagebox.showinfo("성공", f"생산 요청이 완료되었습니다.\n{export_msg}")
-        else:
-            messagebox.showwarning("주의", f"상태는 변경되었으나 생산 요청 파일 업데이트에 실패했습니다.\n{export_msg}")
-            
-        self.refresh_data()
+        def on_done(result):
+            stage, msg = result
+            if stage in ("status_failed", False): # False: 작업 중 예외 발생
+                messagebox.showerror("오류", f"상태 변경 실패: {msg}")
+                return
+            if stage == "no_rows":
+                messagebox.showwarning("경고", "데이터를 찾을 수 없어 생산 요청 파일 생성을 건너뜁니다.")
+            elif stage == "exported":
+                messagebox.showinfo("성공", f"생산 요청이 완료되었습니다.\n{msg}")
+            else:
+                messagebox.showwarning("주의", f"상태는 변경되었으나 생산 요청 파일 업데이트에 실패했습니다.\n{msg}")
+            self.refresh_data()
+
+        self.dm.run_async(task, callback=on_done)
 
     def on_hold_item(self, mgmt_no):
         def callback(reason):
-            success, msg = self.dm.update_order_status(mgmt_no, "보류", updates={"보류사유": reason})
-            if success:
-                messagebox.showinfo("성공", "상태가 '보류'로 변경되었습니다.")
-                self.refresh_data()
-            else:
-                messagebox.showerror("오류", f"상태 변경 실패: {msg}")
+            self._run_in_background(self.dm.update_order_status, mgmt_no, "보류", updates={"보류사유": reason},
+                                    success_msg="상태가 '보류'로 변경되었습니다.", error_prefix="상태 변경 실패")
                 
         self.pm.open_reason_popup("보류 사유 입력", callback)
 
     def on_cancel_item(self, mgmt_no):
         def callback(reason):
-            success, msg = self.dm.update_order_status(mgmt_no, "취소", updates={"취소사유": reason})
-            if success:
-                messagebox.showinfo("성공", "상태가 '취소'로 변경되었습니다.")
-                self.refresh_data()
-            else:
-                messagebox.showerror("오류", f"상태 변경 실패: {msg}")
+            self._run_in_background(self.dm.update_order_status, mgmt_no, "취소", updates={"취소사유": reason},
+                                    success_msg="상태가 '취소'로 변경되었습니다.", error_prefix="상태 변경 실패")
                 
         self.pm.open_reason_popup("취소 사유 입력", callback)
 
@@ -216,9 +217,5 @@ class SalesView(ctk.CTkFrame):
         if not messagebox.askyesno("주문 재개", "해당 항목의 상태를 '주문'으로 변경하시겠습니까?"):
             return
 
-        success, msg = self.dm.update_order_status(mgmt_no, "주문")
-        if success:
-            messagebox.showinfo("성공", "주문이 재개되었습니다.")
-            self.refresh_data()
-        else:
-            messagebox.showerror("오류", f"주문 재개 실패: {msg}")
+        self._run_in_background(self.dm.update_order_status, mgmt_no, "주문",
+                                success_msg="주문이 재개되었습니다.", error_prefix="주문 재개 실패")
@@ -1,10 +1,14 @@
+import time
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 import customtkinter as ctk
+import numpy as np
 import pandas as pd
 
+from managers.data.search_index import IncrementalSearch
 from src.styles import COLORS, FONT_FAMILY, FONTS
+from ui.widgets.virtual_tree import VirtualTreeview, format_number, display_rollup, row_keys, sort_positions
 
 from tkinter import messagebox
 
@@ -98,6 +102,13 @@ class MultiSelectDropdown(ctk.CTkFrame):
 
 
 class TableView(ctk.CTkFrame):
+    # 입력을 멈춘 뒤 검색을 시작하기까지의 대기 시간 (ms)
+    SEARCH_DELAY_MS = 250
+    # 검색 결과를 한 번에 찾는 행 수 (첫 묶음 결과는 바로 표시하고 나머지는 after_idle로 이어서 처리)
+    CHUNK_ROWS = 500
+    # 찾는 도중 중간 결과를 다시 표시하는 최소 간격 (초, 마지막 결과는 항상 표시)
+    RENDER_INTERVAL = 0.15
+
     def __init__(self, parent, data_manager, popup_manager):
         super().__init__(parent, fg_color="transparent")
         self.dm = data_manager
@@ -111,10 +122,24 @@ class TableView(ctk.CTkFrame):
         
         self.sort_col = "출고예정일"
         self.sort_reverse = False
+
+        self.search = IncrementalSearch(self.dm.search_index)
+        self._search_timer = None
+        self._stream_job = None
+        self._keys_cache = None
         
         self.create_widgets()
         self.refresh_data()
 
+    def destroy(self):
+        self._cancel_jobs()
+        super().destroy()
+
+    def _cancel_jobs(self):
+        for job in (self._search_timer, self._stream_job):
+            if job: self.after_cancel(job)
+        self._search_timer = self._stream_job = None
+
     def create_widgets(self):
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
@@ -149,9 +174,10 @@ class TableView(ctk.CTkFrame):
         ctk.CTkButton(header_frame, text="검색", command=self.refresh_data, width=60, 
                       fg_color=COLORS["primary"], hover_color=COLORS["primary_hover"], font=FONTS["main"]).pack(side="right", padx=5)
         
-        self.search_entry = ctk.CTkEntry(header_frame, placeholder_text="검색 (관리번호, 업체명, 모델명)", width=250, font=FONTS["main"])
+        self.search_entry = ctk.CTkEntry(header_frame, placeholder_text="검색 (관리번호, 업체명, 모델명, Description)", width=250, font=FONTS["main"])
         self.search_entry.pack(side="right", padx=5)
         self.search_entry.bind("<Return>", lambda e: self.refresh_data())
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
 
         style = ttk.Style()
         style.theme_use("default")
@@ -180,7 +206,9 @@ class TableView(ctk.CTkFrame):
         table_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         columns = ("관리번호", "Status", "Delivery Status", "Payment Status", "업체명", "모델명", "수량", "공급가액", "수주일", "출고예정일", "출고일")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended")
+        self.table = VirtualTreeview(table_frame, columns=columns, selectmode="extended",
+                                     formats={"수량": format_number, "공급가액": format_number})
+        self.tree = self.table.tree
         
         col_widths = {
             "관리번호": 100, "Status": 60, "Delivery Status": 60, "Payment Status": 60, 
@@ -201,12 +229,8 @@ class TableView(ctk.CTkFrame):
             self.tree.column(col, width=col_widths.get(col, 100), anchor="center" if col in ["관리번호","업체명","모델명", "Status", "Delivery Status", "Payment Status", "수량", "수주일", "출고예정일", "출고일"] else "w")
             if col == "공급가액":
                 self.tree.column(col, anchor="e")
-            
-        scrollbar = ctk.CTkScrollbar(table_frame, orientation="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+
+        self.table.pack(fill="both", expand=True)
         
         self.tree.bind("<Double-1>", self.on_double_click)
 
@@ -226,104 +250,81 @@ class TableView(ctk.CTkFrame):
         self.refresh_data()
 
     def reload_and_refresh(self):
-        """파일에서 데이터를 다시 로드하고 화면을 갱신합니다."""
-        success, msg = self.dm.load_data()
-        if success:
-            self.refresh_data()
-            print("Data reloaded successfully")
-        else:
-            messagebox.showerror("데이터 로드 실패", msg)
+        """파일에서 데이터를 다시 로드하고 화면을 갱신합니다. (백그라운드 로드)"""
+        def on_loaded(result):
+            success, msg = result
+            if success:
+                self.refresh_data()
+                print("Data reloaded successfully")
+            else:
+                messagebox.showerror("데이터 로드 실패", msg)
+        self.dm.load_data_async(callback=on_loaded)
+
+    def _on_search_key(self, event):
+        """입력이 SEARCH_DELAY_MS 동안 멈추면 검색 (Enter는 즉시 검색)"""
+        if event.keysym == "Return": return
+        if self._search_timer: self.after_cancel(self._search_timer)
+        self._search_timer = self.after(self.SEARCH_DELAY_MS, self.refresh_data)
 
     def refresh_data(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+        self._cancel_jobs()
         df = self.dm.df_data
-        if df.empty: return
+        columns = list(self.tree["columns"])
+        if df.empty:
+            self.table.set_rows(np.empty((0, len(columns)), dtype=object))
+            return
         
         selected_statuses = self.status_filter.get_selected()
-        search_text = self.search_entry.get().lower().strip()
-        view_mode = self.view_mode_var.get()
-        
-        filtered_rows = []
+        search_text = self.search_entry.get()
         
-        for _, row in df.iterrows():
-            status = str(row.get("Status", "")).strip()
-            if status not in selected_statuses:
-                continue
-                
-            if search_text:
-                mgmt_no = str(row.get("관리번호", "")).lower()
-                client = str(row.get("업체명", "")).lower()
-                model = str(row.get("모델명", "")).lower()
-                
-                if (search_text not in mgmt_no and 
-                    search_text not in client and 
-                    search_text not in model):
-                    continue
-            
-            filtered_rows.append(row)
+        # 상태 필터는 벡터 연산, 검색어는 검색 인덱스로 처리
+        # 검색어가 직전 검색어에 글자를 덧붙인 것이면 직전 결과 안에서만 찾음
+        scope = tuple(selected_statuses)
+        base_rows = np.flatnonzero(df["Status"].astype(str).str.strip().isin(selected_statuses).to_numpy())
+        candidates = self.search.candidates(search_text, df, base_rows, scope)
+        self._stream(df, search_text, scope, candidates, [], 0, self._row_keys(df))
 
-        if view_mode == "주문별":
-            grouped_data = {}
-            for row in filtered_rows:
-                mgmt_no = row.get("관리번호", "")
-                if mgmt_no not in grouped_data:
-                    grouped_data[mgmt_no] = []
-                grouped_data[mgmt_no].append(row)
-            
-            aggregated_rows = []
-            for mgmt_no, items in grouped_data.items():
-                if not items: continue
-                
-                base_item = items[0]
-                new_row = base_item.copy()
-                
-                if len(items) > 1:
-                    first_model = str(base_item.get("모델명", ""))
-                    new_row["모델명"] = f"{first_model} 외 {len(items)-1}건"
-                    
-                    total_qty = 0
-                    for item in items:
-                        try:
-                            qty_val = str(item.get("수량", "0")).replace(",", "")
-                            total_qty += float(qty_val) if qty_val else 0
-                        except ValueError:
-                            pass
-                    new_row["수량"] = f"{int(total_qty):,}"
-                    
-                    total_price = 0.0
-                    for item in items:
-                        try:
-                            price_val = str(item.get("공급가액", "0")).replace(",", "")
-                            total_price += float(price_val) if price_val else 0
-                        except ValueError:
-                            pass
-                    new_row["공급가액"] = f"{total_price:,.0f}"
-                
-                aggregated_rows.append(new_row)
-            
-            filtered_rows = aggregated_rows
+    def _row_keys(self, df):
+        """행 식별자(관리번호 + 품목 순번). 갱신 전후의 선택/스크롤 위치 유지에 사용하며 시트가 바뀔 때만 다시 구함"""
+        cached = self._keys_cache
+        if cached is None or cached[0] is not df or cached[1] != len(df):
+            self._keys_cache = cached = (df, len(df), row_keys(df))
+        return cached[2]
 
-        def sort_key(x):
-            val = x.get(self.sort_col, "")
-            
-            if self.sort_col in ["수량", "공급가액"]:
-                try: return float(str(val).replace(",", ""))
-                except: return 0
-            
-            if "일" in self.sort_col or "Date" in self.sort_col:
-                date_str = str(val).strip()
-                if not date_str or date_str == "-":
-                    return "9999-99-99" if not self.sort_reverse else "0000-00-00"
-                return date_str
-            return str(val)
+    def _stream(self, df, search_text, scope, candidates, found, start, keys):
+        """
+        후보 행을 CHUNK_ROWS씩 검사하고 나머지는 after_idle로 이어서 처리.
+        첫 묶음의 결과는 바로 표시하고, 중간 결과는 RENDER_INTERVAL마다만 다시 표시합니다.
+        (묶음마다 누적 결과 전체를 다시 정렬하면 묶음 수에 비례해 느려짐)
+        """
+        self._stream_job = None
+        end = start + self.CHUNK_ROWS
+        found.append(self.search.match(search_text, df, candidates[start:end]))
 
-        filtered_rows.sort(key=sort_key, reverse=self.sort_reverse)
+        if end < len(candidates):
+            now = time.monotonic()
+            if start == 0 or now - self._rendered_at >= self.RENDER_INTERVAL:
+                self._show_rows(df, np.concatenate(found), keys)
+                self._rendered_at = now
+            self._stream_job = self.after_idle(self._stream, df, search_text, scope, candidates, found, end, keys)
+        else:
+            rows = np.concatenate(found)
+            self._show_rows(df, rows, keys)
+            self.search.commit(search_text, df, rows, scope)
+
+    def _show_rows(self, df, rows, keys):
+        columns = list(self.tree["columns"])
+        filtered = df.iloc[rows]
+        if self.view_mode_var.get() == "주문별":
+            # 조건에 맞는 품목이 있는 건을 관리번호별 요약 테이블에서 가져옴
+            filtered = display_rollup(self.dm.get_order_summary().loc[pd.unique(filtered["관리번호"])])
+            keys = filtered["관리번호"].astype(str).to_numpy(dtype=object)
+        else:
+            keys = keys[rows]
 
-        for row in filtered_rows:
-            values = [row.get(col, "") for col in self.tree["columns"]]
-            self.tree.insert("", "end", values=values)
+        # 결과는 값 배열 + 정렬 순서로만 넘기고, 화면에 보이는 행만 Tk 항목으로 만듦
+        values = filtered.reindex(columns=columns, fill_value="").to_numpy(dtype=object)
+        self.table.set_rows(values, sort_positions(filtered, self.sort_col, self.sort_reverse), keys)
 
     def on_double_click(self, event):
         item = self.tree.selection()
@@ -350,7 +351,7 @@ class TableView(ctk.CTkFrame):
             self.pm.open_complete_popup(mgmt_no)
             
         elif status in ["취소", "보류"]:
-            row_data = self.dm.df_data[self.dm.df_data["관리번호"] == mgmt_no]
+            row_data = self.dm.get_rows("data", mgmt_no)
             if not row_data.empty:
                 quote_date = str(row_data.iloc[0].get("견적일", "")).strip()
                 if quote_date and quote_date != "-" and quote_date != "nan":
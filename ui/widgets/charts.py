@@ -0,0 +1,135 @@
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+
+# 그래프 객체(막대, 글자)를 한 번 만들어 두고 값만 바꿔 다시 그리는 차트 모음.
+# 뷰는 Figure/FigureCanvasTkAgg를 하나씩만 만들고, 갱신 후 canvas.draw_idle()을 호출합니다.
+
+
+def _style_axes(ax, bg_color, text_color):
+    ax.figure.patch.set_facecolor(bg_color)
+    ax.set_facecolor(bg_color)
+    ax.tick_params(axis='x', colors=text_color)
+    ax.tick_params(axis='y', colors=text_color)
+    ax.spines['bottom'].set_color(text_color)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_visible(False)
+
+
+class PipelineChart:
+    """영업 단계별 건수 가로 막대 그래프 (단계 수만큼 막대를 미리 만들어 재사용)"""
+
+    def __init__(self, ax, stages):
+        self.ax = ax
+        self.stages = list(stages)
+        y_pos = range(len(self.stages))
+        self.bars = list(ax.barh(y_pos, [0] * len(self.stages), align='center', height=0.6))
+        self.texts = [ax.text(0, i, "", va='center', fontweight='bold') for i in y_pos]
+        ax.invert_yaxis()
+
+    def update(self, counts, colors, bg_color, text_color, font_family=None):
+        """
+        counts: 단계 -> 건수. 0건인 단계는 숨기고 나머지를 위에서부터 채웁니다.
+        표시할 단계가 없으면 False를 반환합니다.
+        """
+        shown = [(stage, counts.get(stage, 0)) for stage in self.stages if counts.get(stage, 0) > 0]
+        _style_axes(self.ax, bg_color, text_color)
+
+        for i, (bar, text) in enumerate(zip(self.bars, self.texts)):
+            visible = i < len(shown)
+            bar.set_visible(visible)
+            text.set_visible(visible)
+            if not visible: continue
+            stage, value = shown[i]
+            bar.set_y(i - bar.get_height() / 2)
+            bar.set_width(value)
+            bar.set_color(colors.get(stage, '#BDBDBD'))
+            text.set_position((value + 0.1, i))
+            text.set_text(str(value))
+            text.set_color(text_color)
+
+        self.ax.set_yticks(range(len(shown)))
+        self.ax.set_yticklabels([stage for stage, _ in shown], color=text_color, fontfamily=font_family)
+        self.ax.set_ylim(max(len(shown), 1) - 0.5, -0.5)
+        self.ax.set_xlim(0, max([value for _, value in shown], default=1) * 1.15)
+        return bool(shown)
+
+
+def gantt_rows(df):
+    """
+    Gantt 표시용 행 (시작일 순).
+    시작: 수주일(없으면 견적일), 종료: 출고예정일(없으면 시작+3일), 기간은 최소 1일.
+    완료/취소/보류 건과 시작일이 없는 행은 제외합니다.
+    """
+    columns = ["label", "start", "duration"]
+    if df.empty or "Status" not in df.columns:
+        return pd.DataFrame(columns=columns)
+
+    def dates(col):
+        if col not in df.columns: return pd.Series(pd.NaT, index=df.index)
+        return pd.to_datetime(df[col], errors='coerce', format='mixed')
+
+    start = dates('수주일').fillna(dates('견적일'))
+    end = dates('출고예정일')
+    mask = start.notna() & ~df['Status'].isin(['완료', '취소', '보류'])
+    start, end = start[mask], end[mask]
+    end = end.fillna(start + pd.Timedelta(days=3))
+
+    rows = pd.DataFrame({
+        "label": "[" + df.loc[mask, '업체명'].astype(str) + "] " + df.loc[mask, '모델명'].astype(str),
+        "start": start,
+        "duration": (end - start).dt.days.clip(lower=1),
+    })
+    return rows.sort_values(by='start', kind='stable').reset_index(drop=True)
+
+
+class GanttChart:
+    """
+    일정 막대 그래프. 전체 행은 배열로만 보관하고 화면에 보이는 구간(offset부터 count행)만
+    막대로 그립니다. 막대는 필요한 수만큼만 만들어 재사용합니다.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.bars = []
+        self.labels = np.empty(0, dtype=object)
+        self.starts = np.empty(0)
+        self.durations = np.empty(0)
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
+        ax.grid(True, axis='x', linestyle='--', alpha=0.3)
+
+    def set_rows(self, rows):
+        self.labels = rows["label"].to_numpy(dtype=object)
+        self.starts = mdates.date2num(rows["start"]) if len(rows) else np.empty(0)
+        self.durations = rows["duration"].to_numpy(dtype=float)
+
+    @property
+    def row_count(self):
+        return len(self.labels)
+
+    def show(self, offset, count, color, bg_color, text_color):
+        """offset번째 행부터 count행을 위에서부터 그립니다. 실제 시작 위치를 반환합니다."""
+        offset = max(0, min(offset, self.row_count - count))
+        end = min(offset + count, self.row_count)
+        starts, durations = self.starts[offset:end], self.durations[offset:end]
+        _style_axes(self.ax, bg_color, text_color)
+
+        while len(self.bars) < len(starts):
+            self.bars.extend(self.ax.barh([len(self.bars)], [0], height=0.5, align='center'))
+        for i, bar in enumerate(self.bars):
+            visible = i < len(starts)
+            bar.set_visible(visible)
+            if not visible: continue
+            bar.set_x(starts[i])
+            bar.set_width(durations[i])
+            bar.set_y(i - bar.get_height() / 2)
+            bar.set_color(color)
+
+        self.ax.set_yticks(range(len(starts)))
+        self.ax.set_yticklabels(self.labels[offset:end], color=text_color)
+        self.ax.set_ylim(max(count, 1) - 0.5, -0.5)
+        if len(starts):
+            self.ax.set_xlim(starts.min() - 1, (starts + durations).max() + 1)
+        return offset
@@ -0,0 +1,304 @@
+from tkinter import ttk
+import customtkinter as ctk
+import numpy as np
+
+from managers.data import schema
+from managers.data.order_summary import summarize_orders
+
+# 정렬 시 숫자로 비교하는 컬럼
+NUMERIC_SORT_COLS = ["수량", "공급가액"]
+
+
+def sort_positions(frame, col, reverse=False):
+    """
+    테이블 정렬 규칙에 따라 frame의 행 위치 배열을 반환합니다. (같은 값은 원래 순서 유지)
+    - 수량/공급가액: 쉼표를 뺀 숫자 (변환 실패 시 0)
+    - 날짜 컬럼("일"/"Date" 포함): 문자열, 빈 값/"-"는 항상 맨 뒤
+    - 그 외: 문자열
+    """
+    if col not in frame.columns:
+        return np.arange(len(frame))
+    values = frame[col].reset_index(drop=True)
+    if col in NUMERIC_SORT_COLS:
+        keys = schema.to_number(values).fillna(0)
+    elif "일" in col or "Date" in col:
+        keys = values.astype(str).str.strip()
+        keys = keys.mask(keys.isin(["", "-"]), "0000-00-00" if reverse else "9999-99-99")
+    else:
+        keys = values.astype(str)
+    return keys.sort_values(ascending=not reverse, kind="stable").index.to_numpy()
+
+
+def row_keys(frame, key="관리번호"):
+    """
+    행 식별자 배열 ("관리번호#품목순번").
+    필터와 무관하게 같은 행이 같은 키를 갖도록 전체 시트에서 구한 뒤 필요한 행만 골라 씁니다.
+    """
+    if key not in frame.columns:
+        return frame.index.astype(str).to_numpy(dtype=object)
+    mgmt_nos = frame[key].astype(str)
+    return (mgmt_nos + "#" + frame.groupby(mgmt_nos, sort=False).cumcount().astype(str)).to_numpy(dtype=object)
+
+
+def group_rows(frame, key="관리번호"):
+    """관리번호별로 묶은 화면용 행 (summarize_orders + display_rollup)"""
+    if frame.empty or key not in frame.columns:
+        return frame
+    return display_rollup(summarize_orders(frame, key))
+
+
+def display_rollup(summary):
+    """
+    관리번호별 요약 행을 목록 표시용으로 바꿉니다.
+    품목이 여러 개인 건은 모델명을 "첫 모델 외 n건"으로, 수량/공급가액을 합계로 표시합니다.
+    """
+    summary = summary.copy()
+    multi = (summary["품목수"] > 1).to_numpy()
+    if not multi.any():
+        return summary
+
+    if "모델명" in summary.columns:
+        more = (summary["품목수"] - 1).astype(str)
+        summary["모델명"] = summary["모델명"].astype(object).where(
+            ~multi, summary["모델명"].astype(str) + " 외 " + more + "건")
+    for col, total in (("수량", "수량합계"), ("공급가액", "공급가액합계")):
+        if col in summary.columns and total in summary.columns:
+            summary[col] = summary[col].astype(object).where(~multi, summary[total])
+    return summary
+
+
+def format_number(value):
+    """숫자 셀 표시 형식 (천 단위 쉼표). 숫자가 아니면 그대로 반환"""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool) and value == value:
+        return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}"
+    return value
+
+
+class VirtualTreeview(ctk.CTkFrame):
+    """
+    보이는 구간의 행만 Tk 항목으로 만드는 Treeview.
+    결과 전체는 값 배열(values)과 표시 순서(order) 인덱스 배열로만 보관하고,
+    화면 행 수 + BUFFER_ROWS개의 항목을 스크롤할 때마다 재사용합니다.
+    따라서 갱신 비용은 데이터 행 수가 아니라 화면 크기에 비례합니다.
+
+    컬럼/헤더 설정과 이벤트 바인딩은 기존처럼 .tree에 직접 합니다.
+    선택 상태는 Tk 항목이 아니라 결과 행 기준으로 기억하므로 스크롤해도 유지됩니다.
+    (수정키 없는 클릭은 화면 밖 선택까지 새로 지정하고, Ctrl/Shift 클릭만 기존 선택에 더함)
+    갱신 시에는 값이 바뀐 항목만 다시 쓰고, 행 식별자(keys)로 선택/스크롤 위치를 이어갑니다.
+    """
+
+    BUFFER_ROWS = 3
+
+    def __init__(self, parent, columns, formats=None, **tree_kwargs):
+        super().__init__(parent, fg_color="transparent")
+        # 컬럼명 -> 표시 형식 함수 (화면에 보이는 행에만 적용)
+        self._formats = [(i, func) for i, col in enumerate(columns) for name, func in (formats or {}).items() if name == col]
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", **tree_kwargs)
+        self.scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self._values = np.empty((0, len(columns)), dtype=object)
+        self._order = np.empty(0, dtype=np.int64)
+        self._keys = None
+        self._offset = 0
+        self._slots = []        # 재사용하는 Tk 항목 id (화면 위에서부터)
+        self._slot_values = []  # 각 항목에 현재 표시 중인 값
+        self._slot_rows = {}    # Tk 항목 id -> 결과 행 번호 (values 기준)
+        self._selected = set()  # 선택된 결과 행 번호
+        self._cursor = None     # 키보드 이동 기준 위치 (order 기준)
+        self._anchor = None     # Shift 범위 선택 기준 위치 (order 기준)
+        self._click = None      # 직전 클릭 (위치, Ctrl, Shift). 다음 <<TreeviewSelect>>에서 사용
+
+        self.tree.bind("<Configure>", lambda e: self._render())
+        self.tree.bind("<ButtonPress-1>", self._on_click, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "-page"), ("<Next>", "page"),
+                          ("<Home>", "home"), ("<End>", "end")):
+            self.tree.bind(key, lambda e, s=step: self._on_key(s))
+
+    # ---------------------------------------------------------
+    # 데이터
+    # ---------------------------------------------------------
+    def set_rows(self, values, order=None, keys=None):
+        """
+        표시할 결과를 지정합니다.
+        values: 행마다 tree 컬럼 순서의 값을 담은 2차원 배열
+        order: 표시 순서대로의 values 행 번호 배열 (생략 시 values 순서)
+        keys: values 행마다의 식별자 배열. 주면 갱신 전후로 같은 키의 행을 따라
+              선택과 스크롤 위치(맨 위 행)를 유지합니다. 없으면 선택을 해제합니다.
+        """
+        selected_keys, top_key, cursor_key = set(), None, None
+        if keys is not None and self._keys is not None:
+            selected_keys = {self._keys[row] for row in self._selected}
+            if self._offset < len(self._order):
+                top_key = self._keys[self._order[self._offset]]
+            if self._cursor is not None and self._cursor < len(self._order):
+                cursor_key = self._keys[self._order[self._cursor]]
+
+        self._values = values
+        self._order = np.arange(len(values)) if order is None else np.asarray(order)
+        self._keys = None if keys is None else np.asarray(keys, dtype=object)
+        self._selected = set()
+        self._cursor = self._anchor = None
+
+        if self._keys is not None:
+            if selected_keys:
+                self._selected = set(np.flatnonzero(np.isin(self._keys, list(selected_keys))).tolist())
+            ordered_keys = self._keys[self._order]
+            if top_key is not None:
+                found = np.flatnonzero(ordered_keys == top_key)
+                if len(found): self._offset = int(found[0])
+            if cursor_key is not None:
+                found = np.flatnonzero(ordered_keys == cursor_key)
+                if len(found): self._cursor = self._anchor = int(found[0])
+        self._render()
+
+    @property
+    def row_count(self):
+        return len(self._order)
+
+    def selected_values(self):
+        """화면 밖으로 스크롤된 행을 포함해 선택된 모든 행의 값 목록 (표시 순서)"""
+        if not self._selected: return []
+        rows = self._order[np.isin(self._order, list(self._selected))]
+        return [tuple(self._values[row]) for row in rows]
+
+    def select_item(self, iid):
+        """화면의 iid 항목 한 행만 선택합니다. (우클릭 메뉴 등, 화면 밖의 이전 선택은 해제)"""
+        if iid not in self._slot_rows: return
+        self._selected = {self._slot_rows[iid]}
+        self._cursor = self._anchor = self._offset + self._slots.index(iid)
+        self._render()
+
+    def see(self, position):
+        """표시 순서 position의 행이 화면에 보이도록 스크롤합니다."""
+        page = self._page_size()
+        if position < self._offset:
+            self._offset = position
+        elif position >= self._offset + page:
+            self._offset = position - page + 1
+        self._render()
+
+    # ---------------------------------------------------------
+    # 렌더링
+    # ---------------------------------------------------------
+    def _page_size(self):
+        """화면에 보이는 행 수"""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, self.tree.winfo_height() // row_height)
+
+    def _render(self):
+        count = len(self._order)
+        page = self._page_size()
+        self._offset = max(0, min(self._offset, count - page))
+        rows = self._order[self._offset:self._offset + page + self.BUFFER_ROWS]
+
+        # 필요한 항목 수가 바뀐 경우에만 Tk 항목을 만들거나 지움
+        while len(self._slots) < len(rows):
+            self._slots.append(self.tree.insert("", "end"))
+            self._slot_values.append(None)
+        while len(self._slots) > len(rows):
+            iid = self._slots.pop()
+            self._slot_values.pop()
+            self._slot_rows.pop(iid, None)
+            self.tree.delete(iid)
+
+        selection = []
+        for idx, (iid, row) in enumerate(zip(self._slots, rows)):
+            row = int(row)
+            values = self._display(row)
+            if self._slot_values[idx] != values:
+                self.tree.item(iid, values=values)
+                self._slot_values[idx] = values
+            self._slot_rows[iid] = row
+            if row in self._selected:
+                selection.append(iid)
+        # 바뀐 항목만 Tk에 반영
+        if tuple(selection) != self.tree.selection():
+            self.tree.selection_set(selection)
+
+        # 보조 항목(버퍼)이 있어도 Treeview 자체는 항상 맨 위를 표시
+        self.tree.yview_moveto(0)
+        if count:
+            self.scrollbar.set(self._offset / count, min(1.0, (self._offset + page) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _display(self, row):
+        values = list(self._values[row])
+        for i, func in self._formats:
+            values[i] = func(values[i])
+        return tuple(values)
+
+    # ---------------------------------------------------------
+    # 이벤트
+    # ---------------------------------------------------------
+    def _on_click(self, event):
+        """클릭 위치와 수정키를 기록합니다. (Tk가 선택을 바꾸기 전에 호출됨)"""
+        iid = self.tree.identify_row(event.y)
+        if iid not in self._slot_rows:
+            self._click = None
+            return
+        position = self._offset + self._slots.index(iid)
+        self._click = (position, bool(event.state & 0x0004), bool(event.state & 0x0001))
+
+    def _on_select(self, event=None):
+        click, self._click = self._click, None
+        shown = {self._slot_rows[iid] for iid in self.tree.selection() if iid in self._slot_rows}
+        if click is None or click[1] and not click[2]:
+            # Ctrl 클릭/화면 갱신: 보이는 구간만 Tk 선택으로 바꾸고 화면 밖 선택은 유지
+            self._selected -= set(self._slot_rows.values())
+            self._selected.update(shown)
+        elif click[2] and self._anchor is not None:
+            # Shift 클릭: 기준 위치부터 클릭한 행까지 (화면에 없는 행 포함)
+            low, high = sorted((self._anchor, click[0]))
+            rows = set(self._order[low:high + 1].tolist())
+            self._selected = self._selected | rows if click[1] else rows
+        else:
+            self._selected = shown
+        if click is not None and not (click[2] and self._anchor is not None):
+            self._anchor = click[0]
+
+        focus = self.tree.focus()
+        if focus in self._slots:
+            self._cursor = self._offset + self._slots.index(focus)
+        if click is not None and click[2]:
+            self._render() # 범위 중 화면에 보이는 행을 Tk 선택에 반영
+
+    def _scroll_by(self, rows):
+        self._offset += rows
+        self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self._order))
+            self._render()
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._page_size() if args[2] == "pages" else 1)
+            self._scroll_by(step)
+
+    def _on_key(self, step):
+        count = len(self._order)
+        if not count: return "break"
+        page = self._page_size()
+        cursor = self._offset if self._cursor is None else self._cursor
+        if step == "home": cursor = 0
+        elif step == "end": cursor = count - 1
+        elif step == "page": cursor += page
+        elif step == "-page": cursor -= page
+        else: cursor += step
+        cursor = max(0, min(cursor, count - 1))
+
+        self._cursor = self._anchor = cursor
+        self._selected = {int(self._order[cursor])}
+        self.see(cursor)
+        self.tree.event_generate("<<TreeviewSelect>>")
+        return "break"
@@ -0,0 +1,194 @@
+import os
+import time
+import threading
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+from src.config import Config
+
+
+def _norm(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+if WATCHDOG_AVAILABLE:
+    class _EventHandler(FileSystemEventHandler):
+        def __init__(self, watcher):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            for path in (getattr(event, "src_path", None), getattr(event, "dest_path", None)):
+                if path:
+                    self.watcher.notify(path)
+
+
+class FileWatcher:
+    """
+    데이터 파일(SalesList, OrderList, 생산 요청) 변경 감시.
+    watchdog(선택 설치)이 있으면 OS 파일 이벤트(inotify / ReadDirectoryChangesW)를 사용하고,
+    네트워크 드라이브처럼 이벤트가 오지 않는 경우를 대비해 폴링을 함께 수행합니다.
+    폴링 간격은 변경이 없을수록 늘어나고(최대 max_interval), 변경이 감지되면 다시 줄어듭니다.
+    연속된 쓰기는 debounce 초 동안 조용해질 때까지 모아서 on_change(paths)를 한 번만 호출합니다.
+    on_change는 감시 스레드에서 호출되므로 UI를 직접 건드리면 안 됩니다.
+    """
+
+    def __init__(self, get_paths, on_change,
+                 debounce=Config.FILE_WATCH_DEBOUNCE,
+                 min_interval=Config.FILE_WATCH_MIN_INTERVAL,
+                 max_interval=Config.FILE_WATCH_MAX_INTERVAL):
+        self.get_paths = get_paths
+        self.on_change = on_change
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._observer = None
+        self._observed_dirs = set()
+
+        self._signatures = {}    # 정규화 경로 -> (mtime, size)
+        self._pending = {}       # 정규화 경로 -> 원래 경로
+        self._last_event = 0.0
+
+    # ---------------------------------------------------------
+    # 시작 / 종료
+    # ---------------------------------------------------------
+    def start(self):
+        if self._thread is not None: return
+        self._stopped.clear()
+        for path in self._paths().values():
+            self._signatures[_norm(path)] = self._signature(path)
+        self._sync_observer()
+        self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2)
+            except Exception: pass
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    @property
+    def uses_events(self):
+        return self._observer is not None
+
+    # ---------------------------------------------------------
+    # 내부 구현
+    # ---------------------------------------------------------
+    def _paths(self):
+        try:
+            return {_norm(p): p for p in self.get_paths() if p}
+        except Exception as e:
+            print(f"감시 경로 조회 실패: {e}")
+            return {}
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime, stat.st_size)
+        except OSError:
+            return None
+
+    def _sync_observer(self):
+        """감시 경로가 바뀌었으면 watchdog 감시 폴더를 다시 등록합니다."""
+        if not WATCHDOG_AVAILABLE: return
+        dirs = {os.path.dirname(p) for p in self._paths()}
+        dirs = {d for d in dirs if os.path.isdir(d)}
+        if dirs == self._observed_dirs and self._observer is not None: return
+
+        try:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            self._observer.unschedule_all()
+            handler = _EventHandler(self)
+            for d in dirs:
+                self._observer.schedule(handler, d, recursive=False)
+            self._observed_dirs = dirs
+        except Exception as e:
+            # 이벤트 감시가 불가능한 경로는 폴링만 사용
+            print(f"파일 이벤트 감시 등록 실패 (폴링 사용): {e}")
+            self._observed_dirs = set()
+
+    def notify(self, path):
+        """watchdog 이벤트 수신 (감시 대상 파일만 처리)"""
+        key = _norm(path)
+        paths = self._paths()
+        if key not in paths: return
+        with self._lock:
+            self._pending[key] = paths[key]
+            self._last_event = time.monotonic()
+        self._wakeup.set()
+
+    def _poll(self):
+        """mtime/size를 비교하여 변경된 파일을 대기 목록에 추가합니다."""
+        found = False
+        paths = self._paths()
+        for key, path in paths.items():
+            sig = self._signature(path)
+            if key not in self._signatures:
+                # 설정 변경으로 새로 추가된 경로는 기준값만 기록
+                self._signatures[key] = sig
+                continue
+            if sig != self._signatures[key]:
+                self._signatures[key] = sig
+                with self._lock:
+                    self._pending[key] = path
+                    self._last_event = time.monotonic()
+                found = True
+        for key in list(self._signatures):
+            if key not in paths:
+                del self._signatures[key]
+        return found
+
+    def _run(self):
+        interval = self.min_interval
+        next_poll = time.monotonic() + interval
+
+        while not self._stopped.is_set():
+            with self._lock:
+                has_pending = bool(self._pending)
+            timeout = self.debounce if has_pending else max(0.0, next_poll - time.monotonic())
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            if self._stopped.is_set(): break
+
+            now = time.monotonic()
+            if has_pending or now >= next_poll:
+                self._sync_observer()
+                if self._poll():
+                    interval = self.min_interval
+                elif not has_pending:
+                    interval = min(interval * 2, self.max_interval)
+                # 이벤트 감시 중에는 폴링을 안전장치로만 사용
+                next_poll = now + (self.max_interval if self.uses_events else interval)
+
+            with self._lock:
+                ready = self._pending and time.monotonic() - self._last_event >= self.debounce
+                changed = list(self._pending.values()) if ready else []
+                if ready: self._pending.clear()
+
+            if changed:
+                interval = self.min_interval
+                try:
+                    self.on_change(changed)
+                except Exception as e:
+                    print(f"파일 변경 처리 실패: {e}")
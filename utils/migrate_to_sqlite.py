@@ -0,0 +1,54 @@
+import os
+import sys
+import argparse
+
+# 프로젝트 루트 경로 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from src.config import Config
+from managers.data_manager import DataManager
+
+def migrate(sales_path, purchase_path, db_path, switch_config=False):
+    """SalesList/OrderList 통합문서를 SQLite DB로 옮깁니다."""
+    print(f"🔄 [마이그레이션] {sales_path} (+ {purchase_path}) -> {db_path}")
+
+    if os.path.exists(db_path):
+        print(f"❌ 대상 DB가 이미 존재합니다: {db_path}")
+        print("기존 DB를 덮어쓰지 않으려면 다른 경로를 지정하세요.")
+        return False
+
+    dm = DataManager()
+    dm.storage_engine = "sqlite"
+    dm.sqlite_path = db_path
+
+    success, msg = dm.file_handler.import_workbooks(sales_path, purchase_path)
+    if not success:
+        print(f"❌ 마이그레이션 실패: {msg}")
+        return False
+    print(f"✅ {msg}")
+
+    success, msg = dm.load_data()
+    if not success:
+        print(f"❌ 검증 로드 실패: {msg}")
+        return False
+    print(f"✅ 검증: Data {len(dm.df_data)}행 / Clients {len(dm.df_clients)}행 / Purchase {len(dm.df_purchase)}행")
+
+    if switch_config:
+        dm.save_config(new_storage_engine="sqlite", new_sqlite_path=db_path)
+        print(f"✅ {Config.CONFIG_FILENAME}의 저장소 엔진을 sqlite로 변경했습니다.")
+
+    print("\n🎉 마이그레이션 완료!")
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SalesList.xlsx / OrderList.xlsx -> SQLite 마이그레이션")
+    parser.add_argument("--sales", default=Config.DEFAULT_EXCEL_PATH, help="판매 데이터 엑셀 (SalesList.xlsx)")
+    parser.add_argument("--purchase", default=Config.DEFAULT_PURCHASE_DATA_PATH, help="구매 데이터 엑셀 (OrderList.xlsx)")
+    parser.add_argument("--db", default=Config.DEFAULT_SQLITE_PATH, help="생성할 SQLite DB 경로")
+    parser.add_argument("--switch", action="store_true", help="완료 후 config.json의 저장소 엔진을 sqlite로 변경")
+    args = parser.parse_args()
+
+    ok = migrate(args.sales, args.purchase, args.db, args.switch)
+    sys.exit(0 if ok else 1)
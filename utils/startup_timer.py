@@ -0,0 +1,26 @@
+import time
+
+
+class StartupTimer:
+    """
+    프로그램 시작 단계별 소요 시간 측정.
+    mark(name)는 직전 단계 이후 걸린 시간을 기록하고, report()는 단계별/누적 시간을 문자열로 반환합니다.
+    """
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self._last = self.started
+        self.steps = []  # [(단계명, 소요 초)]
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.steps.append((name, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.started
+
+    def report(self):
+        lines = [f"  {name:<12} {seconds * 1000:8.1f} ms" for name, seconds in self.steps]
+        return "\n".join(["[시작 시간]"] + lines + [f"  {'합계':<12} {self.total * 1000:8.1f} ms"])